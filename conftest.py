@@ -11,3 +11,21 @@ running the module doctests alone failed intermittently with a Tk error.
 import matplotlib
 
 matplotlib.use("Agg")
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def session_dataset_cache(tmp_path_factory):
+    """
+    Keep test and doctest loads out of the real dataset cache.
+
+    Here rather than in ``tests/conftest.py`` so that the module doctests, which
+    load datasets too, are covered. Session fixtures are also set up before any
+    function-scoped one, so this is what covers them as well.
+    """
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv(
+            "SHEDDING_HUB_CACHE_DIR", str(tmp_path_factory.mktemp("session-cache"))
+        )
+        yield
@@ -32,7 +32,7 @@ REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT))
 
 from shedding_hub import (  # noqa: E402
-    load_dataset,
+    load_datasets,
     load_shedding_catalog,
     plot_analyte_observations,
     plot_fit_diagnostic,
@@ -91,8 +91,10 @@ def main() -> int:
     n_fit = n_obs = 0
     failures: list[tuple[str, str, str]] = []
 
-    for dataset_id in dataset_ids:
-        dataset = load_dataset(dataset_id, local=str(data_dir))
+    loaded = load_datasets(dataset_ids, local=str(data_dir))
+    for dataset_id, dataset in zip(dataset_ids, loaded):
+        if isinstance(dataset, Exception):
+            raise SystemExit(f"could not load {dataset_id}: {dataset}")
         target = output / dataset_id
         target.mkdir(parents=True, exist_ok=True)
         entries = []
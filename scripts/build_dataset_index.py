@@ -0,0 +1,51 @@
+"""
+Regenerate data/index.json, the manifest of every dataset in data/.
+
+Run via `make index` whenever a dataset is added or changed; only datasets whose
+file changed since the index was written are read. With --check nothing is
+written, and the exit status says whether the index is fresh, which is how CI
+keeps a data change from landing without it.
+"""
+
+import argparse
+import pathlib
+import sys
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from shedding_hub import check_dataset_index, write_dataset_index  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--data", default=str(REPO_ROOT / "data"), help="Directory of datasets."
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Report stale entries and exit 1 if there are any, writing nothing.",
+    )
+    args = parser.parse_args()
+
+    stale = check_dataset_index(args.data)
+    if args.check:
+        if stale:
+            print(f"dataset index is stale for {len(stale)} dataset(s):")
+            for dataset_id in stale:
+                print(f"  {dataset_id}")
+            print("run `make index` and commit data/index.json")
+            return 1
+        print("dataset index is fresh")
+        return 0
+
+    path = write_dataset_index(args.data)
+    print(
+        f"wrote {path}, refreshing {len(stale)} entr{'y' if len(stale) == 1 else 'ies'}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,6 +3,8 @@ Regenerate the precomputed shedding-model catalog shipped with the package.
 
 Run via `make catalog`. Fitting every analyte of every dataset takes a while,
 which is exactly why the result is precomputed rather than fitted on demand.
+A rebuild over an existing --output refits only what changed since it was
+written; pass --full to refit everything.
 """
 
 import argparse
@@ -15,13 +17,20 @@ import yaml
 REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT))
 
-from shedding_hub import load_dataset  # noqa: E402
+from shedding_hub import load_all_datasets  # noqa: E402
 from shedding_hub.shedding_catalog import (  # noqa: E402
     CATALOG_PATH,
-    fit_shedding_models,
+    fit_shedding_models_by_gate,
+    load_shedding_catalog,
+    write_binary_catalog,
+    write_subject_params,
 )
 from shedding_hub.shedding_models import MODELS  # noqa: E402
 
+# Removed after a build once it holds nothing; a --checkpoint-dir given
+# explicitly is left where it is, with any shards other builds put there.
+DEFAULT_CHECKPOINT_DIR = REPO_ROOT / ".catalog-checkpoint"
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -75,53 +84,179 @@ def main() -> int:
             "Write a stricter catalog elsewhere with --output to compare."
         ),
     )
+    parser.add_argument(
+        "--time-budget-seconds",
+        type=float,
+        default=None,
+        help=(
+            "Wall-clock allowance per fit. A fit that runs out is published "
+            "with converged=False and stop_reason 'time_budget' rather than "
+            "holding up the build. Unlimited by default."
+        ),
+    )
+    parser.add_argument(
+        "--max-evaluations",
+        type=int,
+        default=None,
+        help="Likelihood-evaluation allowance per fit. Unlimited by default.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Worker processes to fit in; -1 uses one per core. The catalog "
+            "written is identical whatever the count."
+        ),
+    )
+    parser.add_argument(
+        "--gate",
+        nargs=2,
+        action="append",
+        default=[],
+        metavar=("GATE", "OUTPUT"),
+        help=(
+            "Also write the catalog under --max-peak-above-observed GATE to "
+            "OUTPUT. Repeatable. Every catalog comes from the same optimization "
+            "pass, so each extra gate costs a summary rather than a rebuild."
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        default=str(DEFAULT_CHECKPOINT_DIR),
+        help=(
+            "Where each finished fit is checkpointed while the build runs. The "
+            "shards this build wrote are deleted once every catalog is written; "
+            "any others are left for the builds that share the directory."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Take every job already checkpointed in --checkpoint-dir -- by an "
+            "interrupted run, or by builds on other machines -- instead of "
+            "fitting it again."
+        ),
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help=(
+            "Refit every analyte instead of reusing the fits in the existing "
+            "outputs whose dataset, analyte spec, options and fitter version "
+            "are unchanged."
+        ),
+    )
     args = parser.parse_args()
 
+    # Every catalog this run writes, keyed by its over-extrapolation gate. One
+    # optimization pass serves them all; only the summaries differ.
+    outputs = {args.max_peak_above_observed: pathlib.Path(args.output)}
+    for gate, path in args.gate:
+        try:
+            gate = float(gate)
+        except ValueError:
+            parser.error(f"--gate needs a number, got {gate!r}")
+        if gate in outputs:
+            parser.error(f"gate {gate} is requested twice")
+        outputs[gate] = pathlib.Path(path)
+
     # The shipped catalog is concentration-only by contract: ensembles average
     # its heights, and cycles below CT_REFERENCE are not log10 concentrations.
     # Writing a ct build over it would put incommensurable rows in the file the
     # package loads by default, so it is refused rather than warned about.
-    if (
-        "ct" in args.value_types
-        and pathlib.Path(args.output).resolve() == CATALOG_PATH.resolve()
+    if "ct" in args.value_types and any(
+        path.resolve() == CATALOG_PATH.resolve() for path in outputs.values()
     ):
         parser.error(
             "refusing to write cycle-threshold fits into the shipped catalog; "
             "pass --output shedding_catalog_ct.yaml (or another path) instead"
         )
 
-    data_dir = pathlib.Path(args.data)
-    dataset_ids = sorted(
-        path.name
-        for path in data_dir.iterdir()
-        if path.is_dir() and not path.name.startswith(".")
-    )
+    # Folders still being extracted, without their dataset YAML yet, are
+    # skipped. Each file is parsed only when it changed since the last build.
+    datasets = list(load_all_datasets(args.data).values())
+    print(f"loaded {len(datasets)} dataset(s)", flush=True)
 
-    datasets = []
-    for dataset_id in dataset_ids:
-        print(f"loading {dataset_id}", flush=True)
-        datasets.append(load_dataset(dataset_id, local=str(data_dir)))
+    # With their per-subject tables where the sidecar has them, so that fits
+    # reused unchanged keep their tables in the sidecar written below.
+    previous = {
+        gate: load_shedding_catalog(
+            str(path), subjects=path.with_suffix(".subjects.npz").is_file()
+        )
+        for gate, path in outputs.items()
+        if path.is_file() and not args.full
+    }
 
     print(f"fitting {len(datasets)} dataset(s)", flush=True)
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", UserWarning)
-        catalog = fit_shedding_models(
+        catalogs = fit_shedding_models_by_gate(
             datasets,
+            gates=tuple(outputs),
             models=tuple(args.models),
             min_time=args.min_time,
-            max_peak_above_observed=args.max_peak_above_observed,
             value_types=tuple(args.value_types),
+            time_budget_seconds=args.time_budget_seconds,
+            max_evaluations=args.max_evaluations,
+            n_jobs=args.jobs,
+            previous=previous,
+            checkpoint_dir=args.checkpoint_dir,
+            resume=args.resume,
         )
 
-    output = pathlib.Path(args.output)
-    output.parent.mkdir(parents=True, exist_ok=True)
-    with output.open("w", encoding="utf-8") as stream:
-        yaml.safe_dump(catalog.to_dict(), stream, sort_keys=False)
+    for gate, catalog in catalogs.items():
+        output = outputs[gate]
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with output.open("w", encoding="utf-8") as stream:
+            # Without wall-clock timings the file depends only on the data and
+            # the options, so a rebuild that changes nothing leaves no diff.
+            yaml.safe_dump(catalog.to_dict(timings=False), stream, sort_keys=False)
+        # The binary twin load_shedding_catalog prefers while it matches the
+        # YAML just written.
+        binary = output.with_suffix(".npz")
+        write_binary_catalog(catalog, binary, source=output)
+        subjects = output.with_suffix(".subjects.npz")
+        write_subject_params(catalog, subjects)
 
-    print(f"wrote {len(catalog.fits)} fit(s) to {output}")
-    print(f"skipped {len(catalog.skipped)} analyte/model combination(s)")
-    if not catalog.skipped.empty:
-        print(catalog.skipped["reason"].value_counts().to_string())
+        print(
+            f"wrote {len(catalog.fits)} fit(s) to {output}, {binary.name} "
+            f"and {subjects.name}"
+        )
+        print(f"skipped {len(catalog.skipped)} analyte/model combination(s)")
+        if not catalog.skipped.empty:
+            print(catalog.skipped["reason"].value_counts().to_string())
+        budgeted = [
+            fit
+            for fit in catalog.fits
+            if fit.stop_reason in ("time_budget", "evaluation_budget")
+        ]
+        if budgeted:
+            print(f"{len(budgeted)} fit(s) stopped by their budget before converging")
+        report = catalog.build_report
+        print(
+            f"reused {len(report.reused)}, resumed {len(report.resumed)}, "
+            f"refitted {len(report.jobs)}, removed {len(report.removed)} fit(s)"
+        )
+        for dataset_id, analyte, model in report.removed:
+            print(f"  removed {dataset_id} / {analyte} / {model}")
+    print(
+        f"fitted across {report.n_workers} process(es), {report.schedule}: "
+        f"{report.actual_makespan:.1f}s against {report.predicted_makespan:.1f}s "
+        f"predicted and a {report.lower_bound:.1f}s lower bound"
+    )
+    # Every outcome is in the catalogs now; this build's shards only matter to
+    # a build that did not get this far. Shards from other builds are theirs.
+    for shard in report.checkpointed:
+        shard.unlink(missing_ok=True)
+    checkpoint_dir = pathlib.Path(args.checkpoint_dir)
+    if checkpoint_dir.resolve() == DEFAULT_CHECKPOINT_DIR.resolve():
+        try:
+            checkpoint_dir.rmdir()
+        except OSError:
+            # Not empty, or already gone.
+            pass
     return 0
 
 
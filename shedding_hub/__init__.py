@@ -1,4 +1,18 @@
-from .util import check_dataset, folded_str, literal_str, load_dataset, normalize_str
+from .util import (
+    check_dataset,
+    check_dataset_index,
+    clear_dataset_cache,
+    find_datasets,
+    folded_str,
+    literal_str,
+    load_all_datasets,
+    load_dataset,
+    load_dataset_index,
+    load_datasets,
+    normalize_str,
+    stream_dataset,
+    write_dataset_index,
+)
 from .shedding_duration import (
     calc_shedding_duration,
     calc_shedding_durations,
@@ -13,6 +27,13 @@ from .shedding_peak import (
     plot_shedding_peaks,
 )
 
+from .measurements import (
+    MeasurementTable,
+    clear_measurement_table_cache,
+    load_streamed_dataset,
+    to_measurement_table,
+)
+
 from .viz import (
     plot_time_course,
     plot_time_courses,
@@ -44,13 +65,20 @@ from .shedding_fit import (
     VALUE_TYPE_INVARIANT_PARAMETERS,
     SheddingDataError,
     SheddingFit,
+    SheddingSolution,
     fit_shedding_model,
+    solve_shedding_model,
+    summarize_shedding_solution,
 )
 
 from .shedding_catalog import (
     SheddingCatalog,
+    clear_catalog_cache,
     fit_shedding_models,
+    fit_shedding_models_by_gate,
     load_shedding_catalog,
+    write_binary_catalog,
+    write_subject_params,
 )
 
 from .shedding_ensemble import SheddingEnsemble, make_ensemble
@@ -60,6 +88,7 @@ from .shedding_select import (
     Selection,
     classify_reference_event,
     shedding_for,
+    shedding_for_many,
     shedding_options,
 )
 
@@ -70,6 +99,14 @@ __all__ = [
     "folded_str",
     "literal_str",
     "load_dataset",
+    "load_all_datasets",
+    "load_datasets",
+    "clear_dataset_cache",
+    "stream_dataset",
+    "load_dataset_index",
+    "find_datasets",
+    "check_dataset_index",
+    "write_dataset_index",
     "normalize_str",
     "calc_shedding_duration",
     "calc_shedding_durations",
@@ -79,6 +116,10 @@ __all__ = [
     "calc_shedding_peaks",
     "plot_shedding_peak",
     "plot_shedding_peaks",
+    "MeasurementTable",
+    "to_measurement_table",
+    "clear_measurement_table_cache",
+    "load_streamed_dataset",
     "plot_time_course",
     "plot_time_courses",
     "plot_shedding_heatmap",
@@ -101,16 +142,24 @@ __all__ = [
     "VALUE_TYPE_INVARIANT_PARAMETERS",
     "SheddingDataError",
     "SheddingFit",
+    "SheddingSolution",
     "SheddingCatalog",
     "SheddingEnsemble",
     "fit_shedding_model",
+    "solve_shedding_model",
+    "summarize_shedding_solution",
     "fit_shedding_models",
+    "fit_shedding_models_by_gate",
     "load_shedding_catalog",
+    "clear_catalog_cache",
+    "write_binary_catalog",
+    "write_subject_params",
     "make_ensemble",
     "REFERENCE_EVENT_CLASSES",
     "Selection",
     "classify_reference_event",
     "shedding_for",
+    "shedding_for_many",
     "shedding_options",
     "simulate_shedding",
     "plot_simulated_shedding",
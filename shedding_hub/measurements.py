@@ -0,0 +1,439 @@
+"""
+Columnar view of the measurements in a Shedding Hub dataset.
+
+Every analysis function starts from the same nested structure -- participants,
+each holding a list of measurement dictionaries -- and used to flatten it into a
+fresh DataFrame of Python objects, coerce times and values, and join analyte
+metadata through a per-row lambda. A summary, a plot and a duration table of one
+dataset repeated that work three times. ``to_measurement_table`` does it once
+per dataset object and hands out typed arrays instead.
+"""
+
+import operator
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+from .util import stream_dataset
+
+NEGATIVE_VALUE = "negative"
+
+# Metadata joined onto every measurement, in the order the frame lists them.
+ANALYTE_COLUMNS = (
+    "specimen",
+    "biomarker",
+    "unit",
+    "reference_event",
+    "limit_of_detection",
+)
+
+# Tables are memoized per dataset object. Datasets are plain dictionaries, which
+# cannot be weakly referenced, so the cache holds the dataset itself -- that keeps
+# its id from being reused by a different object -- and is bounded so it cannot
+# pin an unbounded number of them in memory. A table is reused while its dataset
+# still holds the same participants and analytes, and each participant the same
+# measurements list at the same length: one check per participant, never one
+# per measurement.
+_TABLE_CACHE_SIZE = 32
+_TABLE_CACHE: "OrderedDict[int, tuple]" = OrderedDict()
+_TABLE_CACHE_LOCK = threading.Lock()
+
+# How many measurements are held as Python objects before being coerced into
+# typed arrays while a table is built.
+_CHUNK_SIZE = 2**16
+
+
+@dataclass(eq=False)
+class MeasurementTable:
+    """
+    Every measurement of one dataset as aligned, read-only arrays.
+
+    Row ``i`` is one measurement, in the order the dataset lists them:
+    participant by participant, then measurement by measurement. Under the
+    dataset schema a time is a number or ``unknown`` and a value is a number,
+    ``negative`` or ``positive``, so the typed columns lose nothing: ``time`` is
+    NaN exactly where the time was unknown, ``censored`` marks ``negative``
+    readings, and ``value`` is NaN for censored and unquantified positive ones.
+
+    Attributes:
+        dataset_id: Identifier of the dataset the table was built from.
+        participant: Zero-based index into ``dataset["participants"]``.
+        analyte_code: Index into ``analytes``; -1 where no analyte was given.
+        time: Measurement time in days, NaN where unknown.
+        value: Numeric measurement value, NaN where not a number.
+        censored: True where the measurement was ``negative``.
+        analytes: Analyte names the codes refer to: the dataset's analytes in
+            declaration order, followed by any referenced without being declared.
+        analyte_metadata: One row per entry of ``analytes`` with the columns in
+            ``ANALYTE_COLUMNS``. Specimen lists are joined with ``+`` and limits
+            of detection are floats, NaN where missing or ``unknown``.
+
+    Examples:
+        >>> import shedding_hub as sh
+        >>> data = sh.load_dataset('woelfel2020virological', local='./data')
+        >>> table = sh.to_measurement_table(data)
+        >>> table.analytes
+        ('stool', 'sputum', 'oropharyngeal_swab')
+        >>> int(table.participant.max()) + 1
+        9
+    """
+
+    dataset_id: Any
+    participant: np.ndarray
+    analyte_code: np.ndarray
+    time: np.ndarray
+    value: np.ndarray
+    censored: np.ndarray
+    analytes: tuple
+    analyte_metadata: pd.DataFrame
+    _frame: pd.DataFrame | None = field(default=None, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return int(self.time.size)
+
+    @property
+    def positive(self) -> np.ndarray:
+        """True where the measurement was not ``negative``."""
+        return ~self.censored
+
+    @property
+    def analyte(self) -> np.ndarray:
+        """Analyte name of each measurement, as an object array."""
+        names = np.array(list(self.analytes) + [None], dtype=object)
+        return names[self.analyte_code]
+
+    def metadata(self, column: str) -> np.ndarray:
+        """
+        One column of analyte metadata joined onto every measurement.
+
+        Args:
+            column: One of ``ANALYTE_COLUMNS``.
+
+        Returns:
+            Array aligned with the measurements; None (NaN for limits of
+            detection) where the analyte has no metadata.
+        """
+        if column not in ANALYTE_COLUMNS:
+            raise ValueError(
+                f"Unknown analyte metadata column '{column}'. "
+                f"Must be one of {list(ANALYTE_COLUMNS)}."
+            )
+        missing = np.nan if column == "limit_of_detection" else None
+        values = self.analyte_metadata[column].to_numpy(dtype=object)
+        return np.append(values, missing)[self.analyte_code]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        The table as a DataFrame in the vocabulary of the analysis functions.
+
+        Columns are ``participant_id`` (one-based), ``analyte``, ``time_num``,
+        ``value_num``, ``is_positive`` and the analyte metadata columns. The
+        frame is built once per table; each call returns a copy the caller may
+        modify freely.
+
+        Examples:
+            >>> import shedding_hub as sh
+            >>> data = sh.load_dataset('woelfel2020virological', local='./data')
+            >>> frame = sh.to_measurement_table(data).to_frame()
+            >>> list(frame.columns)  # doctest: +NORMALIZE_WHITESPACE
+            ['participant_id', 'analyte', 'time_num', 'value_num', 'is_positive',
+             'specimen', 'biomarker', 'unit', 'reference_event', 'limit_of_detection']
+        """
+        if self._frame is None:
+            columns = {
+                "participant_id": self.participant + 1,
+                "analyte": self.analyte,
+                "time_num": self.time,
+                "value_num": self.value,
+                "is_positive": self.positive,
+            }
+            for column in ANALYTE_COLUMNS:
+                columns[column] = self.metadata(column)
+            frame = pd.DataFrame(columns)
+            frame["limit_of_detection"] = frame["limit_of_detection"].astype(float)
+            self._frame = frame
+        return self._frame.copy()
+
+
+def _analyte_metadata(info: Dict[str, Any]) -> dict:
+    specimen = info.get("specimen")
+    if isinstance(specimen, list):
+        specimen = "+".join(specimen)
+    lod = info.get("limit_of_detection")
+    try:
+        lod = float(lod) if lod is not None and lod != "unknown" else np.nan
+    except (TypeError, ValueError):
+        lod = np.nan
+    return {
+        "specimen": specimen,
+        "biomarker": info.get("biomarker"),
+        "unit": info.get("unit"),
+        "reference_event": info.get("reference_event"),
+        "limit_of_detection": lod,
+    }
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+class _TableBuilder:
+    """
+    Accumulates measurements participant by participant into typed columns.
+
+    Raw times and values are held only until ``_CHUNK_SIZE`` of them have
+    arrived, then coerced into arrays, so building from a stream keeps memory in
+    step with the arrays being built rather than with the measurements read.
+    """
+
+    def __init__(self):
+        self._names: list = []
+        self._codes_by_name: dict = {}
+        self._pending: tuple = ([], [], [], [])
+        self._chunks: list = []
+
+    def add(self, index: int, measurements: list) -> None:
+        participant, codes, times, values = self._pending
+        for measurement in measurements:
+            name = measurement.get("analyte")
+            code = self._codes_by_name.get(name, -1)
+            if code < 0 and name is not None:
+                code = self._codes_by_name[name] = len(self._names)
+                self._names.append(name)
+            participant.append(index)
+            codes.append(code)
+            times.append(measurement.get("time"))
+            values.append(measurement.get("value"))
+        if len(participant) >= _CHUNK_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        participant, codes, times, values = self._pending
+        time = pd.to_numeric(pd.Series(times, dtype=object), errors="coerce")
+        value = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce")
+        censored = np.fromiter(
+            (item == NEGATIVE_VALUE for item in values), dtype=bool, count=len(values)
+        )
+        self._chunks.append(
+            (
+                np.asarray(participant, dtype=np.intp),
+                np.asarray(codes, dtype=np.intp),
+                time.to_numpy(dtype=float),
+                value.to_numpy(dtype=float),
+                censored,
+            )
+        )
+        self._pending = ([], [], [], [])
+
+    def finish(self, dataset_id: Any, declared: Dict[str, Any]) -> MeasurementTable:
+        if self._pending[0] or not self._chunks:
+            self._flush()
+        # Analytes were coded as they were met; the table lists the declared
+        # ones first, in declaration order, whenever the declaration was read.
+        analytes = list(declared)
+        analytes += [name for name in self._names if name not in declared]
+        position = {name: code for code, name in enumerate(analytes)}
+        recode = np.array([position[name] for name in self._names] + [-1], np.intp)
+
+        participant, codes, time, value, censored = (
+            np.concatenate(column) if len(self._chunks) > 1 else column[0]
+            for column in zip(*self._chunks)
+        )
+        self._chunks = []
+        # Object columns keep missing metadata as None, as the dataset spells it.
+        metadata = pd.DataFrame(
+            [_analyte_metadata(declared.get(name) or {}) for name in analytes],
+            columns=list(ANALYTE_COLUMNS),
+            dtype=object,
+        )
+        metadata["limit_of_detection"] = metadata["limit_of_detection"].astype(float)
+        return MeasurementTable(
+            dataset_id=dataset_id,
+            participant=_read_only(participant),
+            analyte_code=_read_only(recode[codes]),
+            time=_read_only(time),
+            value=_read_only(value),
+            censored=_read_only(censored),
+            analytes=tuple(analytes),
+            analyte_metadata=metadata,
+        )
+
+
+def _build_table(dataset: Dict[str, Any]) -> MeasurementTable:
+    builder = _TableBuilder()
+    for index, item in enumerate(dataset.get("participants") or []):
+        builder.add(index, item.get("measurements", []))
+    return builder.finish(dataset.get("dataset_id"), dataset.get("analytes") or {})
+
+
+def _signature(dataset: Dict[str, Any]) -> tuple:
+    """
+    What a memoized table is checked against.
+
+    The participants and analytes themselves, then each participant's
+    measurements list and its length, so adding or removing a measurement
+    anywhere changes it.
+    """
+    participants = dataset.get("participants")
+    lists = tuple(item.get("measurements") for item in participants or ())
+    return (
+        participants,
+        dataset.get("analytes"),
+        lists,
+        tuple(len(measurements or ()) for measurements in lists),
+    )
+
+
+def _is_current(entry: tuple, dataset: Dict[str, Any]) -> bool:
+    held, (participants, analytes, lists, lengths), _ = entry
+    current = _signature(dataset)
+    return (
+        held is dataset
+        and participants is current[0]
+        and analytes is current[1]
+        and len(lists) == len(current[2])
+        and all(map(operator.is_, lists, current[2]))
+        and lengths == current[3]
+    )
+
+
+def to_measurement_table(dataset: Dict[str, Any]) -> MeasurementTable:
+    """
+    Build the columnar measurement table of a dataset, once per dataset object.
+
+    Repeated calls with the same dataset object return the same table, so every
+    summary, plot and fit of a dataset shares one flattening pass. Replacing
+    the dataset's ``participants`` or ``analytes``, or adding or removing a
+    participant or a measurement, makes the next call build it again. Editing
+    a measurement's time or value in place is not detected, since checking
+    every measurement would cost about as much as rebuilding: call
+    ``clear_measurement_table_cache(dataset)`` after such an edit. A dataset from
+    ``load_streamed_dataset`` returns the table built as it was read.
+
+    Args:
+        dataset: Raw dataset dictionary from load_dataset() containing 'analytes',
+            'participants', and 'dataset_id' keys.
+
+    Returns:
+        The dataset's MeasurementTable.
+
+    Raises:
+        ValueError: If dataset is not a non-empty dictionary.
+
+    Examples:
+        >>> import shedding_hub as sh
+        >>> data = sh.load_dataset('woelfel2020virological', local='./data')
+        >>> table = sh.to_measurement_table(data)
+        >>> len(table), int(table.censored.sum())
+        (382, 94)
+        >>> table is sh.to_measurement_table(data)
+        True
+    """
+    if not dataset or not isinstance(dataset, dict):
+        raise ValueError("Dataset must be a non-empty dictionary")
+    if isinstance(dataset, _StreamedDataset):
+        return dataset.measurement_table
+
+    key = id(dataset)
+    with _TABLE_CACHE_LOCK:
+        entry = _TABLE_CACHE.get(key)
+        if entry is not None and _is_current(entry, dataset):
+            _TABLE_CACHE.move_to_end(key)
+            return entry[2]
+
+    table = _build_table(dataset)
+    with _TABLE_CACHE_LOCK:
+        _TABLE_CACHE[key] = (dataset, _signature(dataset), table)
+        _TABLE_CACHE.move_to_end(key)
+        while len(_TABLE_CACHE) > _TABLE_CACHE_SIZE:
+            _TABLE_CACHE.popitem(last=False)
+    return table
+
+
+def clear_measurement_table_cache(dataset: Dict[str, Any] | None = None) -> None:
+    """
+    Forget memoized measurement tables, so the next call builds them again.
+
+    Needed only after editing a measurement's fields or an analyte's metadata
+    in place; see ``to_measurement_table``.
+
+    Args:
+        dataset: The dataset whose table to forget. Defaults to every table.
+
+    Examples:
+        >>> import shedding_hub as sh
+        >>> data = sh.load_dataset('woelfel2020virological', local='./data')
+        >>> table = sh.to_measurement_table(data)
+        >>> data['participants'][0]['measurements'][0]['value'] = 'negative'
+        >>> sh.clear_measurement_table_cache(data)
+        >>> rebuilt = sh.to_measurement_table(data)
+        >>> int(rebuilt.censored.sum()) - int(table.censored.sum())
+        1
+    """
+    with _TABLE_CACHE_LOCK:
+        if dataset is None:
+            _TABLE_CACHE.clear()
+            return
+        entry = _TABLE_CACHE.get(id(dataset))
+        if entry is not None and entry[0] is dataset:
+            del _TABLE_CACHE[id(dataset)]
+
+
+class _StreamedDataset(dict):
+    """A dataset whose measurements are held only by its measurement table."""
+
+    measurement_table: MeasurementTable
+
+
+def load_streamed_dataset(source) -> dict:
+    """
+    Load a dataset too large to hold as nested dictionaries.
+
+    The file is read through ``stream_dataset``, and each participant's
+    measurements go straight into the columnar measurement table rather than
+    into dictionaries, so memory is bounded by the table's arrays -- about 33
+    bytes a measurement -- instead of by the object tree ``load_dataset``
+    builds. The result is used as any dataset is: every summary, plot and fit
+    reads measurements through ``to_measurement_table``, which returns the
+    table built here. Participants keep every key except ``measurements``.
+
+    Args:
+        source: Path to a dataset's YAML file, or a file opened on one.
+
+    Returns:
+        The dataset, without per-participant measurement lists. A copy made
+        with ``dict(...)`` is an ordinary dataset and has no measurements.
+
+    Raises:
+        ValueError: If the file does not hold a mapping, or its participants
+            are not a list.
+
+    Examples:
+        >>> import shedding_hub as sh
+        >>> data = sh.load_streamed_dataset(
+        ...     './data/woelfel2020virological/woelfel2020virological.yaml'
+        ... )
+        >>> len(data['participants']), len(sh.to_measurement_table(data))
+        (9, 382)
+        >>> sh.calc_dataset_summary(data)['n_measurements']
+        382
+    """
+    stream = stream_dataset(source)
+    header = next(stream)
+    builder = _TableBuilder()
+    participants = []
+    for index, participant in enumerate(stream):
+        builder.add(index, participant.pop("measurements", []))
+        participants.append(participant)
+    # Built only now: keys after the participants join the header as the
+    # stream runs out.
+    dataset = _StreamedDataset(header, participants=participants)
+    dataset.measurement_table = builder.finish(
+        dataset.get("dataset_id"), dataset.get("analytes") or {}
+    )
+    return dataset
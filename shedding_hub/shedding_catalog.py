@@ -7,24 +7,51 @@ day 4.2 at 6.8 log10 gc/mL, declines with a 1.5 day half-life" rather than as ra
 log-parameters.
 """
 
+import copy
+import functools
+import hashlib
+import heapq
+import json
+import os
 import pathlib
+import tempfile
+import time
 import warnings
-from dataclasses import dataclass, field
+from collections.abc import Callable, MutableSequence, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
 
 import numpy as np
 import pandas as pd
 import yaml
 
+from .measurements import _StreamedDataset
 from .shedding_fit import (
+    FIT_PHASES,
+    FITTER_VERSION,
+    Observations,
     SheddingDataError,
     SheddingFit,
     _is_ct_unit,
-    fit_shedding_model,
+    _solve_observations,
+    prepare_observations_by_model,
     require_estimable_population,
+    summarize_shedding_solution,
 )
 from .shedding_models import MODELS, PARAM_NAMES
 
 CATALOG_PATH = pathlib.Path(__file__).parent / "data" / "shedding_catalog.yaml"
+# The same catalog in the binary format of ``write_binary_catalog``, which
+# loads without parsing YAML and builds each fit only when it is used.
+CATALOG_BINARY_PATH = CATALOG_PATH.with_suffix(".npz")
+# The per-subject tables of the catalog's fits, which the catalog itself leaves
+# out; written by ``write_subject_params`` and read only on request.
+CATALOG_SUBJECTS_PATH = CATALOG_PATH.with_suffix(".subjects.npz")
+
+# The orders a build can dispatch its fits in. "longest_first" hands the most
+# expensive fits to workers first, so the cheap ones fill in around them instead
+# of one large fit starting last and running alone.
+SCHEDULES = ("longest_first", "in_order")
 
 _KEY_COLUMNS = (
     # value_type sits beside unit, which it is derived from, and is the third
@@ -69,8 +96,22 @@ _TABLE_COLUMNS = _KEY_COLUMNS + (
     "converged",
 )
 
+# How each fit was computed rather than what it estimates, appended only on
+# request (``SheddingCatalog.to_table(telemetry=True)``): they are build
+# diagnostics, blank for every fit loaded from a catalog written before they
+# were recorded, and the default table's schema should not change with them.
+_TELEMETRY_COLUMNS = (
+    "n_evaluations",
+    "n_iterations",
+    "optimizer_rounds",
+    "stop_reason",
+    "projected_gradient_norm",
+    *(f"{phase}_seconds" for phase in FIT_PHASES),
+    "fit_seconds",
+)
+
 
-def fit_to_row(fit: SheddingFit) -> dict:
+def fit_to_row(fit: SheddingFit, *, telemetry: bool = False) -> dict:
     """
     Summarize a fit as one table row describing its median individual.
 
@@ -117,6 +158,13 @@ def fit_to_row(fit: SheddingFit) -> dict:
         Share of adequately-sampled subjects whose highest reading was not their
         first. The gamma model is refused below 50%; on an exponential row it is
         informational, and a low value is the normal case rather than a warning.
+
+    With ``telemetry=True`` the row also carries the optimizer's work: the
+    evaluation, iteration and restart-round counts, why it stopped
+    (``stop_reason``, one of ``STOP_REASONS``), the projected-gradient norm
+    at the optimum, wall time per phase of the fit as ``<phase>_seconds``, and
+    their total as ``fit_seconds``. Fits loaded from a catalog that predates
+    them read as missing (NaN), never as zero.
     """
     row = {column: getattr(fit, column) for column in _KEY_COLUMNS}
     row.update({"a_median": np.nan, "b_median": np.nan, "c_median": np.nan})
@@ -146,25 +194,62 @@ def fit_to_row(fit: SheddingFit) -> dict:
             "converged": fit.converged,
         }
     )
+    if telemetry:
+        phases = fit.phase_seconds or {}
+        row.update(
+            {
+                "n_evaluations": _or_nan(fit.n_evaluations),
+                "n_iterations": _or_nan(fit.n_iterations),
+                "optimizer_rounds": _or_nan(fit.optimizer_rounds),
+                "stop_reason": fit.stop_reason,
+                "projected_gradient_norm": fit.projected_gradient_norm,
+                **{
+                    f"{phase}_seconds": phases.get(phase, np.nan)
+                    for phase in FIT_PHASES
+                },
+                "fit_seconds": sum(phases.values()) if phases else np.nan,
+            }
+        )
     return row
 
 
-def _fits_to_frame(fits: list[SheddingFit]) -> pd.DataFrame:
+def _or_nan(value):
+    """``value``, or NaN in place of None, so a numeric column stays numeric."""
+    return np.nan if value is None else value
+
+
+def _fits_to_frame(fits: list[SheddingFit], telemetry: bool = False) -> pd.DataFrame:
+    columns = list(_TABLE_COLUMNS + (_TELEMETRY_COLUMNS if telemetry else ()))
     if not fits:
-        return pd.DataFrame(columns=list(_TABLE_COLUMNS))
-    return pd.DataFrame([fit_to_row(fit) for fit in fits]).reindex(
-        columns=list(_TABLE_COLUMNS)
+        return pd.DataFrame(columns=columns)
+    return pd.DataFrame([fit_to_row(fit, telemetry=telemetry) for fit in fits]).reindex(
+        columns=columns
     )
 
 
-def _fit_to_payload(fit: SheddingFit) -> dict:
+def _key_values(fits: Sequence, key: str) -> list:
+    """Every fit's ``key`` attribute, without building fits a lazy catalog holds."""
+    if hasattr(fits, "key_values"):
+        return fits.key_values(key)
+    return [getattr(fit, key, None) for fit in fits]
+
+
+def _is_hashable(value) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _fit_to_payload(fit: SheddingFit, *, timings: bool = True) -> dict:
     """Serialize a fit, omitting per-subject parameters to keep the file small.
 
     Delegates to ``SheddingFit.to_dict``, the single serializer for a fit, so
     the catalog's on-disk format and a fit's own persistence story never
     diverge into two implementations.
     """
-    return fit.to_dict()
+    return fit.to_dict(timings=timings)
 
 
 def _fit_from_payload(payload: dict) -> SheddingFit:
@@ -172,11 +257,133 @@ def _fit_from_payload(payload: dict) -> SheddingFit:
     return SheddingFit.from_dict(payload)
 
 
+class _FitList(list):
+    """
+    The list a catalog's ``fits`` are held in, counting its own changes.
+
+    ``version`` moves on every mutation, so a catalog can tell whether its
+    table and indexes still describe ``fits`` without comparing them fit by
+    fit on every lookup.
+    """
+
+    version = 0
+
+
+def _counting(method: Callable) -> Callable:
+    """``method`` of ``list``, moving the ``_FitList``'s version first."""
+
+    @functools.wraps(method)
+    def mutate(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    return mutate
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(_FitList, _name, _counting(getattr(list, _name)))
+del _name
+
+
+class _DeferredFits(MutableSequence):
+    """
+    Fits built one at a time on first access, and editable as a list is.
+
+    Each position holds either its built fit or the source row ``_build``
+    makes it from. A fit written in is stored as given and never built, and
+    ``version`` moves on every write, as a ``_FitList``'s does, so the
+    catalog's table and indexes follow the edit.
+    """
+
+    version = 0
+
+    def __init__(self, n_fits: int):
+        self._fits: list[SheddingFit | None] = [None] * n_fits
+        self._rows: list[int | None] = list(range(n_fits))
+
+    def _build(self, row: int) -> SheddingFit:
+        raise NotImplementedError
+
+    def _source_key_values(self, key: str) -> list | None:
+        """Every source row's ``key``, or None if only the fits can say."""
+        return None
+
+    def __len__(self) -> int:
+        return len(self._fits)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(len(self))[index]
+        if self._fits[index] is None:
+            self._fits[index] = self._build(self._rows[index])
+        return self._fits[index]
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            self._rows[index] = [None] * len(value)
+        else:
+            self._rows[index] = None
+        self._fits[index] = value
+        self.version += 1
+
+    def __delitem__(self, index) -> None:
+        del self._fits[index]
+        del self._rows[index]
+        self.version += 1
+
+    def insert(self, index: int, value) -> None:
+        self._fits.insert(index, value)
+        self._rows.insert(index, None)
+        self.version += 1
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        fits = list(self)
+        fits.sort(key=key, reverse=reverse)
+        self[:] = fits
+
+    def __add__(self, other) -> list:
+        return list(self) + list(other)
+
+    def __radd__(self, other) -> list:
+        return list(other) + list(self)
+
+    def key_values(self, key: str) -> list:
+        source = self._source_key_values(key)
+        if source is None:
+            return [getattr(fit, key, None) for fit in self]
+        # Rows still come from the source, so indexing builds no fits.
+        return [
+            source[row] if row is not None else getattr(fit, key, None)
+            for fit, row in zip(self._fits, self._rows)
+        ]
+
+
 @dataclass
 class SheddingCatalog:
     """
     A collection of fitted models with a browsable summary table.
 
+    ``fits`` behaves as a list of ``SheddingFit`` however the catalog was
+    made. A list passed in is copied, so editing it afterwards leaves the
+    catalog as it was; edit ``catalog.fits`` instead. A loaded catalog holds
+    a list-like that builds each fit on first access: it supports the same
+    edits, but is not a ``list`` instance.
+
     Examples:
         >>> import shedding_hub as sh
         >>> catalog = sh.load_shedding_catalog()
@@ -189,17 +396,118 @@ class SheddingCatalog:
         'woelfel2020virological'
     """
 
-    fits: list[SheddingFit] = field(default_factory=list)
+    fits: MutableSequence[SheddingFit] = field(default_factory=list)
     skipped: pd.DataFrame = field(
         default_factory=lambda: pd.DataFrame(
             columns=["dataset_id", "analyte", "model", "reason", "message"]
         )
     )
+    # How the build that produced this catalog was scheduled. Set by
+    # fit_shedding_models and never serialized: it describes one run on one
+    # machine, not the fits.
+    build_report: "BuildReport | None" = field(default=None, repr=False, compare=False)
+    # The table and key indexes, derived from ``fits`` on first use and dropped
+    # whenever ``fits`` is reassigned or a fit is added, removed or replaced in
+    # it: a list given as ``fits`` is copied into a ``_FitList``, which counts
+    # those changes. Editing an attribute of a fit in place is not noticed.
+    _derived_cache: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name, value):
+        if name == "fits" and isinstance(value, list):
+            if not isinstance(value, _FitList):
+                value = _FitList(value)
+        super().__setattr__(name, value)
 
     @property
     def table(self) -> pd.DataFrame:
-        """One row per fit, summarising its median individual."""
-        return _fits_to_frame(self.fits)
+        """One row per fit, summarising its median individual.
+
+        Built once and kept until ``fits`` changes; each access returns its own
+        copy, so editing it does not change the next.
+        """
+        return self.to_table()
+
+    def to_table(self, *, telemetry: bool = False) -> pd.DataFrame:
+        """
+        ``table``, optionally with each fit's optimizer telemetry appended.
+
+        Args:
+            telemetry: Append the columns described on ``fit_to_row``, for
+                finding the analytes that dominate a build and catching
+                optimizer regressions between releases.
+
+        Examples:
+            >>> import shedding_hub as sh
+            >>> table = sh.load_shedding_catalog().to_table(telemetry=True)
+            >>> table.sort_values('fit_seconds').columns[-1]
+            'fit_seconds'
+        """
+        return self._derived(
+            ("table", telemetry), lambda: _fits_to_frame(self.fits, telemetry=telemetry)
+        ).copy()
+
+    def matching(self, **keys) -> list[SheddingFit]:
+        """
+        Every fit whose attributes equal ``keys``, in catalog order.
+
+        Keys among the table's key columns are answered from a hash index per
+        column, built on first use and intersected smallest first, so a query
+        costs what it matches rather than what the catalog holds. Any other key
+        is then compared fit by fit on what remains.
+
+        Examples:
+            >>> import shedding_hub as sh
+            >>> catalog = sh.load_shedding_catalog()
+            >>> fits = catalog.matching(dataset_id='woelfel2020virological')
+            >>> sorted({fit.analyte for fit in fits})
+            ['oropharyngeal_swab', 'sputum', 'stool']
+        """
+        indexed, scanned = {}, {}
+        for key, value in keys.items():
+            (indexed if key in _KEY_COLUMNS and _is_hashable(value) else scanned)[
+                key
+            ] = value
+        if indexed:
+            hits = sorted(
+                (self._index(key).get(value, ()) for key, value in indexed.items()),
+                key=len,
+            )
+            positions = set(hits[0]).intersection(*hits[1:])
+            fits = [self.fits[position] for position in sorted(positions)]
+        else:
+            fits = list(self.fits)
+        return [
+            fit
+            for fit in fits
+            if all(getattr(fit, key, None) == value for key, value in scanned.items())
+        ]
+
+    def _index(self, key: str) -> dict:
+        """``{value: positions}`` over every fit's ``key`` attribute."""
+
+        def build():
+            index = {}
+            for position, value in enumerate(_key_values(self.fits, key)):
+                index.setdefault(value, []).append(position)
+            return index
+
+        return self._derived(("index", key), build)
+
+    def _derived(self, name, build):
+        # Held by reference rather than by id, so a replaced list whose id is
+        # later reused can never pass for the one the cache was built on. A
+        # loaded catalog's read-only fits have no version and never change.
+        fits = self.fits
+        version = getattr(fits, "version", None)
+        cache = self._derived_cache
+        if cache.get("fits") is not fits or cache.get("version") != version:
+            cache.clear()
+            cache.update(fits=fits, version=version)
+        if name not in cache:
+            cache[name] = build()
+        return cache[name]
 
     def select(self, **keys) -> SheddingFit:
         """
@@ -210,11 +518,7 @@ class SheddingCatalog:
                 silently — the error lists the candidates and the columns that
                 would tell them apart.
         """
-        matches = [
-            fit
-            for fit in self.fits
-            if all(getattr(fit, key, None) == value for key, value in keys.items())
-        ]
+        matches = self.matching(**keys)
         if not matches:
             raise ValueError(
                 f"select({keys}) matched no fits. "
@@ -270,9 +574,17 @@ class SheddingCatalog:
             self, dataset_ids=dataset_ids, weights=weights, method=method, **keys
         )
 
-    def to_dict(self) -> dict:
+    def to_dict(self, *, timings: bool = True) -> dict:
+        """
+        Serialize to plain Python types, the layout of the catalog YAML.
+
+        Args:
+            timings: Include each fit's per-phase wall-clock timings. Pass False
+                for output that depends only on the inputs, so two builds of
+                the same data -- serial or parallel -- serialize identically.
+        """
         return {
-            "fits": [_fit_to_payload(fit) for fit in self.fits],
+            "fits": [_fit_to_payload(fit, timings=timings) for fit in self.fits],
             "skipped": self.skipped.to_dict(orient="records"),
         }
 
@@ -296,6 +608,15 @@ def fit_shedding_models(
     min_time: float | None = None,
     max_peak_above_observed: float | None = None,
     value_types: tuple[str, ...] = ("concentration",),
+    time_budget_seconds: float | None = None,
+    max_evaluations: int | None = None,
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+    schedule: str = "longest_first",
+    costs: dict[tuple[str, str, str], float] | None = None,
+    previous: SheddingCatalog | None = None,
+    checkpoint_dir: str | pathlib.Path | None = None,
+    resume: bool = False,
 ) -> SheddingCatalog:
     """
     Fit every analyte of every dataset, for every requested model.
@@ -334,6 +655,50 @@ def fit_shedding_models(
             an ensemble that averaged the two would be averaging incommensurable
             quantities. Admit both with ``("concentration", "ct")`` once that is
             resolved.
+        time_budget_seconds: Per-fit wall-clock allowance, passed through to
+            the fitter, so the slowest analyte bounds a build's worst case
+            instead of stalling it. A fit that runs out is still published,
+            with ``converged=False`` and ``stop_reason="time_budget"``, exactly
+            as a fit that failed to converge on its own would be.
+        max_evaluations: Per-fit evaluation allowance, passed through likewise.
+        n_jobs: Number of worker processes to fit in. ``None`` or 1 fits
+            serially in this process; -1 uses one process per core. Every
+            (dataset, analyte, model) fit is independent, so a parallel build
+            takes about as long as its slowest fits, and returns exactly what a
+            serial build does: the same ``fits`` in the same order, and the
+            same ``skipped`` rows.
+        executor: A ``concurrent.futures.Executor`` to fit in instead; the
+            caller owns its lifetime. Executors do not publish their size, so
+            ``n_jobs`` then gives its worker count, which the build report's
+            makespan figures assume. Jobs carry their prepared observations
+            with them, so a process pool's workers need nothing but the
+            package.
+        schedule: Order to dispatch fits in, one of ``SCHEDULES``. The default
+            ``"longest_first"`` starts the fits ``estimate_fit_cost`` expects to
+            be slowest first; ``"in_order"`` dispatches in traversal order.
+            Either way the catalog is the same; only ``build_report`` differs.
+        costs: Measured seconds from an earlier build, keyed by
+            ``(dataset_id, analyte, model)`` -- e.g. the ``fit_seconds`` column
+            of ``catalog.to_table(telemetry=True)``. Used in place of the
+            estimate where present; jobs it lacks are estimated and rescaled
+            to seconds against the jobs it has.
+        previous: An earlier catalog to rebuild incrementally from. Each of
+            its fits whose ``fingerprint`` still matches -- same dataset
+            content, analyte spec, model, fitter options and
+            ``FITTER_VERSION`` -- is reused as is instead of refitted.
+            Refusals are not carried over: their analytes are attempted again.
+            ``build_report`` lists what was reused and what was removed.
+        checkpoint_dir: A directory to write each job's outcome to as soon as
+            it finishes, one small YAML shard per (dataset, analyte, model),
+            named by its fingerprints and written atomically. A build that
+            dies part-way keeps every job it finished.
+        resume: Take each job whose shard is already in ``checkpoint_dir``
+            from the shard instead of fitting it. Shards are named by content,
+            so one left by different data or options is never mistaken for
+            this build's, and shards written by builds on other machines
+            resume just as well. The catalog is assembled in traversal order
+            either way, identical to one built in a single run. Fits restored
+            from a shard keep their ``subject_params``.
 
     Returns:
         A ``SheddingCatalog``.
@@ -351,11 +716,162 @@ def fit_shedding_models(
         >>> len(catalog.fits)
         4
     """
-    fits: list[SheddingFit] = []
-    skipped: list[dict] = []
+    (catalog,) = _build_catalogs(
+        datasets,
+        gates=(max_peak_above_observed,),
+        previous=(previous,),
+        checkpoint_dir=checkpoint_dir,
+        resume=resume,
+        models=models,
+        min_observations=min_observations,
+        min_time=min_time,
+        value_types=value_types,
+        time_budget_seconds=time_budget_seconds,
+        max_evaluations=max_evaluations,
+        n_jobs=n_jobs,
+        executor=executor,
+        schedule=schedule,
+        costs=costs,
+    )
+    return catalog
+
+
+def fit_shedding_models_by_gate(
+    datasets,
+    *,
+    gates: Sequence[float | None],
+    models=MODELS,
+    min_observations: int | None = None,
+    min_time: float | None = None,
+    value_types: tuple[str, ...] = ("concentration",),
+    time_budget_seconds: float | None = None,
+    max_evaluations: int | None = None,
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+    schedule: str = "longest_first",
+    costs: dict[tuple[str, str, str], float] | None = None,
+    previous: dict[float | None, SheddingCatalog] | None = None,
+    checkpoint_dir: str | pathlib.Path | None = None,
+    resume: bool = False,
+) -> dict[float | None, SheddingCatalog]:
+    """
+    Build one catalog per over-extrapolation gate from a single optimization.
+
+    ``max_peak_above_observed`` only decides which subjects a fit's population
+    summary keeps, so each (dataset, analyte, model) is solved once with
+    ``solve_shedding_model`` and summarized under every gate with
+    ``summarize_shedding_solution``. Each catalog is the one
+    ``fit_shedding_models`` builds with that gate, for the optimization cost
+    of one build.
+
+    Args:
+        datasets: As for ``fit_shedding_models``.
+        gates: The distinct ``max_peak_above_observed`` values to build for;
+            None stands for the fitter's default.
+        previous: Earlier catalogs keyed by gate, to rebuild incrementally
+            from. A (dataset, analyte, model) is reused only when every gate's
+            catalog still holds a matching fit; otherwise it is solved once
+            and summarized for all of them.
+        models, min_observations, min_time, value_types, time_budget_seconds,
+            max_evaluations, n_jobs, executor, schedule, costs, checkpoint_dir,
+            resume: As for ``fit_shedding_models``.
+
+    Returns:
+        A dict from each gate, in ``gates`` order, to its ``SheddingCatalog``.
+        The catalogs share one ``build_report`` schedule; ``reused`` and
+        ``removed`` are each catalog's own.
+
+    Examples:
+        >>> import shedding_hub as sh
+        >>> data = sh.load_dataset('woelfel2020virological', local='./data')
+        >>> catalogs = sh.fit_shedding_models_by_gate(
+        ...     [data], gates=(None, 2.0), models=('exponential',)
+        ... )
+        >>> list(catalogs)
+        [None, 2.0]
+    """
+    gates = tuple(gates)
+    if not gates or len(set(gates)) != len(gates):
+        raise ValueError(
+            f"gates must be a non-empty sequence of distinct values; got {gates!r}."
+        )
+    previous = previous or {}
+    catalogs = _build_catalogs(
+        datasets,
+        gates=gates,
+        previous=tuple(previous.get(gate) for gate in gates),
+        checkpoint_dir=checkpoint_dir,
+        resume=resume,
+        models=models,
+        min_observations=min_observations,
+        min_time=min_time,
+        value_types=value_types,
+        time_budget_seconds=time_budget_seconds,
+        max_evaluations=max_evaluations,
+        n_jobs=n_jobs,
+        executor=executor,
+        schedule=schedule,
+        costs=costs,
+    )
+    return dict(zip(gates, catalogs))
+
+
+def _build_catalogs(
+    datasets,
+    *,
+    gates: tuple[float | None, ...],
+    previous: tuple[SheddingCatalog | None, ...],
+    models,
+    min_observations: int | None,
+    min_time: float | None,
+    value_types: tuple[str, ...],
+    time_budget_seconds: float | None,
+    max_evaluations: int | None,
+    n_jobs: int | None,
+    executor: Executor | None,
+    schedule: str,
+    costs: dict[tuple[str, str, str], float] | None,
+    checkpoint_dir: str | pathlib.Path | None,
+    resume: bool,
+) -> list[SheddingCatalog]:
+    """The body of ``fit_shedding_models``, returning one catalog per gate."""
+    options: dict = {
+        "min_observations": min_observations,
+        "time_budget_seconds": time_budget_seconds,
+        "max_evaluations": max_evaluations,
+    }
+    if min_time is not None:
+        options["min_time"] = min_time
+    # Every option each gate's fits depend on, as their fingerprints record it.
+    gate_options = [
+        options if gate is None else {**options, "max_peak_above_observed": gate}
+        for gate in gates
+    ]
 
+    # Every (dataset, analyte, model) in the order a serial walk visits them:
+    # a refusal decided here, fits reused from ``previous``, or a job to fit.
+    # Outcomes are slotted back into this order however the jobs were
+    # scheduled, which is what makes a parallel build indistinguishable from a
+    # serial one.
+    plan: list[tuple[str, object]] = []
+    fingerprints: list[list[str]] = []
+    shards: list[pathlib.Path | None] = []
+    checkpoint = None if checkpoint_dir is None else pathlib.Path(checkpoint_dir)
+    if resume and checkpoint is None:
+        raise ValueError("resume=True needs the checkpoint_dir to resume from.")
+    if checkpoint is not None:
+        checkpoint.mkdir(parents=True, exist_ok=True)
+    reusable = [
+        {
+            (fit.dataset_id, fit.analyte, fit.model): fit
+            for fit in (catalog.fits if catalog is not None else ())
+            if fit.fingerprint is not None
+        }
+        for catalog in previous
+    ]
     for dataset in datasets:
         dataset_id = dataset.get("dataset_id", "unknown")
+        content = _dataset_hash(dataset)
         for analyte, analyte_spec in dataset.get("analytes", {}).items():
             # Skipped here rather than left to prepare_observations, which now
             # accepts Ct analytes. Keeping the decision in the catalog builder is
@@ -371,115 +887,1031 @@ def fit_shedding_models(
             )
             if analyte_value_type not in value_types:
                 for model in models:
-                    skipped.append(
-                        {
-                            "dataset_id": dataset_id,
-                            "analyte": analyte,
-                            "model": model,
-                            "reason": (
-                                "ct_units"
-                                if analyte_value_type == "ct"
-                                else "concentration_units"
-                            ),
-                            "message": (
-                                f"Analyte {analyte!r} is reported in "
-                                f"{analyte_spec.get('unit')!r}. Cycle-threshold "
-                                "fits are supported but excluded from the "
-                                "catalog, whose heights are log10 "
-                                "concentrations."
-                                if analyte_value_type == "ct"
-                                else (
+                    plan.append(
+                        (
+                            "skipped",
+                            {
+                                "dataset_id": dataset_id,
+                                "analyte": analyte,
+                                "model": model,
+                                "reason": (
+                                    "ct_units"
+                                    if analyte_value_type == "ct"
+                                    else "concentration_units"
+                                ),
+                                "message": (
                                     f"Analyte {analyte!r} is reported in "
-                                    f"{analyte_spec.get('unit')!r}, a "
-                                    "concentration, and this build admits only "
-                                    f"{sorted(value_types)}."
-                                )
-                            ),
-                        }
+                                    f"{analyte_spec.get('unit')!r}. "
+                                    "Cycle-threshold fits are supported but "
+                                    "excluded from the catalog, whose heights "
+                                    "are log10 concentrations."
+                                    if analyte_value_type == "ct"
+                                    else (
+                                        f"Analyte {analyte!r} is reported in "
+                                        f"{analyte_spec.get('unit')!r}, a "
+                                        "concentration, and this build admits "
+                                        f"only {sorted(value_types)}."
+                                    )
+                                ),
+                            },
+                        )
                     )
                 continue
+            # Extracted once for all of the analyte's models, and only once one
+            # of them turns out to need fitting.
+            prepared = None
             for model in models:
-                try:
-                    with warnings.catch_warnings():
-                        warnings.simplefilter("ignore", UserWarning)
-                        extra = {}
-                        if max_peak_above_observed is not None:
-                            extra["max_peak_above_observed"] = max_peak_above_observed
-                        if min_time is not None:
-                            extra["min_time"] = min_time
-                        fit = fit_shedding_model(
-                            dataset,
-                            analyte=analyte,
-                            model=model,
-                            min_observations=min_observations,
-                            **extra,
-                        )
-                    # Applied here rather than inside fit_shedding_model so that
-                    # fitting one subject on purpose stays possible, while a fit
-                    # too thin to describe a population never reaches the
-                    # catalog. Raises SheddingDataError, so the existing handler
-                    # records it with a reason like any other refusal.
-                    require_estimable_population(fit)
-                    fits.append(fit)
-                except SheddingDataError as error:
-                    skipped.append(
+                expected = [
+                    _content_hash(
                         {
-                            "dataset_id": dataset_id,
+                            "dataset": content,
                             "analyte": analyte,
+                            "analyte_spec": analyte_spec,
                             "model": model,
-                            "reason": error.reason,
-                            "message": str(error),
-                        }
-                    )
-                except (ValueError, np.linalg.LinAlgError) as error:
-                    # Not a convergence failure: non-convergence never raises
-                    # (fit_shedding_model returns the fit with converged=False
-                    # and it is published normally). Reaching here means some
-                    # other, unanticipated ValueError/LinAlgError escaped
-                    # every named SheddingDataError reason above -- e.g. a
-                    # malformed dataset -- so it is filed as a catch-all
-                    # rather than misnamed after a cause that cannot be true.
-                    skipped.append(
-                        {
-                            "dataset_id": dataset_id,
-                            "analyte": analyte,
-                            "model": model,
-                            "reason": "unexpected_error",
-                            "message": str(error),
+                            "options": gate_option,
+                            "fitter_version": FITTER_VERSION,
                         }
                     )
+                    for gate_option in gate_options
+                ]
+                earlier = [
+                    index.get((dataset_id, analyte, model)) for index in reusable
+                ]
+                if all(
+                    fit is not None and fit.fingerprint == fingerprint
+                    for fit, fingerprint in zip(earlier, expected)
+                ):
+                    plan.append(("reused", earlier))
+                    continue
+                shard = (
+                    None
+                    if checkpoint is None
+                    else checkpoint / f"{_content_hash(expected)}.yaml"
+                )
+                if resume and shard.is_file():
+                    plan.append(("resumed", _read_shard(shard)))
+                    continue
+                if prepared is None:
+                    prepared = _prepare_analyte(dataset, analyte, models, options)
+                job = (dataset_id, analyte, analyte_spec, model, prepared[model])
+                plan.append(("job", (*job, options, gates)))
+                fingerprints.append(expected)
+                shards.append(shard)
 
-    return SheddingCatalog(
-        fits=fits,
-        skipped=pd.DataFrame(
-            skipped, columns=["dataset_id", "analyte", "model", "reason", "message"]
+    if schedule not in SCHEDULES:
+        raise ValueError(f"Unknown schedule {schedule!r}. Choose one of {SCHEDULES}.")
+    workers = _resolve_n_jobs(n_jobs)
+
+    jobs = [item for kind, item in plan if kind == "job"]
+    estimates = _job_costs(jobs, costs)
+    order = list(range(len(jobs)))
+    if schedule == "longest_first":
+        # Stable, so equal estimates keep their traversal order.
+        order.sort(key=lambda index: -estimates[index])
+
+    outcomes: list = [None] * len(jobs)
+
+    def _finished(position: int, outcome: tuple) -> None:
+        index = order[position]
+        outcomes[index] = outcome
+        for (fit, _), fingerprint in zip(outcome[0], fingerprints[index]):
+            if fit is not None:
+                fit.fingerprint = fingerprint
+        if shards[index] is not None:
+            _write_shard(shards[index], outcome)
+
+    started = time.perf_counter()
+    _run_jobs(
+        [jobs[index] for index in order],
+        workers=workers,
+        executor=executor,
+        on_done=_finished,
+    )
+    actual_makespan = time.perf_counter() - started
+
+    report = _build_report(
+        jobs,
+        estimates,
+        [seconds for _, seconds in outcomes],
+        order=order,
+        schedule=schedule,
+        workers=min(workers, max(len(jobs), 1)),
+        actual_makespan=actual_makespan,
+    )
+    report.checkpointed = [shard for shard in shards if shard is not None]
+    catalogs = []
+    for gate_index, earlier in enumerate(previous):
+        fits: list[SheddingFit] = []
+        skipped: list[dict] = []
+        reused: list[tuple[str, str, str]] = []
+        resumed: list[tuple[str, str, str]] = []
+        remaining = iter(outcomes)
+        for kind, item in plan:
+            if kind == "skipped":
+                skipped.append(item)
+                continue
+            if kind == "reused":
+                fit = item[gate_index]
+                fits.append(fit)
+                reused.append((fit.dataset_id, fit.analyte, fit.model))
+                continue
+            if kind == "resumed":
+                fit, refusal = item[0][gate_index]
+                resumed.append(
+                    (fit.dataset_id, fit.analyte, fit.model)
+                    if fit is not None
+                    else (refusal["dataset_id"], refusal["analyte"], refusal["model"])
+                )
+            else:
+                fit, refusal = next(remaining)[0][gate_index]
+            if fit is not None:
+                fits.append(fit)
+            else:
+                skipped.append(refusal)
+        catalogs.append(
+            SheddingCatalog(
+                fits=fits,
+                skipped=pd.DataFrame(
+                    skipped,
+                    columns=["dataset_id", "analyte", "model", "reason", "message"],
+                ),
+                build_report=replace(
+                    report,
+                    reused=reused,
+                    resumed=resumed,
+                    removed=_removed_keys(earlier, fits),
+                ),
+            )
+        )
+    return catalogs
+
+
+def _content_hash(value) -> str:
+    """SHA-256 of ``value``'s canonical JSON, so equal content hashes equally."""
+    # default=str covers the dates YAML loads as datetime objects.
+    text = json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _dataset_hash(dataset: dict) -> str:
+    """``_content_hash`` of a dataset, measurements included however it is held."""
+    if not isinstance(dataset, _StreamedDataset):
+        return _content_hash(dataset)
+    # A streamed dataset's participants carry no measurements: they live only
+    # in its table, so the table's columns are hashed alongside the rest.
+    table = dataset.measurement_table
+    digest = hashlib.sha256(_content_hash(dataset).encode("utf-8"))
+    digest.update(_content_hash(list(table.analytes)).encode("utf-8"))
+    for column in (
+        table.participant,
+        table.analyte_code,
+        table.time,
+        table.value,
+        table.censored,
+    ):
+        digest.update(np.ascontiguousarray(column).tobytes())
+    return digest.hexdigest()
+
+
+def _removed_keys(
+    previous: SheddingCatalog | None, fits: list[SheddingFit]
+) -> list[tuple[str, str, str]]:
+    """Keys of ``previous``'s fits that this build did not publish again."""
+    if previous is None:
+        return []
+    kept = {(fit.dataset_id, fit.analyte, fit.model) for fit in fits}
+    return [
+        key
+        for key in ((fit.dataset_id, fit.analyte, fit.model) for fit in previous.fits)
+        if key not in kept
+    ]
+
+
+@dataclass
+class BuildReport:
+    """
+    How a catalog build's fits were scheduled, and how close it came to ideal.
+
+    Attributes:
+        schedule: The ``schedule`` the build dispatched with.
+        n_workers: Processes the fits ran across.
+        jobs: One row per fit attempted, in traversal order: ``dataset_id``,
+            ``analyte``, ``model``, the ``estimated_cost`` the dispatch order
+            was decided from, the measured ``seconds``, and the ``dispatch``
+            position.
+        predicted_makespan: Seconds the build was expected to take, from
+            replaying the dispatch order over the estimates, rescaled so they
+            sum to the measured total. Comparing it with ``actual_makespan``
+            separates a poor estimate from scheduling overhead.
+        lower_bound: The longest single fit, or the total work spread evenly
+            over the workers, whichever is larger. No order can finish sooner.
+        actual_makespan: Wall-clock seconds from first dispatch to last result.
+        reused: ``(dataset_id, analyte, model)`` of each fit an incremental
+            build took from ``previous`` instead of refitting.
+        resumed: Keys of each job taken from a checkpoint shard. Like reused
+            fits, they are not in ``jobs``.
+        removed: Keys of ``previous``'s fits that the build did not publish:
+            their dataset or analyte is gone, or is now refused.
+        checkpointed: Path of each shard this build wrote to its
+            ``checkpoint_dir``, one per job. Shards it resumed from, or that
+            other builds wrote there, are not listed.
+    """
+
+    schedule: str
+    n_workers: int
+    jobs: pd.DataFrame
+    predicted_makespan: float
+    lower_bound: float
+    actual_makespan: float
+    reused: list[tuple[str, str, str]] = field(default_factory=list)
+    resumed: list[tuple[str, str, str]] = field(default_factory=list)
+    removed: list[tuple[str, str, str]] = field(default_factory=list)
+    checkpointed: list[pathlib.Path] = field(default_factory=list)
+
+
+def estimate_fit_cost(
+    dataset: dict,
+    analyte: str,
+    model: str,
+    *,
+    min_observations: int | None = None,
+    min_time: float | None = None,
+) -> float:
+    """
+    Relative cost of fitting ``model`` to one analyte, before fitting it.
+
+    The observation count times the number of free parameters: each likelihood
+    evaluation is linear in the first, and the optimizer's iteration count
+    grows with the second. A 440-subject ``gamma_shifted`` fit and a 5-subject
+    exponential fit differ by orders of magnitude on this scale, as they do on
+    the clock. Only ``prepare_observations`` runs, so an analyte it refuses is
+    priced at zero: its fit will fail as quickly.
+
+    Args:
+        dataset: A dataset dictionary, as from ``load_dataset``.
+        analyte: The analyte to price.
+        model: One of ``MODELS``.
+        min_observations: As for ``fit_shedding_model``.
+        min_time: As for ``fit_shedding_model``.
+
+    Returns:
+        The estimate, in arbitrary units comparable across jobs.
+    """
+    extra = {} if min_time is None else {"min_time": min_time}
+    try:
+        # The fit itself reports anything prepare_observations has to say.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            observations = prepare_observations_by_model(
+                dataset,
+                analyte,
+                models=(model,),
+                min_observations=min_observations,
+                **extra,
+            )[model]
+    except ValueError:
+        return 0.0
+    return _observations_cost(observations, model)
+
+
+def _observations_cost(observations, model: str) -> float:
+    """``estimate_fit_cost`` of prepared observations, or 0 for a refusal."""
+    if not isinstance(observations, Observations):
+        return 0.0
+    n_parameters = observations.n_subjects * len(PARAM_NAMES[model]) + 1
+    return float(len(observations.values) * n_parameters)
+
+
+def _prepare_analyte(dataset: dict, analyte: str, models, options: dict) -> dict:
+    """
+    Each model's ``(observations, seconds)`` for one analyte's catalog jobs.
+
+    One ``prepare_observations_by_model`` extraction serves every model, and
+    its time is shared evenly between them as their ``prepare`` phase. A model
+    it refuses gets its ``skipped`` row in place of observations, decided here
+    because a ``SheddingDataError`` does not survive a trip between processes.
+    """
+    dataset_id = dataset.get("dataset_id", "unknown")
+    extra = {} if "min_time" not in options else {"min_time": options["min_time"]}
+    started = time.perf_counter()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        try:
+            prepared = prepare_observations_by_model(
+                dataset,
+                analyte,
+                models=tuple(models),
+                min_observations=options["min_observations"],
+                **extra,
+            )
+        except (ValueError, np.linalg.LinAlgError) as error:
+            prepared = dict.fromkeys(models, error)
+    seconds = (time.perf_counter() - started) / max(len(prepared), 1)
+    return {
+        model: (
+            (
+                _refusal(dataset_id, analyte, model, observations)
+                if isinstance(observations, Exception)
+                else observations
+            ),
+            seconds,
+        )
+        for model, observations in prepared.items()
+    }
+
+
+def _job_costs(
+    jobs: list[tuple], costs: dict[tuple[str, str, str], float] | None
+) -> np.ndarray:
+    """Per-job cost estimates, in seconds where ``costs`` allows."""
+    estimates = np.array(
+        [
+            _observations_cost(observations, model)
+            for _, _, _, model, (observations, _), *_ in jobs
+        ]
+    )
+    if not costs:
+        return estimates
+    keys = [(dataset_id, analyte, model) for dataset_id, analyte, _, model, *_ in jobs]
+    known = np.array([key in costs for key in keys])
+    measured = np.array([costs.get(key, np.nan) for key in keys], dtype=float)
+    # Put the estimates for unmeasured jobs on the measured jobs' clock.
+    scale = (
+        measured[known].sum() / estimates[known].sum()
+        if estimates[known].sum() > 0
+        else 1.0
+    )
+    return np.where(known, measured, estimates * scale)
+
+
+def _simulate_makespan(costs: np.ndarray, workers: int) -> float:
+    """Finish time of ``costs``, in order, each to whichever worker frees first."""
+    finish = [0.0] * workers
+    for cost in costs:
+        heapq.heappush(finish, heapq.heappop(finish) + cost)
+    return max(finish)
+
+
+def _build_report(
+    jobs: list[tuple],
+    estimates: np.ndarray,
+    seconds: list[float],
+    *,
+    order: list[int],
+    schedule: str,
+    workers: int,
+    actual_makespan: float,
+) -> BuildReport:
+    seconds = np.asarray(seconds, dtype=float)
+    dispatch = np.empty(len(jobs), dtype=int)
+    dispatch[order] = np.arange(len(jobs))
+    total = seconds.sum()
+    scale = total / estimates.sum() if estimates.sum() > 0 else 0.0
+    return BuildReport(
+        schedule=schedule,
+        n_workers=workers,
+        jobs=pd.DataFrame(
+            {
+                "dataset_id": [job[0] for job in jobs],
+                "analyte": [job[1] for job in jobs],
+                "model": [job[3] for job in jobs],
+                "estimated_cost": estimates,
+                "seconds": seconds,
+                "dispatch": dispatch,
+            }
+        ),
+        predicted_makespan=_simulate_makespan(estimates[order] * scale, workers),
+        lower_bound=max(total / workers, seconds.max(initial=0.0)),
+        actual_makespan=actual_makespan,
+    )
+
+
+def _fit_job(job: tuple) -> tuple[list[tuple[SheddingFit | None, dict | None]], float]:
+    """
+    Fit one catalog job: ``(dataset_id, analyte, analyte_spec, model, prepared,
+    options, gates)``.
+
+    ``prepared`` is the job's ``(observations, seconds)`` from
+    ``_prepare_analyte``; the dataset itself stays behind, so what a worker
+    process is sent grows with the analyte's observations rather than with the
+    whole dataset once per model. Solves once and summarizes under each gate,
+    returning one ``(fit, None)`` or ``(None, record)`` per gate -- ``record``
+    being the ``skipped`` row that explains a refusal -- and the seconds the
+    job took. A module-level function taking and returning plain picklable
+    values, so a worker process runs exactly what a serial build runs --
+    including the warning suppression, which a worker would not inherit from
+    the caller's ``catch_warnings``, and the translation of
+    ``SheddingDataError`` into a row, so no exception has to survive a trip
+    between processes.
+    """
+    dataset_id, analyte, analyte_spec, model, prepared, options, gates = job
+    observations, prepare_seconds = prepared
+    started = time.perf_counter()
+    if not isinstance(observations, Observations):
+        return [(None, observations)] * len(gates), time.perf_counter() - started
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        try:
+            solution = _solve_observations(
+                dataset_id,
+                analyte,
+                analyte_spec,
+                model,
+                observations,
+                time_budget_seconds=options["time_budget_seconds"],
+                max_evaluations=options["max_evaluations"],
+                started=started - prepare_seconds,
+            )
+        except (ValueError, np.linalg.LinAlgError) as error:
+            refusal = _refusal(dataset_id, analyte, model, error)
+            return [(None, refusal)] * len(gates), time.perf_counter() - started
+        outcomes = []
+        for gate in gates:
+            extra = {} if gate is None else {"max_peak_above_observed": gate}
+            try:
+                fit = summarize_shedding_solution(solution, **extra)
+                # Applied here rather than inside fit_shedding_model so that
+                # fitting one subject on purpose stays possible, while a fit
+                # too thin to describe a population never reaches the catalog.
+                # Raises SheddingDataError, so it is recorded with a reason
+                # like any other refusal.
+                require_estimable_population(fit)
+                outcomes.append((fit, None))
+            except (ValueError, np.linalg.LinAlgError) as error:
+                outcomes.append((None, _refusal(dataset_id, analyte, model, error)))
+    return outcomes, time.perf_counter() - started
+
+
+def _refusal(dataset_id: str, analyte: str, model: str, error: Exception) -> dict:
+    """The ``skipped`` row recording why a job produced no fit."""
+    # Anything but a SheddingDataError is not a convergence failure:
+    # non-convergence never raises (the fit is returned with converged=False
+    # and it is published normally). Reaching here without a reason means some
+    # other, unanticipated ValueError/LinAlgError escaped every named
+    # SheddingDataError reason -- e.g. a malformed dataset -- so it is filed as
+    # a catch-all rather than misnamed after a cause that cannot be true.
+    return {
+        "dataset_id": dataset_id,
+        "analyte": analyte,
+        "model": model,
+        "reason": (
+            error.reason if isinstance(error, SheddingDataError) else "unexpected_error"
         ),
+        "message": str(error),
+    }
+
+
+def _run_jobs(
+    jobs: list[tuple],
+    *,
+    workers: int,
+    executor: Executor | None,
+    on_done: Callable[[int, tuple], None],
+) -> None:
+    """
+    Run ``_fit_job`` over ``jobs``, calling ``on_done(position, outcome)`` as each
+    finishes.
+
+    Pools hand out work in submission order, so the order of ``jobs`` is the
+    dispatch order. Outcomes are reported as they complete rather than in that
+    order, so a checkpoint never waits on a slower job dispatched earlier.
+    """
+    if executor is not None:
+        _drain(executor, jobs, on_done)
+    elif workers == 1 or len(jobs) < 2:
+        for position, job in enumerate(jobs):
+            on_done(position, _fit_job(job))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            _drain(pool, jobs, on_done)
+
+
+def _drain(
+    pool: Executor, jobs: list[tuple], on_done: Callable[[int, tuple], None]
+) -> None:
+    futures = {
+        pool.submit(_fit_job, job): position for position, job in enumerate(jobs)
+    }
+    for future in as_completed(futures):
+        on_done(futures[future], future.result())
+
+
+def _write_shard(path: pathlib.Path, outcome: tuple) -> None:
+    """
+    Checkpoint one job's outcome to ``path``, atomically.
+
+    Written to a temporary file in the same directory and renamed into place,
+    so a build killed mid-write leaves either the whole shard or none of it.
+    """
+    results, seconds = outcome
+    payload = {
+        "seconds": float(seconds),
+        "outcomes": [_shard_entry(fit, refusal) for fit, refusal in results],
+    }
+    descriptor, temporary = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp"
     )
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as stream:
+            yaml.safe_dump(payload, stream, sort_keys=False)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def _shard_entry(fit: SheddingFit | None, refusal: dict | None) -> dict:
+    if fit is None:
+        return {"skipped": refusal}
+    entry = {"fit": _fit_to_payload(fit)}
+    # Kept in the shard, unlike in the catalog, so that a resumed fit still
+    # reaches the per-subject sidecar.
+    if fit.subject_params is not None:
+        entry["subject_params"] = fit.subject_params.to_dict(orient="list")
+    return entry
+
+
+def _read_shard(path: pathlib.Path) -> tuple:
+    """The outcome ``_write_shard`` checkpointed, in ``_fit_job``'s shape."""
+    with path.open(encoding="utf-8") as stream:
+        payload = yaml.safe_load(stream)
+    results = []
+    for entry in payload["outcomes"]:
+        if "fit" not in entry:
+            results.append((None, entry["skipped"]))
+            continue
+        fit = _fit_from_payload(entry["fit"])
+        if "subject_params" in entry:
+            fit.subject_params = pd.DataFrame(entry["subject_params"])
+        results.append((fit, None))
+    return results, payload["seconds"]
+
 
+def _resolve_n_jobs(n_jobs: int | None) -> int:
+    """Worker count for ``n_jobs``: None is 1, -1 one per core; 0 or below -1 raise."""
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0 or n_jobs < -1:
+        raise ValueError(
+            f"n_jobs must be a positive number of processes, or -1 for one per "
+            f"core; got {n_jobs!r}."
+        )
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    return n_jobs
 
-def load_shedding_catalog(path: str | None = None) -> SheddingCatalog:
+
+def load_shedding_catalog(
+    path: str | None = None, *, cache: bool = True, subjects: bool = False
+) -> SheddingCatalog:
     """
     Load the catalog of precomputed estimates shipped with the package.
 
+    The shipped catalog is read from its binary twin, ``shedding_catalog.npz``,
+    whenever that was written from the YAML as it now stands, and from the YAML
+    otherwise -- so a hand-edited or rebuilt YAML is never shadowed by a stale
+    binary.
+
+    A file is read once per process: later calls for the same path, while its
+    modification time and size are unchanged, are served from memory. Each call
+    still returns its own catalog -- a fit is copied from the cached one when
+    first reached -- so mutating what one caller got cannot change what the next
+    one gets. ``clear_catalog_cache`` forgets every cached read.
+
     Args:
-        path: Optional path to a catalog YAML. Defaults to the shipped file.
+        path: Optional path to a catalog, YAML or ``.npz`` by its suffix.
+            Defaults to the shipped file.
+        cache: Read through the process-wide cache. ``False`` reads the file
+            afresh and leaves the cache as it was.
+        subjects: Restore each fit's ``subject_params`` from the catalog's
+            per-subject sidecar (``<catalog>.subjects.npz``), read the first
+            time a fit is reached. A fit the sidecar has no table for, or a
+            table from a different fit of the same analyte and model, keeps
+            ``subject_params is None``.
 
     Returns:
-        A ``SheddingCatalog``. Loaded fits carry ``subject_params is None``
-        because per-subject values are not serialized; everything needed to
-        simulate (``mu``, ``Sigma``, ``sigma``) is present.
+        A ``SheddingCatalog``. Unless ``subjects`` is set, loaded fits carry
+        ``subject_params is None`` because the catalog does not hold
+        per-subject values; everything needed to simulate (``mu``, ``Sigma``,
+        ``sigma``) is present. Each fit is built on first access rather than at
+        load; ``fits`` can be edited as a list can.
+
+    Raises:
+        FileNotFoundError: If there is no catalog at ``path``, or ``subjects``
+            is set and it has no sidecar.
 
     Examples:
         >>> import shedding_hub as sh
         >>> catalog = sh.load_shedding_catalog()
         >>> len(catalog.fits)
         144
+        >>> sh.load_shedding_catalog().fits[0] is catalog.fits[0]
+        False
+    """
+    store = _subject_store(path) if subjects else None
+    if not cache:
+        catalog = _read_catalog(path)
+        if store is None:
+            return catalog
+        return SheddingCatalog(
+            fits=_CopiedFits(catalog.fits, store), skipped=catalog.skipped
+        )
+    shared = _shared_catalog(path)
+    return SheddingCatalog(
+        fits=_CopiedFits(shared.fits, store), skipped=shared.skipped.copy()
+    )
+
+
+def clear_catalog_cache() -> None:
     """
-    catalog_path = pathlib.Path(path) if path else CATALOG_PATH
+    Forget every catalog ``load_shedding_catalog`` has cached in this process.
+
+    Only needed to reclaim the memory, or where a file may change without its
+    modification time or size changing; any other change is noticed anyway.
+
+    Examples:
+        >>> import shedding_hub as sh
+        >>> sh.clear_catalog_cache()
+    """
+    _CATALOG_CACHE.clear()
+
+
+# Catalogs read in this process, keyed by _catalog_cache_key. The values are
+# shared and must never be mutated: load_shedding_catalog hands out copies, and
+# shedding_select reads them in place but copies the fits it returns.
+_CATALOG_CACHE: dict[tuple, SheddingCatalog] = {}
+
+
+def _shared_catalog(path: str | None = None) -> SheddingCatalog:
+    """The cached catalog at ``path``, read first if it is not cached yet."""
+    key = _catalog_cache_key(path)
+    catalog = _CATALOG_CACHE.get(key)
+    if catalog is None:
+        catalog = _CATALOG_CACHE[key] = _read_catalog(path)
+    return catalog
+
+
+def _catalog_cache_key(path: str | None) -> tuple:
+    # The default catalog depends on both shipped files, since which one is read
+    # depends on whether the binary is current; keying on both also skips that
+    # check, which hashes the YAML, on every call after the first.
+    if path:
+        return (_file_stamp(pathlib.Path(path)),)
+    return (None, _file_stamp(CATALOG_PATH), _file_stamp(CATALOG_BINARY_PATH))
+
+
+def _file_stamp(path: pathlib.Path) -> tuple:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return (str(path.resolve()), None, None)
+    return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+class _CopiedFits(_DeferredFits):
+    """
+    A private copy of a cached catalog's fits, each copied on first access.
+
+    Shares nothing mutable with the cache, yet costs nothing for fits the
+    caller never reaches. Given a ``_SubjectStore``, each copy also gets its
+    ``subject_params`` back from it.
+    """
+
+    def __init__(self, shared: Sequence, subjects: "_SubjectStore | None" = None):
+        super().__init__(len(shared))
+        self._shared = shared
+        self._subjects = subjects
+
+    def _build(self, row: int) -> SheddingFit:
+        fit = copy.deepcopy(self._shared[row])
+        if self._subjects is not None:
+            fit.subject_params = self._subjects.table_for(fit)
+        return fit
+
+    def _source_key_values(self, key: str) -> list:
+        # Read from the shared fits, which is safe for strings and copies none.
+        return _key_values(self._shared, key)
+
+    def stored_ranking(self) -> dict | None:
+        stored = getattr(self._shared, "stored_ranking", None)
+        # A ranking stored with the file describes its fits, not edited ones.
+        return None if stored is None or self.version else stored()
+
+    def __repr__(self) -> str:
+        return f"<{len(self)} fits, {sum(f is not None for f in self._fits)} copied>"
+
+
+def _read_catalog(path: str | None = None) -> SheddingCatalog:
+    if path:
+        catalog_path = pathlib.Path(path)
+    elif _binary_is_current(CATALOG_BINARY_PATH, CATALOG_PATH):
+        catalog_path = CATALOG_BINARY_PATH
+    else:
+        catalog_path = CATALOG_PATH
     if not catalog_path.is_file():
         raise FileNotFoundError(
             f"No shedding catalog at {catalog_path}. Run `make catalog` to build it."
         )
+    if catalog_path.suffix == ".npz":
+        return _load_binary_catalog(catalog_path)
     with catalog_path.open(encoding="utf-8") as stream:
         payload = yaml.safe_load(stream)
     return SheddingCatalog.from_dict(payload)
+
+
+def write_binary_catalog(
+    catalog: SheddingCatalog,
+    path: str | pathlib.Path,
+    *,
+    source: str | pathlib.Path | None = None,
+) -> None:
+    """
+    Write ``catalog`` in the binary format ``load_shedding_catalog`` reads.
+
+    A compressed NumPy ``.npz``: the ``dataset_id``, ``analyte`` and ``model``
+    keys as string columns, every ``population_mean`` and ``population_cov``
+    stacked into one NaN-padded float array each, and the remaining fields --
+    column by column -- and the ``skipped`` table as JSON, which parses two
+    orders of magnitude faster than the YAML. Wall-clock timings are
+    left out, as from the published YAML. The ranking ``shedding_options``
+    reads is stored too, so a loaded catalog answers it without regrouping.
+
+    Args:
+        catalog: The catalog to write.
+        path: Where to write it; conventionally the YAML's path with an
+            ``.npz`` suffix.
+        source: The YAML this binary mirrors. Its digest is recorded, so the
+            default ``load_shedding_catalog()`` only prefers the binary while
+            the two agree.
+
+    Examples:
+        >>> import tempfile, pathlib
+        >>> import shedding_hub as sh
+        >>> from shedding_hub.shedding_catalog import write_binary_catalog
+        >>> catalog = sh.load_shedding_catalog()
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     path = pathlib.Path(directory) / 'catalog.npz'
+        ...     write_binary_catalog(catalog, path)
+        ...     sh.load_shedding_catalog(path).table.equals(catalog.table)
+        True
+    """
+    from .shedding_select import _ranking_payload
+
+    width = max((fit.population_mean.size for fit in catalog.fits), default=0)
+    means = np.full((len(catalog.fits), width), np.nan)
+    covs = np.full((len(catalog.fits), width, width), np.nan)
+    records = []
+    for index, fit in enumerate(catalog.fits):
+        k = fit.population_mean.size
+        means[index, :k] = fit.population_mean
+        covs[index, :k, :k] = fit.population_cov
+        record = _fit_to_payload(fit, timings=False)
+        del record["population_mean"], record["population_cov"]
+        records.append(record)
+    # Columnar, so each field name is written once rather than once per fit.
+    fields = (
+        {name: [record[name] for record in records] for name in records[0]}
+        if records
+        else {}
+    )
+    keys = {
+        column: np.array([getattr(fit, column) for fit in catalog.fits], dtype=str)
+        for column in ("dataset_id", "analyte", "model")
+    }
+    with open(path, "wb") as stream:
+        np.savez_compressed(
+            stream,
+            format_version=np.array(_BINARY_FORMAT_VERSION),
+            source_sha256=np.array(
+                "" if source is None else _file_digest(pathlib.Path(source))
+            ),
+            n_params=np.array([fit.population_mean.size for fit in catalog.fits]),
+            population_mean=means,
+            population_cov=covs,
+            fields=_json_bytes(fields),
+            skipped=_json_bytes(catalog.skipped.to_dict(orient="records")),
+            ranking=_json_bytes(_ranking_payload(catalog)),
+            **keys,
+        )
+
+
+def write_subject_params(catalog: SheddingCatalog, path: str | pathlib.Path) -> None:
+    """
+    Write the per-subject tables of ``catalog``'s fits to a sidecar file.
+
+    The catalog omits ``subject_params`` to stay small, so this is the only
+    place they survive a build. An uncompressed ``.npz``: every fit's rows
+    stacked into one NaN-padded parameter array and one ``degenerate`` array,
+    with offsets marking where each fit's rows start, the subject ids as JSON,
+    and an index naming each fit by its keys and ``fingerprint``. Fits without
+    a table are left out.
+
+    Args:
+        catalog: The catalog whose fits' tables to write.
+        path: Where to write it; conventionally the catalog's path with the
+            suffix ``.subjects.npz``, where ``load_shedding_catalog`` looks.
+
+    Examples:
+        >>> import tempfile, pathlib
+        >>> import shedding_hub as sh
+        >>> from shedding_hub.shedding_catalog import write_subject_params
+        >>> catalog = sh.SheddingCatalog()
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     write_subject_params(catalog, pathlib.Path(directory) / 'x.npz')
+    """
+    index, blocks, degenerate, subject_ids, offsets = [], [], [], [], [0]
+    for fit in catalog.fits:
+        table = fit.subject_params
+        if table is None:
+            continue
+        columns = [c for c in table.columns if c not in ("subject_id", "degenerate")]
+        index.append(
+            {
+                "dataset_id": fit.dataset_id,
+                "analyte": fit.analyte,
+                "model": fit.model,
+                "fingerprint": fit.fingerprint,
+                "columns": columns,
+            }
+        )
+        blocks.append(table[columns].to_numpy(dtype=float))
+        degenerate.append(table["degenerate"].to_numpy(dtype=bool))
+        subject_ids.extend(table["subject_id"].tolist())
+        offsets.append(offsets[-1] + len(table))
+    width = max((block.shape[1] for block in blocks), default=0)
+    params = np.full((offsets[-1], width), np.nan)
+    for start, block in zip(offsets, blocks):
+        params[start : start + len(block), : block.shape[1]] = block
+    with open(path, "wb") as stream:
+        np.savez(
+            stream,
+            format_version=np.array(_SUBJECTS_FORMAT_VERSION),
+            index=_json_bytes(index),
+            offsets=np.array(offsets, dtype=np.int64),
+            params=params,
+            degenerate=np.concatenate(degenerate) if degenerate else np.zeros(0, bool),
+            subject_ids=_json_bytes(subject_ids),
+        )
+
+
+# Bumped whenever the layout ``write_subject_params`` writes changes.
+_SUBJECTS_FORMAT_VERSION = 1
+
+
+class _SubjectStore:
+    """
+    A sidecar from ``write_subject_params``, read the first time a table is.
+
+    The arrays are read whole and sliced per fit: NumPy cannot map the members
+    of an .npz, and they are small next to the refits they stand in for.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self._path = path
+        self._columns: dict | None = None
+        self._positions: dict | None = None
+
+    def table_for(self, fit: SheddingFit) -> pd.DataFrame | None:
+        """``fit``'s per-subject table, or None if the sidecar has none for it."""
+        if self._columns is None:
+            self._read()
+        position = self._positions.get((fit.dataset_id, fit.analyte, fit.model))
+        if position is None:
+            return None
+        entry = self._columns["index"][position]
+        # A table from another fit of the same analyte and model -- an earlier
+        # build, other data or options -- would describe different subjects.
+        if fit.fingerprint is None or entry["fingerprint"] != fit.fingerprint:
+            return None
+        start, stop = self._columns["offsets"][position : position + 2]
+        columns = entry["columns"]
+        table = pd.DataFrame(
+            self._columns["params"][start:stop, : len(columns)], columns=columns
+        )
+        table.insert(0, "subject_id", self._columns["subject_ids"][start:stop])
+        table["degenerate"] = self._columns["degenerate"][start:stop]
+        return table
+
+    def _read(self) -> None:
+        with np.load(self._path, allow_pickle=False) as archive:
+            columns = {name: archive[name] for name in archive.files}
+        if int(columns["format_version"]) != _SUBJECTS_FORMAT_VERSION:
+            raise ValueError(
+                f"{self._path} is subject sidecar format "
+                f"{int(columns['format_version'])}, but this version of "
+                f"shedding_hub reads format {_SUBJECTS_FORMAT_VERSION}. Rebuild "
+                "it with `make catalog`."
+            )
+        columns["index"] = json.loads(columns["index"].tobytes())
+        columns["subject_ids"] = json.loads(columns["subject_ids"].tobytes())
+        self._positions = {
+            (entry["dataset_id"], entry["analyte"], entry["model"]): position
+            for position, entry in enumerate(columns["index"])
+        }
+        self._columns = columns
+
+
+def _subject_store(path: str | None) -> _SubjectStore:
+    """The sidecar of the catalog at ``path``, shared while its file is unchanged."""
+    sidecar = (
+        pathlib.Path(path).with_suffix(".subjects.npz")
+        if path
+        else CATALOG_SUBJECTS_PATH
+    )
+    if not sidecar.is_file():
+        raise FileNotFoundError(
+            f"No per-subject sidecar at {sidecar}. Run `make catalog` to build it."
+        )
+    key = ("subjects", _file_stamp(sidecar))
+    store = _CATALOG_CACHE.get(key)
+    if store is None:
+        store = _CATALOG_CACHE[key] = _SubjectStore(sidecar)
+    return store
+
+
+# Bumped whenever the layout ``write_binary_catalog`` writes changes. A binary
+# of any other version is ignored by the default load, which falls back to the
+# YAML, and refused when named explicitly.
+_BINARY_FORMAT_VERSION = 1
+
+
+class _LazyFits(_DeferredFits):
+    """
+    A binary catalog's fits, each built from its columns on first access.
+
+    Behaves as the list of fits a YAML catalog holds. Indexing or iterating
+    builds only the fits reached, and each is built once, so a caller that
+    needs three fits of 144 pays for three.
+    """
+
+    def __init__(self, columns: dict):
+        super().__init__(len(columns["model"]))
+        self._columns = columns
+        self._fields: dict[str, list] | None = None
+
+    def _decoded(self) -> dict[str, list]:
+        if self._fields is None:
+            self._fields = json.loads(self._columns["fields"].tobytes())
+        return self._fields
+
+    def _build(self, row: int) -> SheddingFit:
+        k = int(self._columns["n_params"][row])
+        payload = {name: values[row] for name, values in self._decoded().items()}
+        payload["population_mean"] = self._columns["population_mean"][row, :k]
+        payload["population_cov"] = self._columns["population_cov"][row, :k, :k]
+        return _fit_from_payload(payload)
+
+    def _source_key_values(self, key: str) -> list | None:
+        # The identifying string columns and the decoded fields hold every key
+        # column as the fit would, so indexing a binary catalog builds no fits.
+        if key in ("dataset_id", "analyte", "model"):
+            return self._columns[key].tolist()
+        return self._decoded().get(key)
+
+    def stored_ranking(self) -> dict | None:
+        """The ranking ``shedding_select`` stored with the catalog, if any."""
+        if "ranking" not in self._columns or self.version:
+            return None
+        return json.loads(self._columns["ranking"].tobytes())
+
+    def __repr__(self) -> str:
+        return f"<{len(self)} fits, {sum(f is not None for f in self._fits)} built>"
+
+
+def _load_binary_catalog(path: pathlib.Path) -> SheddingCatalog:
+    # Every member is read here and the archive closed: NumPy cannot map the
+    # members of an .npz, and the arrays are small. What is deferred is the
+    # expensive part -- decoding the records and building each SheddingFit.
+    with np.load(path, allow_pickle=False) as archive:
+        columns = {name: archive[name] for name in archive.files}
+    if int(columns["format_version"]) != _BINARY_FORMAT_VERSION:
+        raise ValueError(
+            f"{path} is binary catalog format {int(columns['format_version'])}, "
+            f"but this version of shedding_hub reads format "
+            f"{_BINARY_FORMAT_VERSION}. Rebuild it with `make catalog`."
+        )
+    skipped = pd.DataFrame(
+        json.loads(columns["skipped"].tobytes()),
+        columns=["dataset_id", "analyte", "model", "reason", "message"],
+    )
+    return SheddingCatalog(fits=_LazyFits(columns), skipped=skipped)
+
+
+def _binary_is_current(binary: pathlib.Path, source: pathlib.Path) -> bool:
+    """Whether ``binary`` was written from ``source`` exactly as it now reads."""
+    if not (binary.is_file() and source.is_file()):
+        return False
+    with np.load(binary, allow_pickle=False) as archive:
+        if int(archive["format_version"]) != _BINARY_FORMAT_VERSION:
+            return False
+        recorded = str(archive["source_sha256"])
+    return recorded == _file_digest(source)
+
+
+def _json_bytes(value) -> np.ndarray:
+    """``value`` as UTF-8 JSON in a byte array; a str array would be UTF-32."""
+    return np.frombuffer(json.dumps(value).encode("utf-8"), dtype=np.uint8)
+
+
+def _file_digest(path: pathlib.Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
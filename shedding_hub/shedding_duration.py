@@ -7,6 +7,8 @@ from matplotlib.lines import Line2D
 from matplotlib.figure import Figure
 import logging
 
+from .measurements import to_measurement_table
+
 # Constants
 DEFAULT_BIOMARKER = "SARS-CoV-2"
 DEFAULT_FIGURE_SIZE = (8, 6)
@@ -34,7 +36,9 @@ def calc_shedding_duration(
             individual: Individual shedding duration by biomarker, specimen, and reference event. This is used for plot_shedding_duration function.
 
     Returns:
-        DataFrame of shedding duration either summary or individual.
+        DataFrame of shedding duration either summary or individual. Times
+        are floats, and a detection time with no positive measurement behind
+        it is NaN.
 
     Raises:
         ValueError: If dataset is missing required keys or is empty.
@@ -74,49 +78,26 @@ def calc_shedding_duration(
         ]
     )
 
-    # extract participant and measurement data from the standardized shedding data loaded
-    shedding_duration_data = []
-    for participant_id, item in enumerate(dataset["participants"], 1):
-        for name, group in pd.DataFrame.from_dict(item["measurements"]).groupby(
-            "analyte"
-        ):
-            # filter the group by time not unknown
-            group = group[group["time"] != "unknown"].copy()
-
-            # Skip if no valid data after filtering
-            if group.empty:
-                continue
-
-            # format time to numeric
-            group["time"] = pd.to_numeric(group["time"], errors="raise")
-
-            # Skip if no valid numeric times
-            if group["time"].isna().all():
-                continue
-
-            # Calculate detection times, handling cases where no positive values exist
-            positive_values = group[group["value"] != NEGATIVE_VALUE]
-            first_detect = (
-                positive_values["time"].min() if not positive_values.empty else pd.NA
-            )
-            last_detect = (
-                positive_values["time"].max() if not positive_values.empty else pd.NA
-            )
-
-            row_new = {
-                "dataset_id": dataset["dataset_id"],
-                "participant_id": participant_id,
-                "analyte": name,
-                "n_sample": group["value"].count(),
-                "first_sample": group["time"].min(),
-                "last_sample": group["time"].max(),
-                "first_detect": first_detect,
-                "last_detect": last_detect,
-            }
-            shedding_duration_data.append(row_new)
-
-    # create dataframe from list
-    df_shedding_duration = pd.DataFrame(shedding_duration_data)
+    # extract participant and measurement data from the shared measurement table,
+    # dropping measurements whose time is unknown
+    measurements = to_measurement_table(dataset).to_frame()
+    measurements = measurements[measurements["time_num"].notna()]
+    keys = [measurements["participant_id"], measurements["analyte"]]
+    sampled = measurements["time_num"].groupby(keys)
+    detected = measurements["time_num"].where(measurements["is_positive"]).groupby(keys)
+
+    # one row per participant and analyte, with NaN detection times where no
+    # measurement was positive
+    df_shedding_duration = pd.DataFrame(
+        {
+            "n_sample": sampled.size(),
+            "first_sample": sampled.min(),
+            "last_sample": sampled.max(),
+            "first_detect": detected.min(),
+            "last_detect": detected.max(),
+        }
+    ).reset_index()
+    df_shedding_duration.insert(0, "dataset_id", dataset["dataset_id"])
 
     # Return empty DataFrame if no data
     if df_shedding_duration.empty:
@@ -318,13 +299,13 @@ def calc_shedding_durations(
     if not dataset_ids:
         raise ValueError("dataset_ids cannot be empty")
 
+    logger.info(f"Loading the data: {', '.join(dataset_ids)}")
     loaded_datasets = []
-    for dataset_id in dataset_ids:
-        logger.info(f"Loading the data: {dataset_id}")
+    for dataset in sh.load_datasets(dataset_ids):
+        if isinstance(dataset, Exception):
+            raise dataset
         loaded_datasets.append(
-            calc_shedding_duration(
-                dataset=sh.load_dataset(dataset=dataset_id), output="summary"
-            )
+            calc_shedding_duration(dataset=dataset, output="summary")
         )
 
     df_shedding_durations = pd.concat(loaded_datasets, ignore_index=True)
@@ -426,11 +426,7 @@ def build_ensemble(
     Returns:
         A ``SheddingEnsemble``.
     """
-    matches = [
-        fit
-        for fit in catalog.fits
-        if all(getattr(fit, key, None) == value for key, value in keys.items())
-    ]
+    matches = catalog.matching(**keys)
     if dataset_ids is not None:
         requested = list(dataset_ids)
         available = {fit.dataset_id for fit in matches}
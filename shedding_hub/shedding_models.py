@@ -14,6 +14,11 @@ expressed on the log10 scale, which is the scale likelihoods are evaluated on:
 
 This module is pure math: no dataset handling, no I/O.
 
+The per-observation kernels have two interchangeable implementations, chosen by
+a ``backend`` argument: ``"numpy"``, always available, and ``"jit"``, the same
+loops compiled by Numba when it is installed. ``"auto"`` takes the second when
+it can. See ``resolve_backend``.
+
 Examples:
     >>> import shedding_hub as sh
     >>> sh.MODELS
@@ -22,6 +27,10 @@ Examples:
     ('a0', 'b0', 'c0')
 """
 
+import functools
+import importlib.util
+import math
+
 import numpy as np
 
 MODELS = ("exponential", "gamma", "gamma_shifted")
@@ -84,6 +93,59 @@ def validate_model(model: str) -> None:
         raise ValueError(f"Unknown model {model!r}. Choose one of {list(MODELS)}.")
 
 
+BACKENDS = ("auto", "numpy", "jit")
+
+
+def resolve_backend(backend: str) -> str:
+    """
+    The kernel implementation ``backend`` selects: ``"numpy"`` or ``"jit"``.
+
+    Numba is an optional dependency, so ``"auto"`` resolves to ``"jit"`` only
+    when it is installed. Naming ``"jit"`` without it raises rather than
+    quietly running NumPy, so a benchmark cannot measure the wrong thing.
+
+    Examples:
+        >>> from shedding_hub.shedding_models import resolve_backend
+        >>> resolve_backend('numpy')
+        'numpy'
+    """
+    if backend == "numpy":
+        return backend
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown backend {backend!r}. Choose one of {list(BACKENDS)}."
+        )
+    available = _numba_available()
+    if backend == "auto":
+        return "jit" if available else "numpy"
+    if backend == "jit" and not available:
+        raise ImportError(
+            "backend='jit' needs numba, which is not installed. Install it, or "
+            "pass backend='auto' to use it only where it is present."
+        )
+    return backend
+
+
+@functools.cache
+def _numba_available() -> bool:
+    """Whether Numba can be imported, looked up once per process."""
+    return importlib.util.find_spec("numba") is not None
+
+
+@functools.cache
+def jit_compile(function):
+    """
+    ``function`` compiled by Numba, once per process.
+
+    Numba is imported here rather than at module level: importing it costs
+    more than most fits, and a NumPy-only session should never pay it.
+    Compilation itself is lazy, on the first call with each argument type.
+    """
+    import numba
+
+    return numba.njit(function)
+
+
 def _safe_log(times: np.ndarray) -> np.ndarray:
     """Natural log of ``times``, NaN where ``times <= 0``."""
     positive = times > 0
@@ -144,7 +206,7 @@ def log10_concentration_rowwise(
 
 
 def log10_concentration_pointwise(
-    model: str, params: np.ndarray, times: np.ndarray
+    model: str, params: np.ndarray, times: np.ndarray, *, backend: str = "numpy"
 ) -> np.ndarray:
     """
     Evaluate the model once per observation.
@@ -154,6 +216,8 @@ def log10_concentration_pointwise(
         params: Natural-scale parameters, shape ``(n_obs, k)`` — row ``j`` holds
             the parameters of the subject that observation ``j`` belongs to.
         times: Observation times, shape ``(n_obs,)``.
+        backend: ``"numpy"``, ``"jit"`` or ``"auto"``; see
+            ``resolve_backend``. Both implementations return the same values.
 
     Returns:
         Log10 concentrations, shape ``(n_obs,)``.
@@ -161,6 +225,14 @@ def log10_concentration_pointwise(
     validate_model(model)
     params = np.atleast_2d(np.asarray(params, dtype=float))
     times = np.asarray(times, dtype=float)
+    if resolve_backend(backend) == "jit":
+        n_obs = max(params.shape[0], times.size)
+        return jit_compile(_log10_concentration_loop)(
+            MODELS.index(model),
+            np.ascontiguousarray(np.broadcast_to(params, (n_obs, params.shape[1]))),
+            np.ascontiguousarray(np.broadcast_to(times, (n_obs,))),
+            np.empty(n_obs),
+        )
     if model == "exponential":
         return (params[:, 1] - params[:, 0] * times) / LN10
     if model == "gamma_shifted":
@@ -170,6 +242,68 @@ def log10_concentration_pointwise(
     ) / LN10
 
 
+def _log10_concentration_loop(
+    code: int, params: np.ndarray, times: np.ndarray, out: np.ndarray
+) -> np.ndarray:
+    """
+    ``log10_concentration_pointwise`` one observation at a time.
+
+    Written as scalar math so Numba can compile it; ``code`` is the model's
+    position in ``MODELS``. The operations run in the NumPy path's order, so
+    the two agree exactly.
+    """
+    for j in range(times.shape[0]):
+        a0 = params[j, 0]
+        t = times[j]
+        if code == 0:
+            out[j] = (params[j, 1] - a0 * t) / LN10
+            continue
+        if code == 2:
+            t = t - params[j, 3]
+        log_t = math.log(t) if t > 0 else math.nan
+        out[j] = (params[j, 2] + params[j, 1] * log_t - a0 * t) / LN10
+    return out
+
+
+def log10_concentration_pointwise_gradient(
+    model: str, params: np.ndarray, times: np.ndarray
+) -> np.ndarray:
+    """
+    Derivative of ``log10_concentration_pointwise`` with respect to ``theta``.
+
+    Taken through ``theta_to_params``, because ``theta`` is what the fitter
+    optimizes: for the log-scale parameters ``d/d theta = param * d/d param``,
+    while ``gamma_shifted``'s untransformed ``t0`` is differentiated directly.
+
+    Args:
+        model: ``"exponential"``, ``"gamma"`` or ``"gamma_shifted"``.
+        params: Natural-scale parameters, shape ``(n_obs, k)`` — row ``j`` holds
+            the parameters of the subject that observation ``j`` belongs to.
+        times: Observation times, shape ``(n_obs,)``.
+
+    Returns:
+        Partial derivatives, shape ``(n_obs, k)``, ordered as
+        ``PARAM_NAMES[model]``. NaN wherever the model itself is undefined.
+    """
+    validate_model(model)
+    params = np.atleast_2d(np.asarray(params, dtype=float))
+    times = np.asarray(times, dtype=float)
+    a0 = params[:, 0]
+    if model == "exponential":
+        return np.column_stack([-a0 * times, params[:, 1]]) / LN10
+    b0 = params[:, 1]
+    c0 = params[:, 2]
+    if model == "gamma_shifted":
+        times = times - params[:, 3]
+    log_times = _safe_log(times)
+    columns = [-a0 * times, b0 * log_times, c0]
+    if model == "gamma_shifted":
+        # Moving the onset later shortens the elapsed time, so the sign flips
+        # relative to d/dt: -(b0 / (t - t0) - a0).
+        columns.append(a0 - b0 / np.where(times > 0, times, np.nan))
+    return np.column_stack(columns) / LN10
+
+
 def theta_to_params(model: str, theta: np.ndarray) -> np.ndarray:
     """
     Map the optimizer's unconstrained coordinates to natural parameters.
@@ -8,6 +8,8 @@ from matplotlib.figure import Figure
 import logging
 import numpy as np
 
+from .measurements import to_measurement_table
+
 # Constants
 DEFAULT_BIOMARKER = "SARS-CoV-2"
 DEFAULT_FIGURE_SIZE = (8, 6)
@@ -35,7 +37,8 @@ def calc_shedding_peak(
             summary: Summary table of shedding peak (min, max, mean) by biomarker and specimen.
 
     Returns:
-        DataFrame of shedding peak either individual or summary.
+        DataFrame of shedding peak either individual or summary. Times are
+        floats, NaN where a group has no numeric time.
 
     Raises:
         ValueError: If dataset is missing required keys or is empty.
@@ -73,71 +76,51 @@ def calc_shedding_peak(
         ]
     )
 
-    # map analyte -> unit for per-analyte decision when computing peak
-    analyte_unit_map = {
-        row["analyte"]: row.get("unit") for _, row in df_analyte.iterrows()
-    }
+    # extract participant and measurement data from the shared measurement table
+    table = to_measurement_table(dataset)
+    measurements = table.to_frame()
+    keys = ["participant_id", "analyte"]
+    sampled = measurements.groupby(keys)["time_num"]
 
-    # extract participant and measurement data from the standardized shedding data loaded
-    shedding_peak_data = []
-    for participant_id, item in enumerate(dataset["participants"], 1):
-        meas = pd.DataFrame.from_dict(item["measurements"])
-        if meas.empty:
-            continue
-
-        for name, group in meas.groupby("analyte"):
-            # coerce values to numeric where possible (handle numeric strings); drop non-numeric rows
-            g = group.copy()
-            g["value_num"] = pd.to_numeric(g["value"], errors="coerce")
-            g = g.dropna(subset=["value_num"])
-            if g.empty:
-                continue
-
-            # coerce time to numeric for selection and for first/last calculations
-            g["time_num"] = pd.to_numeric(g["time"], errors="coerce")
-            # if all times are NA, skip
-            if g["time_num"].isna().all():
-                continue
-
-            # decide whether to pick min (cycle threshold) or max (other units)
-            unit = analyte_unit_map.get(name)
-            pick_min = (
-                isinstance(unit, str) and unit.strip().lower() == "cycle threshold"
-            )
+    # decide per analyte whether to pick min (cycle threshold) or max (other units)
+    pick_min = np.array(
+        [
+            isinstance(unit, str) and unit.strip().lower() == "cycle threshold"
+            for unit in table.analyte_metadata["unit"]
+        ]
+        + [False]
+    )[table.analyte_code]
+
+    # select the first row of interest among rows with numeric values only; groups
+    # without any are dropped by the groupby
+    quantified = measurements[measurements["value_num"].notna()]
+    score = quantified["value_num"].where(
+        ~pick_min[quantified.index], -quantified["value_num"]
+    )
+    selected = score.groupby([quantified[key] for key in keys]).idxmax()
 
-            # select index of interest using rows with numeric values only
-            if pick_min:
-                sel_idx = g["value_num"].idxmin()
-            else:
-                sel_idx = g["value_num"].idxmax()
-
-            # get shedding_peak time from the selected row (use numeric-coerced time)
-            shedding_peak_time = g.loc[sel_idx, "time_num"]
-            if pd.isna(shedding_peak_time):
-                # skip if selected peak time is NA
-                continue
-
-            # compute first/last sample using numeric times (exclude non-numeric / 'unknown')
-            times_num = pd.to_numeric(group["time"], errors="coerce")
-            valid_times = times_num.loc[times_num.notna()]
-
-            # keep NA (np.nan) if there is no numeric time entry for this group
-            first_sample = valid_times.min() if not valid_times.empty else np.nan
-            last_sample = valid_times.max() if not valid_times.empty else np.nan
-
-            row_new = {
-                "dataset_id": dataset["dataset_id"],
-                "participant_id": participant_id,
-                "analyte": name,
-                "n_sample": group["value"].count(),
-                "first_sample": first_sample,
-                "last_sample": last_sample,
-                "shedding_peak": shedding_peak_time,
+    # get shedding_peak time from the selected row and skip groups where it is NA;
+    # first/last sample use every numeric time of the group, NaN if there is none
+    df_shedding_peak = (
+        pd.DataFrame(
+            {
+                "n_sample": sampled.size(),
+                "first_sample": sampled.min(),
+                "last_sample": sampled.max(),
             }
-            shedding_peak_data.append(row_new)
-
-    # create dataframe from list
-    df_shedding_peak = pd.DataFrame(shedding_peak_data)
+        )
+        .join(
+            pd.Series(
+                measurements.loc[selected.to_numpy(), "time_num"].to_numpy(),
+                index=selected.index,
+                name="shedding_peak",
+            ),
+            how="inner",
+        )
+        .dropna(subset=["shedding_peak"])
+        .reset_index()
+    )
+    df_shedding_peak.insert(0, "dataset_id", dataset["dataset_id"])
 
     # Return empty DataFrame if no data
     if df_shedding_peak.empty:
@@ -356,14 +339,12 @@ def calc_shedding_peaks(
     if not dataset_ids:
         raise ValueError("dataset_ids cannot be empty")
 
+    logger.info(f"Loading the data: {', '.join(dataset_ids)}")
     loaded_datasets = []
-    for dataset_id in dataset_ids:
-        logger.info(f"Loading the data: {dataset_id}")
-        loaded_datasets.append(
-            calc_shedding_peak(
-                dataset=sh.load_dataset(dataset=dataset_id), output="summary"
-            )
-        )
+    for dataset in sh.load_datasets(dataset_ids):
+        if isinstance(dataset, Exception):
+            raise dataset
+        loaded_datasets.append(calc_shedding_peak(dataset=dataset, output="summary"))
 
     df_shedding_peaks = pd.concat(loaded_datasets, ignore_index=True)
 
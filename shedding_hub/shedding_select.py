@@ -19,11 +19,13 @@ Examples:
     ['confirmation date', 'enrollment', 'hospital admission']
 """
 
+import copy
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 import pandas as pd
 
-from .shedding_catalog import SheddingCatalog, load_shedding_catalog
+from .shedding_catalog import SheddingCatalog, _shared_catalog
 
 # Reference events are not all the same kind of thing, and the difference decides
 # whether ``simulate_shedding``'s incubation shift means anything. An 'exposure'
@@ -131,11 +133,7 @@ def _rank_key(row) -> tuple:
 
 
 def _matching_fits(catalog: SheddingCatalog, keys: dict) -> list:
-    return [
-        fit
-        for fit in catalog.fits
-        if all(getattr(fit, key, None) == value for key, value in keys.items())
-    ]
+    return catalog.matching(**keys)
 
 
 def _grouped(fits: list) -> dict:
@@ -150,6 +148,148 @@ def _grouped(fits: list) -> dict:
     }
 
 
+_OPTIONS_COLUMNS = [
+    "biomarker",
+    "specimen",
+    "reference_event",
+    "event_class",
+    "unit",
+    "value_type",
+    "n_unit_studies",
+    "model",
+    "n_studies",
+    "n_subjects",
+    "n_measurements",
+    "rank",
+]
+
+# The keys a stored ranking can answer by filtering. Rule 2 counts studies per
+# unit within one biomarker and specimen, so dropping whole (biomarker, specimen)
+# slices leaves every other row's counts as they were; filtering on any other key
+# would change the counts, and those queries are ranked from their matches.
+_RANKING_FILTER_KEYS = ("biomarker", "specimen")
+
+# Bumped whenever the ranking rules change, so a ranking stored with a binary
+# catalog by an older version of them is recomputed rather than trusted.
+_RANKING_VERSION = 1
+
+
+def _rank(fits: Sequence) -> tuple[pd.DataFrame, list[list[int]]]:
+    """
+    Every group among ``fits``, best first, and what each is built from.
+
+    Returns the options table for ``fits`` and, per row, the positions in
+    ``fits`` of the one-per-study components ``shedding_for`` would ensemble.
+    """
+    # Rule 2's input: how many distinct studies report each unit, counted within
+    # one biomarker and specimen. Scoped that way because units are only
+    # commensurable there -- counting a unit across the whole candidate set would
+    # let gc/mL's SARS-CoV-2 studies decide a rotavirus vaccine row, and would make
+    # a group's rank depend on what else the caller happened to leave unfiltered.
+    studies_by_unit = {}
+    for fit in fits:
+        signature = (
+            _sortable(fit.biomarker),
+            _sortable(fit.specimen),
+            _sortable(fit.unit),
+        )
+        studies_by_unit.setdefault(signature, set()).add(fit.dataset_id)
+
+    positions = {id(fit): position for position, fit in enumerate(fits)}
+    rows = []
+    for signature, group in _grouped(fits).items():
+        row = dict(zip(_GROUP_KEYS, signature))
+        row["event_class"] = classify_reference_event(row["reference_event"])
+        row["n_unit_studies"] = len(
+            studies_by_unit[
+                (
+                    _sortable(row["biomarker"]),
+                    _sortable(row["specimen"]),
+                    _sortable(row["unit"]),
+                )
+            ]
+        )
+        row["n_studies"] = len(group)
+        row["n_subjects"] = sum(fit.n_subjects for fit in group)
+        row["n_measurements"] = sum(fit.n_measurements for fit in group)
+        row["components"] = [positions[id(fit)] for fit in group]
+        rows.append(row)
+
+    rows.sort(key=_rank_key)
+    components = [row.pop("components") for row in rows]
+    frame = pd.DataFrame(rows, columns=[c for c in _OPTIONS_COLUMNS if c != "rank"])
+    frame["rank"] = range(1, len(frame) + 1)
+    return frame[_OPTIONS_COLUMNS], components
+
+
+def _ranking_payload(catalog: SheddingCatalog) -> dict:
+    """The catalog's ranking as plain types, as ``write_binary_catalog`` stores it."""
+    frame, components = _ranking(catalog)
+    return {
+        "version": _RANKING_VERSION,
+        "rows": frame.to_dict(orient="records"),
+        "components": components,
+    }
+
+
+def _ranking(catalog: SheddingCatalog) -> tuple[pd.DataFrame, list[list[int]]]:
+    """``_rank`` over the whole catalog, computed once per catalog."""
+
+    def build():
+        stored = getattr(catalog.fits, "stored_ranking", lambda: None)()
+        if stored is not None and stored["version"] == _RANKING_VERSION:
+            frame = pd.DataFrame(stored["rows"], columns=_OPTIONS_COLUMNS)
+            return frame, stored["components"]
+        return _rank(catalog.fits)
+
+    return catalog._derived("ranking", build)
+
+
+def _options(catalog: SheddingCatalog, keys: dict) -> tuple[pd.DataFrame, list]:
+    """
+    ``shedding_options``' table for ``keys``, and each row's component fits.
+
+    The components come back as a list of fit lists built only when read, so
+    answering from a binary catalog's stored ranking builds no fit the caller
+    does not use.
+    """
+    if set(keys) <= set(_RANKING_FILTER_KEYS):
+        # The ranking is sorted by a total order, so any subset of its rows is
+        # already in rank order; only the numbering has to be redone.
+        frame, components = _ranking(catalog)
+        selected = [
+            position
+            for position, row in enumerate(
+                zip(*(frame[key] for key in keys)) if keys else [()] * len(frame)
+            )
+            if list(row) == list(keys.values())
+        ]
+        frame = frame.iloc[selected].reset_index(drop=True)
+        frame["rank"] = range(1, len(frame) + 1)
+        return frame, _Components(
+            catalog.fits, [components[position] for position in selected]
+        )
+    matches = _matching_fits(catalog, keys)
+    frame, components = _rank(matches)
+    return frame, _Components(matches, components)
+
+
+class _Components(Sequence):
+    """Each option's component fits, looked up in ``fits`` when indexed."""
+
+    def __init__(self, fits: Sequence, positions: list[list[int]]):
+        self._fits = fits
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return [self._fits[position] for position in self._positions[index]]
+
+
 def shedding_options(
     biomarker=None,
     specimen=None,
@@ -169,7 +309,8 @@ def shedding_options(
         biomarker (str | None): e.g. ``"SARS-CoV-2"``. Positional, matching
             ``shedding_for``.
         specimen (str | None): e.g. ``"stool"``.
-        catalog: Catalog to search. Defaults to the shipped one.
+        catalog: Catalog to search. Defaults to the shipped one, read once
+            per process as ``load_shedding_catalog`` caches it.
         **keys (Any): Further attribute filters, e.g. ``model="gamma"``.
 
     Returns:
@@ -192,65 +333,16 @@ def shedding_options(
     if specimen is not None:
         keys["specimen"] = specimen
 
-    catalog = load_shedding_catalog() if catalog is None else catalog
-    matches = _matching_fits(catalog, keys)
-    if not matches:
+    # The process-wide cached catalog, read in place: nothing here mutates it,
+    # and the frame returned is built fresh.
+    catalog = _shared_catalog() if catalog is None else catalog
+    frame, _ = _options(catalog, keys)
+    if frame.empty:
         raise ValueError(
             f"No fits match {keys}. Browse `catalog.table` for available "
             "combinations, or call shedding_options() with fewer keys."
         )
-
-    # Rule 2's input: how many distinct studies report each unit, counted within
-    # one biomarker and specimen. Scoped that way because units are only
-    # commensurable there -- counting a unit across the whole candidate set would
-    # let gc/mL's SARS-CoV-2 studies decide a rotavirus vaccine row, and would make
-    # a group's rank depend on what else the caller happened to leave unfiltered.
-    studies_by_unit = {}
-    for fit in matches:
-        signature = (
-            _sortable(fit.biomarker),
-            _sortable(fit.specimen),
-            _sortable(fit.unit),
-        )
-        studies_by_unit.setdefault(signature, set()).add(fit.dataset_id)
-
-    rows = []
-    for signature, group in _grouped(matches).items():
-        row = dict(zip(_GROUP_KEYS, signature))
-        row["event_class"] = classify_reference_event(row["reference_event"])
-        row["n_unit_studies"] = len(
-            studies_by_unit[
-                (
-                    _sortable(row["biomarker"]),
-                    _sortable(row["specimen"]),
-                    _sortable(row["unit"]),
-                )
-            ]
-        )
-        row["n_studies"] = len(group)
-        row["n_subjects"] = sum(fit.n_subjects for fit in group)
-        row["n_measurements"] = sum(fit.n_measurements for fit in group)
-        rows.append(row)
-
-    rows.sort(key=_rank_key)
-    frame = pd.DataFrame(rows)
-    frame["rank"] = range(1, len(frame) + 1)
-    return frame[
-        [
-            "biomarker",
-            "specimen",
-            "reference_event",
-            "event_class",
-            "unit",
-            "value_type",
-            "n_unit_studies",
-            "model",
-            "n_studies",
-            "n_subjects",
-            "n_measurements",
-            "rank",
-        ]
-    ]
+    return frame
 
 
 @dataclass
@@ -339,7 +431,8 @@ def shedding_for(
             it will usually leave candidates from different biomarkers to
             rank against one another.
         specimen (str | None): e.g. ``"stool"``.
-        catalog: Catalog to choose from. Defaults to the shipped one.
+        catalog: Catalog to choose from. Defaults to the shipped one, read
+            once per process as ``load_shedding_catalog`` caches it.
         weights (str | Sequence[float]): Passed to ``make_ensemble``. An
             explicit array is applied in component order, which is by
             ``dataset_id`` -- see ``ensemble.components``.
@@ -361,30 +454,96 @@ def shedding_for(
         >>> source.selection.reason
         'its model resolves the rise'
     """
-    from .shedding_ensemble import make_ensemble
-
     if biomarker is not None:
         keys["biomarker"] = biomarker
     if specimen is not None:
         keys["specimen"] = specimen
 
-    catalog = load_shedding_catalog() if catalog is None else catalog
-    options = shedding_options(catalog=catalog, **keys)
-    best = options.iloc[0]
-    runner_up = options.iloc[1] if len(options) > 1 else None
-
-    groups = _grouped(_matching_fits(catalog, keys))
-    # Matched on the sortable form for the same reason _sortable exists at all:
-    # None and str do not compare, and both appear in these keys, so a group
-    # signature holding None must be compared in the normalised form rather than
-    # raw.
-    target = tuple(_sortable(best[key]) for key in _GROUP_KEYS)
-    components = next(
-        group
-        for signature, group in groups.items()
-        if tuple(_sortable(value) for value in signature) == target
+    shared = catalog is None
+    catalog = _shared_catalog() if shared else catalog
+    options, components = _options(catalog, keys)
+    if options.empty:
+        raise ValueError(
+            f"No fits match {keys}. Browse `catalog.table` for available "
+            "combinations, or call shedding_options() with fewer keys."
+        )
+    return _build_source(
+        options, components[0], weights=weights, method=method, copy_fits=shared
     )
 
+
+def shedding_for_many(
+    pairs,
+    *,
+    catalog: SheddingCatalog | None = None,
+    weights="n_subjects",
+    method: str = "mixture",
+) -> dict:
+    """
+    ``shedding_for`` for many biomarker and specimen pairs at once.
+
+    Every pair is answered from the catalog's stored ranking, so resolving the
+    sources a multi-pathogen configuration names costs one catalog load and
+    one ensemble per pair. Unlike calling ``shedding_for`` in a loop, every
+    pair that matches nothing is reported together.
+
+    Args:
+        pairs (Iterable[tuple[str, str]]): ``(biomarker, specimen)`` pairs.
+        catalog: Catalog to choose from. Defaults to the shipped one.
+        weights (str | Sequence[float]): Passed to ``make_ensemble`` for every
+            pair.
+        method: Passed to ``make_ensemble`` for every pair.
+
+    Returns:
+        A ``dict`` from each distinct pair, in the order given, to the
+        ``SheddingEnsemble`` ``shedding_for`` returns for it.
+
+    Raises:
+        ValueError: Naming every pair that matches no fit.
+
+    Examples:
+        >>> import shedding_hub as sh
+        >>> sources = sh.shedding_for_many(
+        ...     [('SARS-CoV-2', 'stool'), ('SARS-CoV-2', 'sputum')]
+        ... )
+        >>> sources['SARS-CoV-2', 'stool'].model
+        'gamma'
+    """
+    shared = catalog is None
+    catalog = _shared_catalog() if shared else catalog
+    sources, unmatched = {}, []
+    for biomarker, specimen in pairs:
+        if (biomarker, specimen) in sources:
+            continue
+        options, components = _options(
+            catalog, {"biomarker": biomarker, "specimen": specimen}
+        )
+        if options.empty:
+            unmatched.append((biomarker, specimen))
+            continue
+        sources[biomarker, specimen] = _build_source(
+            options, components[0], weights=weights, method=method, copy_fits=shared
+        )
+    if unmatched:
+        raise ValueError(
+            f"No fits match the (biomarker, specimen) pair(s) {unmatched}. "
+            "Browse `shedding_options()` for available combinations."
+        )
+    return sources
+
+
+def _build_source(
+    options: pd.DataFrame, components: list, *, weights, method, copy_fits: bool
+):
+    """The ensemble for ``options``' rank-1 row, with its ``Selection``."""
+    from .shedding_ensemble import make_ensemble
+
+    best = options.iloc[0]
+    runner_up = options.iloc[1] if len(options) > 1 else None
+    if copy_fits:
+        # The ensemble keeps its components, which must not be the cached fits
+        # a later call will read.
+        components = copy.deepcopy(components)
     ensemble = make_ensemble(components, weights=weights, method=method)
     ensemble.selection = Selection(
         picked={
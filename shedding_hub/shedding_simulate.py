@@ -14,6 +14,7 @@ import numpy as np
 import pandas as pd
 from matplotlib.figure import Figure
 
+from .measurements import to_measurement_table
 from .shedding_models import log10_concentration_rowwise
 from .shedding_select import classify_reference_event
 
@@ -388,16 +389,15 @@ def plot_simulated_shedding(
             analytes = {fit.analyte for fit in source.fits}
         else:
             analytes = {source.analyte}
-        times, values = [], []
-        for participant in observed.get("participants", []):
-            for measurement in participant.get("measurements") or []:
-                if measurement.get("analyte") not in analytes:
-                    continue
-                time = measurement.get("time")
-                value = measurement.get("value")
-                if isinstance(time, (int, float)) and isinstance(value, (int, float)):
-                    times.append(float(time))
-                    values.append(np.log10(float(value)))
+        table = to_measurement_table(observed)
+        codes = [code for code, name in enumerate(table.analytes) if name in analytes]
+        readings = (
+            np.isin(table.analyte_code, codes)
+            & ~np.isnan(table.time)
+            & ~np.isnan(table.value)
+        )
+        times = table.time[readings].tolist()
+        values = np.log10(table.value[readings]).tolist()
         if times:
             ax.scatter(times, values, s=18, color="black", alpha=0.5, label="Observed")
             finite = [value for value in values if np.isfinite(value)]
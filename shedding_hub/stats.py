@@ -3,6 +3,8 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any, Literal
 
+from .measurements import to_measurement_table
+
 # Constants
 NEGATIVE_VALUE = "negative"
 
@@ -70,29 +72,14 @@ def calc_shedding_summary(
     if not dataset["participants"]:
         raise ValueError("Dataset has no participants")
 
-    # Extract time series data from raw dataset
-    time_series_data = []
-    for participant_id, participant in enumerate(dataset["participants"], 1):
-        measurements = participant.get("measurements", [])
-        for measurement in measurements:
-            analyte_name = measurement.get("analyte")
-            time_series_data.append(
-                {
-                    "participant_id": participant_id,
-                    "time": measurement.get("time"),
-                    "value": measurement.get("value"),
-                    "analyte": analyte_name,
-                }
-            )
-
-    if not time_series_data:
+    # Typed measurements with analyte metadata joined, shared across calls
+    table = to_measurement_table(dataset)
+    if not len(table):
         raise ValueError("Dataset has no measurements")
 
-    df = pd.DataFrame(time_series_data)
-
-    # Convert time to numeric, filtering out "unknown" values
-    df = df[df["time"] != "unknown"].copy()
-    df["time_num"] = pd.to_numeric(df["time"], errors="coerce")
+    # Drop measurements whose time is "unknown"
+    df = table.to_frame()
+    df = df[df["time_num"].notna()]
 
     # Helper function to check if unit is CT value
     def _is_ct_value(unit: str | None) -> bool:
@@ -101,36 +88,12 @@ def calc_shedding_summary(
         unit_lower = str(unit).lower()
         return "ct" in unit_lower or "cycle" in unit_lower
 
-    # Join with analyte metadata
-    analyte_metadata = {}
-    for analyte_name, analyte_info in dataset["analytes"].items():
-        specimen_value = analyte_info.get("specimen")
-        if isinstance(specimen_value, list):
-            specimen_value = "+".join(specimen_value)
-
-        unit = analyte_info.get("unit")
-        value_type = "ct" if _is_ct_value(unit) else "concentration"
-
-        analyte_metadata[analyte_name] = {
-            "specimen": specimen_value,
-            "reference_event": analyte_info.get("reference_event"),
-            "biomarker": analyte_info.get("biomarker"),
-            "value_type": value_type,
-        }
-
-    # Add metadata to DataFrame
-    df["specimen"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("specimen")
-    )
-    df["reference_event"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("reference_event")
-    )
-    df["biomarker"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("biomarker")
-    )
-    df["value_type"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("value_type")
-    )
+    # Classify each analyte's unit once, then join the result onto its rows
+    value_types = {
+        name: "ct" if _is_ct_value(unit) else "concentration"
+        for name, unit in zip(table.analytes, table.analyte_metadata["unit"])
+    }
+    df["value_type"] = df["analyte"].map(value_types)
 
     # Filter by biomarker if specified
     if biomarker is not None:
@@ -150,12 +113,6 @@ def calc_shedding_summary(
     if df.empty:
         raise ValueError("No valid measurements found after filtering")
 
-    # Mark positive vs negative measurements
-    df["is_positive"] = df["value"] != NEGATIVE_VALUE
-
-    # Convert value to numeric for positive measurements
-    df["value_num"] = pd.to_numeric(df["value"], errors="coerce")
-
     # Calculate summary statistics for each participant and analyte combination
     summary_data = []
 
@@ -316,49 +273,14 @@ def calc_detection_summary(
     if not dataset["participants"]:
         raise ValueError("Dataset has no participants")
 
-    # Extract time series data from raw dataset
-    time_series_data = []
-    for participant_id, participant in enumerate(dataset["participants"], 1):
-        measurements = participant.get("measurements", [])
-        for measurement in measurements:
-            analyte_name = measurement.get("analyte")
-            time_series_data.append(
-                {
-                    "participant_id": participant_id,
-                    "time": measurement.get("time"),
-                    "value": measurement.get("value"),
-                    "analyte": analyte_name,
-                }
-            )
-
-    if not time_series_data:
+    # Typed measurements with analyte metadata joined, shared across calls
+    table = to_measurement_table(dataset)
+    if not len(table):
         raise ValueError("Dataset has no measurements")
 
-    df = pd.DataFrame(time_series_data)
-
-    # Convert time to numeric, filtering out "unknown" values
-    df = df[df["time"] != "unknown"].copy()
-    df["time_num"] = pd.to_numeric(df["time"], errors="coerce")
-
-    # Join with analyte metadata
-    analyte_metadata = {}
-    for analyte_name, analyte_info in dataset["analytes"].items():
-        specimen_value = analyte_info.get("specimen")
-        if isinstance(specimen_value, list):
-            specimen_value = "+".join(specimen_value)
-
-        analyte_metadata[analyte_name] = {
-            "specimen": specimen_value,
-            "biomarker": analyte_info.get("biomarker"),
-        }
-
-    # Add metadata to DataFrame
-    df["specimen"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("specimen")
-    )
-    df["biomarker"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("biomarker")
-    )
+    # Drop measurements whose time is "unknown"
+    df = table.to_frame()
+    df = df[df["time_num"].notna()]
 
     # Filter by biomarker if specified
     if biomarker is not None:
@@ -384,9 +306,6 @@ def calc_detection_summary(
         if df.empty:
             raise ValueError(f"No measurements found in time range {time_range}")
 
-    # Mark positive vs negative measurements
-    df["is_positive"] = df["value"] != NEGATIVE_VALUE
-
     # Create time bins centered at integers (or multiples of bin_size)
     time_min = df["time_num"].min()
     time_max = df["time_num"].max()
@@ -518,49 +437,14 @@ def calc_clearance_summary(
     if not dataset["participants"]:
         raise ValueError("Dataset has no participants")
 
-    # Extract time series data from raw dataset
-    time_series_data = []
-    for participant_id, participant in enumerate(dataset["participants"], 1):
-        measurements = participant.get("measurements", [])
-        for measurement in measurements:
-            analyte_name = measurement.get("analyte")
-            time_series_data.append(
-                {
-                    "participant_id": participant_id,
-                    "time": measurement.get("time"),
-                    "value": measurement.get("value"),
-                    "analyte": analyte_name,
-                }
-            )
-
-    if not time_series_data:
+    # Typed measurements with analyte metadata joined, shared across calls
+    table = to_measurement_table(dataset)
+    if not len(table):
         raise ValueError("Dataset has no measurements")
 
-    df = pd.DataFrame(time_series_data)
-
-    # Convert time to numeric, filtering out "unknown" values
-    df = df[df["time"] != "unknown"].copy()
-    df["time_num"] = pd.to_numeric(df["time"], errors="coerce")
-
-    # Join with analyte metadata
-    analyte_metadata = {}
-    for analyte_name, analyte_info in dataset["analytes"].items():
-        specimen_value = analyte_info.get("specimen")
-        if isinstance(specimen_value, list):
-            specimen_value = "+".join(specimen_value)
-
-        analyte_metadata[analyte_name] = {
-            "specimen": specimen_value,
-            "biomarker": analyte_info.get("biomarker"),
-        }
-
-    # Add metadata to DataFrame
-    df["specimen"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("specimen")
-    )
-    df["biomarker"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("biomarker")
-    )
+    # Drop measurements whose time is "unknown"
+    df = table.to_frame()
+    df = df[df["time_num"].notna()]
 
     # Filter by biomarker if specified
     if biomarker is not None:
@@ -580,9 +464,6 @@ def calc_clearance_summary(
     if df.empty:
         raise ValueError("No valid measurements found after filtering")
 
-    # Mark positive vs negative measurements
-    df["is_positive"] = df["value"] != NEGATIVE_VALUE
-
     # Calculate clearance time and censoring status for each participant
     clearance_data = []
     for participant_id, participant_df in df.groupby("participant_id"):
@@ -816,51 +697,14 @@ def calc_value_summary(
     if not dataset["participants"]:
         raise ValueError("Dataset has no participants")
 
-    # Extract time series data from raw dataset
-    time_series_data = []
-    for participant_id, participant in enumerate(dataset["participants"], 1):
-        measurements = participant.get("measurements", [])
-        for measurement in measurements:
-            analyte_name = measurement.get("analyte")
-            time_series_data.append(
-                {
-                    "participant_id": participant_id,
-                    "time": measurement.get("time"),
-                    "value": measurement.get("value"),
-                    "analyte": analyte_name,
-                }
-            )
-
-    if not time_series_data:
+    # Typed measurements with analyte metadata joined, shared across calls
+    table = to_measurement_table(dataset)
+    if not len(table):
         raise ValueError("Dataset has no measurements")
 
-    df = pd.DataFrame(time_series_data)
-
-    # Convert time to numeric, filtering out "unknown" values
-    df = df[df["time"] != "unknown"].copy()
-    df["time_num"] = pd.to_numeric(df["time"], errors="coerce")
-
-    # Join with analyte metadata
-    analyte_metadata = {}
-    for analyte_name, analyte_info in dataset["analytes"].items():
-        specimen_value = analyte_info.get("specimen")
-        if isinstance(specimen_value, list):
-            specimen_value = "+".join(specimen_value)
-
-        analyte_metadata[analyte_name] = {
-            "specimen": specimen_value,
-            "unit": analyte_info.get("unit"),
-            "biomarker": analyte_info.get("biomarker"),
-        }
-
-    # Add metadata to DataFrame
-    df["specimen"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("specimen")
-    )
-    df["unit"] = df["analyte"].map(lambda x: analyte_metadata.get(x, {}).get("unit"))
-    df["biomarker"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("biomarker")
-    )
+    # Drop measurements whose time is "unknown"
+    df = table.to_frame()
+    df = df[df["time_num"].notna()]
 
     # Filter by biomarker if specified
     if biomarker is not None:
@@ -906,8 +750,7 @@ def calc_value_summary(
         )
 
     # Exclude negative values
-    df = df[df["value"] != NEGATIVE_VALUE].copy()
-    df["value_num"] = pd.to_numeric(df["value"], errors="coerce")
+    df = df[df["is_positive"]].copy()
 
     # Drop rows with NaN time or value
     df = df.dropna(subset=["time_num", "value_num"])
@@ -1086,32 +929,15 @@ def calc_dataset_summary(
     analyte_df = pd.DataFrame(analyte_details)
 
     # Count measurements and extract time range
-    n_measurements = 0
-    times = []
-    n_positive = 0
-    n_negative = 0
-
-    for participant in dataset["participants"]:
-        measurements = participant.get("measurements", [])
-        n_measurements += len(measurements)
-
-        for m in measurements:
-            time_val = m.get("time")
-            if time_val != "unknown":
-                try:
-                    times.append(float(time_val))
-                except (ValueError, TypeError):
-                    pass
-
-            value = m.get("value")
-            if value == NEGATIVE_VALUE:
-                n_negative += 1
-            else:
-                n_positive += 1
+    table = to_measurement_table(dataset)
+    n_measurements = len(table)
+    n_negative = int(table.censored.sum())
+    n_positive = n_measurements - n_negative
+    times = table.time[~np.isnan(table.time)]
 
     # Calculate time range
-    if times:
-        time_range = (min(times), max(times))
+    if times.size:
+        time_range = (float(times.min()), float(times.max()))
     else:
         time_range = (None, None)
 
@@ -7,6 +7,7 @@ from matplotlib.figure import Figure
 from matplotlib.ticker import FuncFormatter
 import logging
 
+from .measurements import to_measurement_table
 from .shedding_models import log10_concentration
 from .shedding_fit import (
     CT_REFERENCE,
@@ -123,69 +124,14 @@ def plot_time_course(
     if not dataset["participants"]:
         raise ValueError("Dataset has no participants")
 
-    # Extract time series data from raw dataset
-    time_series_data = []
-    for participant_id, participant in enumerate(dataset["participants"], 1):
-        measurements = participant.get("measurements", [])
-        for measurement in measurements:
-            analyte_name = measurement.get("analyte")
-            time_series_data.append(
-                {
-                    "participant_id": participant_id,
-                    "time": measurement.get("time"),
-                    "value": measurement.get("value"),
-                    "analyte": analyte_name,
-                }
-            )
-
-    if not time_series_data:
+    # Typed measurements with analyte metadata joined, shared across calls
+    table = to_measurement_table(dataset)
+    if not len(table):
         raise ValueError("Dataset has no measurements")
 
-    df = pd.DataFrame(time_series_data)
-
-    # Convert time to numeric, filtering out "unknown" values
-    df = df[df["time"] != "unknown"].copy()
-    df["time_num"] = pd.to_numeric(df["time"], errors="coerce")
-
-    # Join with analyte metadata to get specimen and unit information
-    analyte_metadata = {}
-    for analyte_name, analyte_info in dataset["analytes"].items():
-        specimen_value = analyte_info.get("specimen")
-        # Handle both single specimen and array of specimens
-        if isinstance(specimen_value, list):
-            specimen_value = "+".join(specimen_value)
-
-        # Get limit of detection (could be numeric or "unknown")
-        lod = analyte_info.get("limit_of_detection")
-        lod_numeric = None
-        if lod is not None and lod != "unknown":
-            try:
-                lod_numeric = float(lod)
-            except (ValueError, TypeError):
-                lod_numeric = None
-
-        analyte_metadata[analyte_name] = {
-            "specimen": specimen_value,
-            "unit": analyte_info.get("unit"),
-            "reference_event": analyte_info.get("reference_event"),
-            "biomarker": analyte_info.get("biomarker"),
-            "limit_of_detection": lod_numeric,
-        }
-
-    # Add specimen and metadata to DataFrame
-    df["specimen"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("specimen")
-    )
-    df["unit"] = df["analyte"].map(lambda x: analyte_metadata.get(x, {}).get("unit"))
-    df["reference_event"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("reference_event")
-    )
-    df["biomarker"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("biomarker")
-    )
-    df["limit_of_detection"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("limit_of_detection")
-    )
+    # Drop measurements whose time is "unknown"
+    df = table.to_frame()
+    df = df[df["time_num"].notna()]
 
     # Auto-select biomarker (use first available if not specified)
     if biomarker is None:
@@ -236,7 +182,7 @@ def plot_time_course(
     if show_negative:
         # Substitute negative values: use LOD if available, otherwise 45 for CT or 1 for concentrations
         def substitute_negative(row):
-            if row["value"] == NEGATIVE_VALUE:
+            if not row["is_positive"]:
                 # Use limit of detection if available
                 if row["limit_of_detection"] is not None and not pd.isna(
                     row["limit_of_detection"]
@@ -249,14 +195,13 @@ def plot_time_course(
                     sub_val = 45 if row["is_ct"] else 1
                     negative_substitution_values.add(("default", sub_val, row["is_ct"]))
                     return sub_val
-            return row["value"]
+            return row["value_num"]
 
         df["value_num"] = df.apply(substitute_negative, axis=1)
         df["value_num"] = pd.to_numeric(df["value_num"], errors="coerce")
     else:
         # Exclude negative values
-        df = df[df["value"] != NEGATIVE_VALUE].copy()
-        df["value_num"] = pd.to_numeric(df["value"], errors="coerce")
+        df = df[df["is_positive"]].copy()
 
     # Drop rows with NaN time or value
     df = df.dropna(subset=["time_num", "value_num"])
@@ -513,54 +458,13 @@ def plot_time_courses(
         if missing_keys:
             raise ValueError(f"Dataset missing required keys: {missing_keys}")
 
-        # Extract time series data
-        time_series_data = []
-        for participant_id, participant in enumerate(dataset["participants"], 1):
-            measurements = participant.get("measurements", [])
-            for measurement in measurements:
-                analyte_name = measurement.get("analyte")
-                time_series_data.append(
-                    {
-                        "participant_id": f"{dataset['dataset_id']}_P{participant_id}",
-                        "time": measurement.get("time"),
-                        "value": measurement.get("value"),
-                        "analyte": analyte_name,
-                        "dataset_id": dataset["dataset_id"],
-                    }
-                )
-
-        df_dataset = pd.DataFrame(time_series_data)
-
-        # Add analyte metadata
-        for analyte_name, analyte_info in dataset["analytes"].items():
-            specimen_value = analyte_info.get("specimen")
-            if isinstance(specimen_value, list):
-                specimen_value = "+".join(specimen_value)
-
-            # Get limit of detection (could be numeric or "unknown")
-            lod = analyte_info.get("limit_of_detection")
-            lod_numeric = None
-            if lod is not None and lod != "unknown":
-                try:
-                    lod_numeric = float(lod)
-                except (ValueError, TypeError):
-                    lod_numeric = None
-
-            df_dataset.loc[df_dataset["analyte"] == analyte_name, "specimen"] = (
-                specimen_value
-            )
-            df_dataset.loc[df_dataset["analyte"] == analyte_name, "unit"] = (
-                analyte_info.get("unit")
-            )
-            df_dataset.loc[df_dataset["analyte"] == analyte_name, "reference_event"] = (
-                analyte_info.get("reference_event")
-            )
-            df_dataset.loc[df_dataset["analyte"] == analyte_name, "biomarker"] = (
-                analyte_info.get("biomarker")
-            )
-            df_dataset.loc[
-                df_dataset["analyte"] == analyte_name, "limit_of_detection"
-            ] = lod_numeric
+        # Typed measurements with analyte metadata joined, shared across calls;
+        # participants are labelled by dataset so they stay distinct once combined
+        df_dataset = to_measurement_table(dataset).to_frame()
+        df_dataset["participant_id"] = f"{dataset['dataset_id']}_P" + df_dataset[
+            "participant_id"
+        ].astype(str)
+        df_dataset["dataset_id"] = dataset["dataset_id"]
 
         all_data.append(df_dataset)
 
@@ -590,9 +494,8 @@ def plot_time_courses(
         if df.empty:
             raise ValueError(f"No measurements found for specimen '{specimen}'")
 
-    # Convert time to numeric
-    df = df[df["time"] != "unknown"].copy()
-    df["time_num"] = pd.to_numeric(df["time"], errors="coerce")
+    # Drop measurements whose time is "unknown"
+    df = df[df["time_num"].notna()].copy()
 
     # Determine if each row is CT value or concentration based on unit
     df["is_ct"] = df["unit"].apply(_is_ct_value)
@@ -623,7 +526,7 @@ def plot_time_courses(
     if show_negative:
         # Substitute negative values: use LOD if available, otherwise 45 for CT or 1 for concentrations
         def substitute_negative(row):
-            if row["value"] == NEGATIVE_VALUE:
+            if not row["is_positive"]:
                 # Use limit of detection if available
                 if row["limit_of_detection"] is not None and not pd.isna(
                     row["limit_of_detection"]
@@ -636,13 +539,12 @@ def plot_time_courses(
                     sub_val = 45 if row["is_ct"] else 1
                     negative_substitution_values.add(("default", sub_val, row["is_ct"]))
                     return sub_val
-            return row["value"]
+            return row["value_num"]
 
         df["value_num"] = df.apply(substitute_negative, axis=1)
         df["value_num"] = pd.to_numeric(df["value_num"], errors="coerce")
     else:
-        df = df[df["value"] != NEGATIVE_VALUE].copy()
-        df["value_num"] = pd.to_numeric(df["value"], errors="coerce")
+        df = df[df["is_positive"]].copy()
 
     df = df.dropna(subset=["time_num", "value_num", "specimen"])
 
@@ -896,67 +798,14 @@ def plot_shedding_heatmap(
     if not dataset["participants"]:
         raise ValueError("Dataset has no participants")
 
-    # Extract time series data from raw dataset
-    time_series_data = []
-    for participant_id, participant in enumerate(dataset["participants"], 1):
-        measurements = participant.get("measurements", [])
-        for measurement in measurements:
-            analyte_name = measurement.get("analyte")
-            time_series_data.append(
-                {
-                    "participant_id": participant_id,
-                    "time": measurement.get("time"),
-                    "value": measurement.get("value"),
-                    "analyte": analyte_name,
-                }
-            )
-
-    if not time_series_data:
+    # Typed measurements with analyte metadata joined, shared across calls
+    table = to_measurement_table(dataset)
+    if not len(table):
         raise ValueError("Dataset has no measurements")
 
-    df = pd.DataFrame(time_series_data)
-
-    # Convert time to numeric, filtering out "unknown" values
-    df = df[df["time"] != "unknown"].copy()
-    df["time_num"] = pd.to_numeric(df["time"], errors="coerce")
-
-    # Join with analyte metadata to get specimen and unit information
-    analyte_metadata = {}
-    for analyte_name, analyte_info in dataset["analytes"].items():
-        specimen_val = analyte_info.get("specimen")
-        if isinstance(specimen_val, list):
-            specimen_val = "+".join(specimen_val)
-
-        lod = analyte_info.get("limit_of_detection")
-        lod_numeric = None
-        if lod is not None and lod != "unknown":
-            try:
-                lod_numeric = float(lod)
-            except (ValueError, TypeError):
-                lod_numeric = None
-
-        analyte_metadata[analyte_name] = {
-            "specimen": specimen_val,
-            "unit": analyte_info.get("unit"),
-            "reference_event": analyte_info.get("reference_event"),
-            "biomarker": analyte_info.get("biomarker"),
-            "limit_of_detection": lod_numeric,
-        }
-
-    # Add metadata to DataFrame
-    df["specimen"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("specimen")
-    )
-    df["unit"] = df["analyte"].map(lambda x: analyte_metadata.get(x, {}).get("unit"))
-    df["reference_event"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("reference_event")
-    )
-    df["biomarker"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("biomarker")
-    )
-    df["limit_of_detection"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("limit_of_detection")
-    )
+    # Drop measurements whose time is "unknown"
+    df = table.to_frame()
+    df = df[df["time_num"].notna()]
 
     # Auto-select biomarker (use first available if not specified)
     if biomarker is None:
@@ -1009,20 +858,9 @@ def plot_shedding_heatmap(
     is_ct = df["is_ct"].iloc[0] if not df.empty else False
 
     # Handle negative values - track them separately for distinct coloring
-    df["is_negative"] = df["value"] == NEGATIVE_VALUE
-
-    if show_negative:
-        # For negative values, we'll show them with a distinct color (skyblue)
-        # Set numeric value to NaN for negatives, they'll be overlaid later
-        df["value_num"] = df["value"].apply(
-            lambda x: np.nan if x == NEGATIVE_VALUE else x
-        )
-        df["value_num"] = pd.to_numeric(df["value_num"], errors="coerce")
-    else:
-        df["value_num"] = df["value"].apply(
-            lambda x: np.nan if x == NEGATIVE_VALUE else x
-        )
-        df["value_num"] = pd.to_numeric(df["value_num"], errors="coerce")
+    # Numeric values are already NaN for negatives; with show_negative they are
+    # overlaid later in a distinct color (skyblue)
+    df["is_negative"] = ~df["is_positive"]
 
     # Drop rows with NaN time
     df = df.dropna(subset=["time_num"])
@@ -1346,67 +1184,14 @@ def plot_mean_trajectory(
             "Must be '95ci', 'iqr', 'sd', or 'range'."
         )
 
-    # Extract time series data from raw dataset
-    time_series_data = []
-    for participant_id, participant in enumerate(dataset["participants"], 1):
-        measurements = participant.get("measurements", [])
-        for measurement in measurements:
-            analyte_name = measurement.get("analyte")
-            time_series_data.append(
-                {
-                    "participant_id": participant_id,
-                    "time": measurement.get("time"),
-                    "value": measurement.get("value"),
-                    "analyte": analyte_name,
-                }
-            )
-
-    if not time_series_data:
+    # Typed measurements with analyte metadata joined, shared across calls
+    table = to_measurement_table(dataset)
+    if not len(table):
         raise ValueError("Dataset has no measurements")
 
-    df = pd.DataFrame(time_series_data)
-
-    # Convert time to numeric, filtering out "unknown" values
-    df = df[df["time"] != "unknown"].copy()
-    df["time_num"] = pd.to_numeric(df["time"], errors="coerce")
-
-    # Join with analyte metadata to get specimen and unit information
-    analyte_metadata = {}
-    for analyte_name, analyte_info in dataset["analytes"].items():
-        specimen_value = analyte_info.get("specimen")
-        if isinstance(specimen_value, list):
-            specimen_value = "+".join(specimen_value)
-
-        lod = analyte_info.get("limit_of_detection")
-        lod_numeric = None
-        if lod is not None and lod != "unknown":
-            try:
-                lod_numeric = float(lod)
-            except (ValueError, TypeError):
-                lod_numeric = None
-
-        analyte_metadata[analyte_name] = {
-            "specimen": specimen_value,
-            "unit": analyte_info.get("unit"),
-            "reference_event": analyte_info.get("reference_event"),
-            "biomarker": analyte_info.get("biomarker"),
-            "limit_of_detection": lod_numeric,
-        }
-
-    # Add metadata to DataFrame
-    df["specimen"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("specimen")
-    )
-    df["unit"] = df["analyte"].map(lambda x: analyte_metadata.get(x, {}).get("unit"))
-    df["reference_event"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("reference_event")
-    )
-    df["biomarker"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("biomarker")
-    )
-    df["limit_of_detection"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("limit_of_detection")
-    )
+    # Drop measurements whose time is "unknown"
+    df = table.to_frame()
+    df = df[df["time_num"].notna()]
 
     # Auto-select biomarker (use first available if not specified)
     if biomarker is None:
@@ -1459,8 +1244,7 @@ def plot_mean_trajectory(
     is_ct = df["is_ct"].iloc[0] if not df.empty else False
 
     # Exclude negative values for trajectory calculation
-    df = df[df["value"] != NEGATIVE_VALUE].copy()
-    df["value_num"] = pd.to_numeric(df["value"], errors="coerce")
+    df = df[df["is_positive"]].copy()
 
     # Drop rows with NaN time or value
     df = df.dropna(subset=["time_num", "value_num"])
@@ -1753,67 +1537,14 @@ def plot_value_distribution_by_time(
             f"Invalid plot_type '{plot_type}'. " "Must be 'box' or 'violin'."
         )
 
-    # Extract time series data from raw dataset
-    time_series_data = []
-    for participant_id, participant in enumerate(dataset["participants"], 1):
-        measurements = participant.get("measurements", [])
-        for measurement in measurements:
-            analyte_name = measurement.get("analyte")
-            time_series_data.append(
-                {
-                    "participant_id": participant_id,
-                    "time": measurement.get("time"),
-                    "value": measurement.get("value"),
-                    "analyte": analyte_name,
-                }
-            )
-
-    if not time_series_data:
+    # Typed measurements with analyte metadata joined, shared across calls
+    table = to_measurement_table(dataset)
+    if not len(table):
         raise ValueError("Dataset has no measurements")
 
-    df = pd.DataFrame(time_series_data)
-
-    # Convert time to numeric, filtering out "unknown" values
-    df = df[df["time"] != "unknown"].copy()
-    df["time_num"] = pd.to_numeric(df["time"], errors="coerce")
-
-    # Join with analyte metadata to get specimen and unit information
-    analyte_metadata = {}
-    for analyte_name, analyte_info in dataset["analytes"].items():
-        specimen_value = analyte_info.get("specimen")
-        if isinstance(specimen_value, list):
-            specimen_value = "+".join(specimen_value)
-
-        lod = analyte_info.get("limit_of_detection")
-        lod_numeric = None
-        if lod is not None and lod != "unknown":
-            try:
-                lod_numeric = float(lod)
-            except (ValueError, TypeError):
-                lod_numeric = None
-
-        analyte_metadata[analyte_name] = {
-            "specimen": specimen_value,
-            "unit": analyte_info.get("unit"),
-            "reference_event": analyte_info.get("reference_event"),
-            "biomarker": analyte_info.get("biomarker"),
-            "limit_of_detection": lod_numeric,
-        }
-
-    # Add metadata to DataFrame
-    df["specimen"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("specimen")
-    )
-    df["unit"] = df["analyte"].map(lambda x: analyte_metadata.get(x, {}).get("unit"))
-    df["reference_event"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("reference_event")
-    )
-    df["biomarker"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("biomarker")
-    )
-    df["limit_of_detection"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("limit_of_detection")
-    )
+    # Drop measurements whose time is "unknown"
+    df = table.to_frame()
+    df = df[df["time_num"].notna()]
 
     # Auto-select biomarker (use first available if not specified)
     if biomarker is None:
@@ -1866,8 +1597,7 @@ def plot_value_distribution_by_time(
     is_ct = df["is_ct"].iloc[0] if not df.empty else False
 
     # Exclude negative values for distribution calculation
-    df = df[df["value"] != NEGATIVE_VALUE].copy()
-    df["value_num"] = pd.to_numeric(df["value"], errors="coerce")
+    df = df[df["is_positive"]].copy()
 
     # Drop rows with NaN time or value
     df = df.dropna(subset=["time_num", "value_num"])
@@ -2155,53 +1885,14 @@ def plot_detection_probability(
     if not dataset["participants"]:
         raise ValueError("Dataset has no participants")
 
-    # Extract time series data from raw dataset
-    time_series_data = []
-    for participant_id, participant in enumerate(dataset["participants"], 1):
-        measurements = participant.get("measurements", [])
-        for measurement in measurements:
-            analyte_name = measurement.get("analyte")
-            time_series_data.append(
-                {
-                    "participant_id": participant_id,
-                    "time": measurement.get("time"),
-                    "value": measurement.get("value"),
-                    "analyte": analyte_name,
-                }
-            )
-
-    if not time_series_data:
+    # Typed measurements with analyte metadata joined, shared across calls
+    table = to_measurement_table(dataset)
+    if not len(table):
         raise ValueError("Dataset has no measurements")
 
-    df = pd.DataFrame(time_series_data)
-
-    # Convert time to numeric, filtering out "unknown" values
-    df = df[df["time"] != "unknown"].copy()
-    df["time_num"] = pd.to_numeric(df["time"], errors="coerce")
-
-    # Join with analyte metadata to get specimen and unit information
-    analyte_metadata = {}
-    for analyte_name, analyte_info in dataset["analytes"].items():
-        specimen_value = analyte_info.get("specimen")
-        if isinstance(specimen_value, list):
-            specimen_value = "+".join(specimen_value)
-
-        analyte_metadata[analyte_name] = {
-            "specimen": specimen_value,
-            "reference_event": analyte_info.get("reference_event"),
-            "biomarker": analyte_info.get("biomarker"),
-        }
-
-    # Add metadata to DataFrame
-    df["specimen"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("specimen")
-    )
-    df["reference_event"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("reference_event")
-    )
-    df["biomarker"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("biomarker")
-    )
+    # Drop measurements whose time is "unknown"
+    df = table.to_frame()
+    df = df[df["time_num"].notna()]
 
     # Auto-select biomarker (use first available if not specified)
     if biomarker is None:
@@ -2235,9 +1926,6 @@ def plot_detection_probability(
         if df.empty:
             raise ValueError(f"No measurements found in time range {time_range}")
 
-    # Mark positive vs negative measurements
-    df["is_positive"] = df["value"] != NEGATIVE_VALUE
-
     # Create time bins centered at integers (or multiples of bin_size)
     time_min = df["time_num"].min()
     time_max = df["time_num"].max()
@@ -2464,53 +2152,14 @@ def plot_clearance_curve(
     if not dataset["participants"]:
         raise ValueError("Dataset has no participants")
 
-    # Extract time series data from raw dataset
-    time_series_data = []
-    for participant_id, participant in enumerate(dataset["participants"], 1):
-        measurements = participant.get("measurements", [])
-        for measurement in measurements:
-            analyte_name = measurement.get("analyte")
-            time_series_data.append(
-                {
-                    "participant_id": participant_id,
-                    "time": measurement.get("time"),
-                    "value": measurement.get("value"),
-                    "analyte": analyte_name,
-                }
-            )
-
-    if not time_series_data:
+    # Typed measurements with analyte metadata joined, shared across calls
+    table = to_measurement_table(dataset)
+    if not len(table):
         raise ValueError("Dataset has no measurements")
 
-    df = pd.DataFrame(time_series_data)
-
-    # Convert time to numeric, filtering out "unknown" values
-    df = df[df["time"] != "unknown"].copy()
-    df["time_num"] = pd.to_numeric(df["time"], errors="coerce")
-
-    # Join with analyte metadata to get specimen information
-    analyte_metadata = {}
-    for analyte_name, analyte_info in dataset["analytes"].items():
-        specimen_value = analyte_info.get("specimen")
-        if isinstance(specimen_value, list):
-            specimen_value = "+".join(specimen_value)
-
-        analyte_metadata[analyte_name] = {
-            "specimen": specimen_value,
-            "reference_event": analyte_info.get("reference_event"),
-            "biomarker": analyte_info.get("biomarker"),
-        }
-
-    # Add metadata to DataFrame
-    df["specimen"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("specimen")
-    )
-    df["reference_event"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("reference_event")
-    )
-    df["biomarker"] = df["analyte"].map(
-        lambda x: analyte_metadata.get(x, {}).get("biomarker")
-    )
+    # Drop measurements whose time is "unknown"
+    df = table.to_frame()
+    df = df[df["time_num"].notna()]
 
     # Auto-select biomarker (use first available if not specified)
     if biomarker is None:
@@ -2538,9 +2187,6 @@ def plot_clearance_curve(
     if df.empty:
         raise ValueError("No valid measurements found after filtering")
 
-    # Mark positive vs negative measurements
-    df["is_positive"] = df["value"] != NEGATIVE_VALUE
-
     # Calculate clearance time and censoring status for each participant
     clearance_data = []
     for participant_id, participant_df in df.groupby("participant_id"):
@@ -3252,7 +2898,7 @@ def plot_fit_diagnostic(
 
     if observations.n_subjects <= max_subject_lines:
         for subject in range(observations.n_subjects):
-            mine = observations.subject_index == subject
+            mine = observations.subject_slice(subject)
             # Censored readings are joined at the limit, so a subject's line
             # does not jump over the stretch where it went undetected.
             times = observations.times[mine]
@@ -3575,47 +3221,42 @@ def plot_analyte_observations(
     analyte_spec = analytes[analyte]
     value_type = "ct" if _is_ct_unit(analyte_spec.get("unit")) else "concentration"
 
-    subjects: list[int] = []
-    times: list[float] = []
-    responses: list[float] = []
-    censored: list[bool] = []
-    n_qualitative = 0
-    for index, participant in enumerate(dataset.get("participants") or []):
-        for measurement in participant.get("measurements") or []:
-            if measurement.get("analyte", analyte) != analyte:
-                continue
-            time = measurement.get("time")
-            if not isinstance(time, (int, float)) or isinstance(time, bool):
-                continue
-            value = measurement.get("value")
-            if isinstance(value, (int, float)) and not isinstance(value, bool):
-                if value <= 0:
-                    continue
-                subjects.append(index)
-                times.append(float(time))
-                responses.append(_to_response(float(value), value_type))
-                censored.append(False)
-            elif value == "negative":
-                subjects.append(index)
-                times.append(float(time))
-                responses.append(float("nan"))
-                censored.append(True)
-            else:
-                # "positive" and "inconclusive" carry no value to place on the y
-                # axis. Counted into the legend rather than dropped in silence.
-                n_qualitative += 1
+    table = to_measurement_table(dataset)
+    # Measurements naming no analyte are taken to be of this one.
+    readings = np.flatnonzero(
+        np.isin(table.analyte_code, [table.analytes.index(analyte), -1])
+        & ~np.isnan(table.time)
+    )
+    values = table.value[readings]
+    is_censored = table.censored[readings]
+    quantified = values > 0
+    # "positive" and "inconclusive" carry no value to place on the y axis.
+    # Counted into the legend rather than dropped in silence.
+    n_qualitative = int(np.count_nonzero(np.isnan(values) & ~is_censored))
+    kept = quantified | is_censored
+    readings, values, quantified, is_censored = (
+        readings[kept],
+        values[kept],
+        quantified[kept],
+        is_censored[kept],
+    )
 
-    if not times:
+    if not readings.size:
         raise ValueError(
             f"Analyte {analyte!r} of dataset "
             f"{dataset.get('dataset_id', '<unknown>')!r} has no measurement with "
             "both a numeric time and a usable value, so there is nothing to plot."
         )
 
-    subject_index = np.asarray(subjects)
-    time_values = np.asarray(times, dtype=float)
-    response_values = np.asarray(responses, dtype=float)
-    is_censored = np.asarray(censored, dtype=bool)
+    subject_index = table.participant[readings]
+    time_values = table.time[readings]
+    response_values = np.array(
+        [
+            _to_response(value, value_type) if detected else np.nan
+            for value, detected in zip(values.tolist(), quantified.tolist())
+        ],
+        dtype=float,
+    )
     detected = response_values[~is_censored]
 
     if detected.size:
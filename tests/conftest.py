@@ -6,6 +6,20 @@ import numpy as np
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_dataset_cache(tmp_path_factory, monkeypatch):
+    """
+    Give every test an empty dataset cache of its own.
+
+    Otherwise a test could pass only because an earlier one -- or an earlier
+    run -- left a download behind, and the fake responses some tests serve
+    would land in the cache real loads read.
+    """
+    monkeypatch.setenv(
+        "SHEDDING_HUB_CACHE_DIR", str(tmp_path_factory.mktemp("dataset-cache"))
+    )
+
+
 @pytest.fixture
 def make_synthetic_dataset():
     """
@@ -0,0 +1,203 @@
+import numpy as np
+import pytest
+import yaml
+
+from shedding_hub import measurements
+from shedding_hub.measurements import (
+    MeasurementTable,
+    clear_measurement_table_cache,
+    load_streamed_dataset,
+    to_measurement_table,
+)
+
+
+@pytest.fixture
+def mixed_dataset():
+    """Two participants covering every kind of time and value the schema allows."""
+    return {
+        "dataset_id": "mixed",
+        "analytes": {
+            "stool": {
+                "specimen": "stool",
+                "biomarker": "SARS-CoV-2",
+                "reference_event": "symptom onset",
+                "unit": "gc/mL",
+                "limit_of_detection": 100,
+            },
+            "swab": {
+                "specimen": ["nasopharyngeal_swab", "oropharyngeal_swab"],
+                "biomarker": "SARS-CoV-2",
+                "reference_event": "symptom onset",
+                "unit": "cycle threshold",
+                "limit_of_detection": "unknown",
+            },
+        },
+        "participants": [
+            {
+                "measurements": [
+                    {"analyte": "swab", "time": 1, "value": 25.0},
+                    {"analyte": "stool", "time": "unknown", "value": 1e4},
+                    {"analyte": "stool", "time": 3.5, "value": "negative"},
+                ]
+            },
+            {
+                "measurements": [
+                    {"analyte": "stool", "time": 2, "value": "positive"},
+                ]
+            },
+        ],
+    }
+
+
+def test_columns_are_typed(mixed_dataset):
+    table = to_measurement_table(mixed_dataset)
+
+    assert isinstance(table, MeasurementTable)
+    assert len(table) == 4
+    assert table.analytes == ("stool", "swab")
+    np.testing.assert_array_equal(table.participant, [0, 0, 0, 1])
+    np.testing.assert_array_equal(table.analyte_code, [1, 0, 0, 0])
+    np.testing.assert_array_equal(table.time, [1.0, np.nan, 3.5, 2.0])
+    np.testing.assert_array_equal(table.value, [25.0, 1e4, np.nan, np.nan])
+    np.testing.assert_array_equal(table.censored, [False, False, True, False])
+    assert table.time.dtype == float and not table.time.flags.writeable
+
+
+def test_metadata_is_joined(mixed_dataset):
+    table = to_measurement_table(mixed_dataset)
+
+    assert list(table.metadata("specimen")) == [
+        "nasopharyngeal_swab+oropharyngeal_swab",
+        "stool",
+        "stool",
+        "stool",
+    ]
+    np.testing.assert_array_equal(
+        table.metadata("limit_of_detection").astype(float),
+        [np.nan, 100.0, 100.0, 100.0],
+    )
+    with pytest.raises(ValueError, match="Unknown analyte metadata column"):
+        table.metadata("title")
+
+
+def test_undeclared_analyte_gets_a_code(mixed_dataset):
+    mixed_dataset["participants"][1]["measurements"].append(
+        {"analyte": "urine", "time": 4, "value": 1.0}
+    )
+    table = to_measurement_table(mixed_dataset)
+
+    assert table.analytes == ("stool", "swab", "urine")
+    assert table.analyte[-1] == "urine"
+    assert table.metadata("specimen")[-1] is None
+
+
+def test_memoized_per_dataset_object(mixed_dataset):
+    table = to_measurement_table(mixed_dataset)
+
+    assert to_measurement_table(mixed_dataset) is table
+    # An equal but distinct dataset gets its own table.
+    other = dict(mixed_dataset)
+    assert to_measurement_table(other) is not table
+
+
+def test_replacing_or_adding_participants_rebuilds(mixed_dataset):
+    table = to_measurement_table(mixed_dataset)
+    mixed_dataset["participants"].append(
+        {"measurements": [{"analyte": "swab", "time": 9, "value": "negative"}]}
+    )
+
+    rebuilt = to_measurement_table(mixed_dataset)
+    assert rebuilt is not table
+    assert len(rebuilt) == 5
+
+    mixed_dataset["participants"] = mixed_dataset["participants"][:1]
+    assert len(to_measurement_table(mixed_dataset)) == 3
+
+
+def test_adding_or_removing_measurements_rebuilds(mixed_dataset):
+    table = to_measurement_table(mixed_dataset)
+    measurements = mixed_dataset["participants"][0]["measurements"]
+    measurements.append({"analyte": "stool", "time": 4, "value": 3.0})
+    rebuilt = to_measurement_table(mixed_dataset)
+    assert len(rebuilt) == len(table) + 1
+
+    measurements.pop(0)
+    assert len(to_measurement_table(mixed_dataset)) == len(table)
+    mixed_dataset["participants"][1]["measurements"] = []
+    assert to_measurement_table(mixed_dataset) is not rebuilt
+
+
+def test_analyses_see_an_appended_measurement():
+    import shedding_hub as sh
+
+    data = sh.load_dataset("woelfel2020virological", local="./data")
+    before = sh.calc_dataset_summary(data)["n_measurements"]
+    data["participants"][0]["measurements"].append(
+        {"analyte": "stool", "time": 30, "value": "negative"}
+    )
+    assert sh.calc_dataset_summary(data)["n_measurements"] == before + 1
+
+
+def test_editing_in_place_needs_the_cache_cleared(mixed_dataset):
+    table = to_measurement_table(mixed_dataset)
+    for participant in mixed_dataset["participants"]:
+        for measurement in participant["measurements"]:
+            if measurement["time"] != "unknown":
+                measurement["time"] += 5
+    mixed_dataset["analytes"]["stool"]["limit_of_detection"] = 10
+
+    # Not detected: that would mean walking every measurement on every call.
+    assert to_measurement_table(mixed_dataset) is table
+    clear_measurement_table_cache(mixed_dataset)
+    rebuilt = to_measurement_table(mixed_dataset)
+    assert rebuilt is not table
+    np.testing.assert_array_equal(rebuilt.time, [6.0, np.nan, 8.5, 7.0])
+    assert rebuilt.metadata("limit_of_detection")[1] == 10.0
+
+
+def test_frame_is_a_private_copy(mixed_dataset):
+    table = to_measurement_table(mixed_dataset)
+    frame = table.to_frame()
+    frame["time_num"] = 0.0
+
+    assert table.to_frame()["time_num"].iloc[0] == 1.0
+    assert frame["participant_id"].tolist() == [1, 1, 1, 2]
+    assert frame["is_positive"].tolist() == [True, True, False, True]
+
+
+def test_rejects_non_dict():
+    with pytest.raises(ValueError, match="non-empty dictionary"):
+        to_measurement_table([])
+
+
+def _write(path, dataset):
+    path.write_text(yaml.safe_dump(dataset, sort_keys=False))
+    return path
+
+
+def test_streamed_dataset_has_the_same_table(tmp_path, mixed_dataset, monkeypatch):
+    monkeypatch.setattr(measurements, "_CHUNK_SIZE", 2)
+    path = _write(tmp_path / "mixed.yaml", mixed_dataset)
+    streamed = load_streamed_dataset(path)
+    expected = to_measurement_table(mixed_dataset)
+    table = to_measurement_table(streamed)
+
+    assert streamed["participants"] == [{}, {}]
+    assert table.analytes == expected.analytes
+    for column in ("participant", "analyte_code", "time", "value", "censored"):
+        np.testing.assert_array_equal(getattr(table, column), getattr(expected, column))
+    assert table.analyte_metadata.equals(expected.analyte_metadata)
+
+
+def test_streamed_analytes_may_follow_the_participants(tmp_path, mixed_dataset):
+    reordered = {
+        "participants": mixed_dataset["participants"],
+        "analytes": mixed_dataset["analytes"],
+    }
+    table = to_measurement_table(
+        load_streamed_dataset(_write(tmp_path / "late.yaml", reordered))
+    )
+
+    assert table.analytes == ("stool", "swab")
+    np.testing.assert_array_equal(table.analyte_code, [1, 0, 0, 0])
+    assert table.metadata("unit")[0] == "cycle threshold"
@@ -2,11 +2,25 @@ import matplotlib
 
 matplotlib.use("Agg")
 
+import copy
+from collections.abc import MutableSequence
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 import pytest
-
-from shedding_hub.shedding_catalog import SheddingCatalog, fit_shedding_models
+import yaml
+
+from shedding_hub.shedding_catalog import (
+    SheddingCatalog,
+    estimate_fit_cost,
+    fit_shedding_models,
+    fit_shedding_models_by_gate,
+    load_shedding_catalog,
+    write_binary_catalog,
+)
+from shedding_hub.measurements import load_streamed_dataset
+from shedding_hub.shedding_catalog import _binary_is_current
 from shedding_hub.shedding_fit import SheddingFit
 
 
@@ -249,6 +263,336 @@ def test_empty_table_has_same_columns_as_populated_table(two_study_catalog):
     assert list(empty.columns) == list(populated.columns)
 
 
+def test_telemetry_columns_are_appended_only_on_request(two_study_catalog):
+    plain = two_study_catalog.to_table()
+    assert list(plain.columns) == list(two_study_catalog.table.columns)
+    assert "fit_seconds" not in plain.columns
+
+    table = two_study_catalog.to_table(telemetry=True)
+    assert list(table.columns[: plain.shape[1]]) == list(plain.columns)
+    assert (table["n_evaluations"] > 0).all()
+    assert (table["optimizer_rounds"] >= 1).all()
+    phases = table[["prepare_seconds", "initialize_seconds", "optimize_seconds"]]
+    assert (phases >= 0).all().all()
+    np.testing.assert_allclose(
+        table["fit_seconds"],
+        table.filter(like="_seconds").drop(columns="fit_seconds").sum(axis=1),
+    )
+    assert list(SheddingCatalog().to_table(telemetry=True).columns) == list(
+        table.columns
+    )
+
+
+def test_telemetry_survives_the_catalog_round_trip(two_study_catalog):
+    restored = SheddingCatalog.from_dict(two_study_catalog.to_dict())
+    pd.testing.assert_frame_equal(
+        restored.to_table(telemetry=True), two_study_catalog.to_table(telemetry=True)
+    )
+
+
+def test_per_fit_budget_publishes_the_fits_it_cut_short(make_synthetic_dataset):
+    dataset = make_synthetic_dataset(
+        "exponential", [np.log(0.6), np.log(18.0)], np.diag([0.04, 0.04])
+    )
+    catalog = fit_shedding_models([dataset], models=("exponential",), max_evaluations=3)
+    assert len(catalog.fits) == 1 and catalog.skipped.empty
+    row = catalog.to_table(telemetry=True).iloc[0]
+    assert row["stop_reason"] == "evaluation_budget"
+    assert not row["converged"]
+
+
+def test_parallel_build_matches_a_serial_build(make_synthetic_dataset, ct_dataset):
+    mu = np.array([np.log(0.6), np.log(18.0)])
+    datasets = [
+        make_synthetic_dataset("exponential", mu, np.diag([0.04, 0.04]), seed=1),
+        ct_dataset,
+        make_synthetic_dataset(
+            "exponential", mu, np.diag([0.04, 0.04]), n_subjects=2, seed=2
+        ),
+    ]
+    models = ("exponential", "gamma")
+    serial = fit_shedding_models(datasets, models=models)
+    parallel = fit_shedding_models(datasets, models=models, n_jobs=2)
+    assert yaml.safe_dump(parallel.to_dict(timings=False)) == yaml.safe_dump(
+        serial.to_dict(timings=False)
+    )
+    pd.testing.assert_frame_equal(parallel.skipped, serial.skipped)
+    assert {"ct_units", "too_few_subjects_for_population"} <= set(
+        serial.skipped["reason"]
+    )
+
+
+def test_catalog_build_runs_in_a_given_executor(
+    two_study_catalog, make_synthetic_dataset
+):
+    mu = np.array([np.log(0.6), np.log(18.0)])
+    datasets = [
+        make_synthetic_dataset(
+            "exponential",
+            mu,
+            np.diag([0.04, 0.04]),
+            n_subjects=20,
+            seed=seed,
+            dataset_id=dataset_id,
+        )
+        for seed, dataset_id in ((1, "study_a"), (2, "study_b"))
+    ]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        catalog = fit_shedding_models(
+            datasets, models=("exponential",), executor=executor, n_jobs=2
+        )
+    pd.testing.assert_frame_equal(catalog.table, two_study_catalog.table)
+    assert catalog.build_report.n_workers == 2
+
+
+def test_catalog_jobs_do_not_carry_their_dataset(make_synthetic_dataset):
+    mu = np.array([np.log(0.6), np.log(18.0)])
+    dataset = make_synthetic_dataset("exponential", mu, np.diag([0.04, 0.04]))
+    sent = []
+
+    class _Recording(ThreadPoolExecutor):
+        def submit(self, function, job):
+            sent.append(job)
+            return super().submit(function, job)
+
+    with _Recording(max_workers=1) as executor:
+        fit_shedding_models(
+            [dataset], models=("exponential", "gamma"), executor=executor
+        )
+    assert len(sent) == 2
+    assert not any(item is dataset for job in sent for item in job)
+    assert {job[0] for job in sent} == {dataset["dataset_id"]}
+
+
+def test_estimated_cost_grows_with_subjects_and_parameters(make_synthetic_dataset):
+    mu = np.array([np.log(0.6), np.log(18.0)])
+    small = make_synthetic_dataset(
+        "exponential", mu, np.diag([0.04, 0.04]), n_subjects=5
+    )
+    large = make_synthetic_dataset("exponential", mu, np.diag([0.04, 0.04]))
+    analyte = next(iter(small["analytes"]))
+    assert estimate_fit_cost(small, analyte, "exponential") < estimate_fit_cost(
+        large, analyte, "exponential"
+    )
+    assert estimate_fit_cost(large, analyte, "exponential") < estimate_fit_cost(
+        large, analyte, "gamma"
+    )
+    assert estimate_fit_cost(large, "no_such_analyte", "gamma") == 0.0
+
+
+def test_longest_first_dispatches_the_costliest_job_first(make_synthetic_dataset):
+    mu = np.array([np.log(0.6), np.log(18.0)])
+    datasets = [
+        make_synthetic_dataset(
+            "exponential", mu, np.diag([0.04, 0.04]), n_subjects=n, dataset_id=name
+        )
+        for n, name in ((5, "small"), (40, "large"))
+    ]
+    catalog = fit_shedding_models(datasets, models=("exponential",))
+    report = catalog.build_report
+    assert report.schedule == "longest_first" and report.n_workers == 1
+    assert list(report.jobs["dataset_id"]) == ["small", "large"]
+    assert list(report.jobs["dispatch"]) == [1, 0]
+    assert (report.jobs["seconds"] > 0).all()
+    assert report.lower_bound == pytest.approx(report.jobs["seconds"].sum())
+    assert report.predicted_makespan == pytest.approx(report.lower_bound)
+    assert report.actual_makespan >= report.lower_bound
+
+    in_order = fit_shedding_models(
+        datasets, models=("exponential",), schedule="in_order"
+    )
+    assert list(in_order.build_report.jobs["dispatch"]) == [0, 1]
+    pd.testing.assert_frame_equal(in_order.table, catalog.table)
+
+
+def test_recorded_costs_override_the_estimate(make_synthetic_dataset):
+    mu = np.array([np.log(0.6), np.log(18.0)])
+    datasets = [
+        make_synthetic_dataset(
+            "exponential", mu, np.diag([0.04, 0.04]), n_subjects=n, dataset_id=name
+        )
+        for n, name in ((5, "small"), (40, "large"))
+    ]
+    analyte = next(iter(datasets[0]["analytes"]))
+    catalog = fit_shedding_models(
+        datasets,
+        models=("exponential",),
+        costs={("small", analyte, "exponential"): 10.0},
+    )
+    jobs = catalog.build_report.jobs
+    # The unmeasured job is priced on the measured one's clock.
+    ratio = estimate_fit_cost(datasets[1], analyte, "exponential") / estimate_fit_cost(
+        datasets[0], analyte, "exponential"
+    )
+    np.testing.assert_allclose(jobs["estimated_cost"], [10.0, 10.0 * ratio])
+    assert list(jobs["dispatch"]) == [1, 0]
+
+
+def test_catalog_build_rejects_an_unknown_schedule():
+    with pytest.raises(ValueError, match="Unknown schedule"):
+        fit_shedding_models([], schedule="shortest_first")
+
+
+def test_incremental_rebuild_refits_only_what_changed(make_synthetic_dataset):
+    mu = np.array([np.log(0.6), np.log(18.0)])
+    datasets = [
+        make_synthetic_dataset(
+            "exponential", mu, np.diag([0.04, 0.04]), seed=seed, dataset_id=name
+        )
+        for seed, name in ((1, "study_a"), (2, "study_b"), (3, "study_c"))
+    ]
+    first = SheddingCatalog.from_dict(
+        fit_shedding_models(datasets, models=("exponential",)).to_dict()
+    )
+    assert all(fit.fingerprint for fit in first.fits)
+
+    changed = copy.deepcopy(datasets[1])
+    changed["participants"][0]["measurements"][0]["value"] = "negative"
+    rebuilt = fit_shedding_models(
+        [datasets[0], changed], models=("exponential",), previous=first
+    )
+    report = rebuilt.build_report
+    analyte = first.fits[0].analyte
+    assert report.reused == [("study_a", analyte, "exponential")]
+    assert list(report.jobs["dataset_id"]) == ["study_b"]
+    assert report.removed == [("study_c", analyte, "exponential")]
+    assert rebuilt.fits[0] is first.fits[0]
+    assert rebuilt.fits[1].fingerprint != first.fits[1].fingerprint
+
+    # Any fitter option is part of the fingerprint.
+    stricter = fit_shedding_models(
+        datasets, models=("exponential",), previous=first, min_observations=3
+    )
+    assert stricter.build_report.reused == []
+
+
+def test_incremental_rebuild_refits_a_changed_streamed_dataset(
+    make_synthetic_dataset, tmp_path
+):
+    mu = np.array([np.log(0.6), np.log(18.0)])
+    dataset = make_synthetic_dataset("exponential", mu, np.diag([0.04, 0.04]))
+    path = tmp_path / "study.yaml"
+    path.write_text(yaml.safe_dump(dataset))
+    first = fit_shedding_models([load_streamed_dataset(path)], models=("exponential",))
+
+    unchanged = fit_shedding_models(
+        [load_streamed_dataset(path)], models=("exponential",), previous=first
+    )
+    assert len(unchanged.build_report.reused) == 1
+
+    # Only the table holds a streamed dataset's measurements.
+    dataset["participants"][0]["measurements"][0]["value"] = "negative"
+    path.write_text(yaml.safe_dump(dataset))
+    rebuilt = fit_shedding_models(
+        [load_streamed_dataset(path)], models=("exponential",), previous=first
+    )
+    assert rebuilt.build_report.reused == []
+    assert rebuilt.fits[0].fingerprint != first.fits[0].fingerprint
+
+
+def test_gated_catalogs_match_separate_builds_from_one_solve(
+    make_synthetic_dataset, monkeypatch
+):
+    import shedding_hub.shedding_catalog as catalog_module
+
+    mu = np.array([np.log(0.6), np.log(18.0)])
+    datasets = [
+        make_synthetic_dataset(
+            "exponential", mu, np.diag([0.5, 0.5]), seed=seed, dataset_id=name
+        )
+        for seed, name in ((1, "study_a"), (2, "study_b"))
+    ]
+    gates = (None, 0.0)
+    separate = {
+        gate: fit_shedding_models(
+            datasets, models=("exponential", "gamma"), max_peak_above_observed=gate
+        )
+        for gate in gates
+    }
+
+    solves = []
+    extractions = []
+    solve = catalog_module._solve_observations
+    prepare = catalog_module.prepare_observations_by_model
+
+    def _counted(*args, **kwargs):
+        solves.append(args[1])
+        return solve(*args, **kwargs)
+
+    def _extracted(*args, **kwargs):
+        extractions.append(args[1])
+        return prepare(*args, **kwargs)
+
+    monkeypatch.setattr(catalog_module, "_solve_observations", _counted)
+    monkeypatch.setattr(catalog_module, "prepare_observations_by_model", _extracted)
+    gated = fit_shedding_models_by_gate(
+        datasets, gates=gates, models=("exponential", "gamma")
+    )
+    assert list(gated) == list(gates)
+    assert len(solves) == 4
+    # One extraction per analyte, shared by both models.
+    assert len(extractions) == 2
+    for gate in gates:
+        assert yaml.safe_dump(gated[gate].to_dict(timings=False)) == yaml.safe_dump(
+            separate[gate].to_dict(timings=False)
+        )
+        pd.testing.assert_frame_equal(gated[gate].skipped, separate[gate].skipped)
+    assert not gated[None].table.equals(gated[0.0].table)
+
+
+def test_gated_build_rejects_repeated_gates():
+    with pytest.raises(ValueError, match="distinct"):
+        fit_shedding_models_by_gate([], gates=(2.0, 2.0))
+
+
+def test_build_resumes_from_its_checkpoint_shards(make_synthetic_dataset, tmp_path):
+    mu = np.array([np.log(0.6), np.log(18.0)])
+    datasets = [
+        make_synthetic_dataset(
+            "exponential", mu, np.diag([0.04, 0.04]), seed=seed, dataset_id=name
+        )
+        for seed, name in ((1, "study_a"), (2, "study_b"))
+    ]
+    models = ("exponential", "gamma")
+    full = fit_shedding_models(datasets, models=models, checkpoint_dir=tmp_path)
+    shards = sorted(tmp_path.glob("*.yaml"))
+    assert len(shards) == 4
+    assert sorted(full.build_report.checkpointed) == shards
+    assert not list(tmp_path.glob("*.tmp"))
+
+    # As if the build had died before finishing one job.
+    shards[0].unlink()
+    resumed = fit_shedding_models(
+        datasets, models=models, checkpoint_dir=tmp_path, resume=True
+    )
+    assert len(resumed.build_report.jobs) == 1
+    assert len(resumed.build_report.resumed) == 3
+    assert resumed.build_report.checkpointed == [shards[0]]
+    assert yaml.safe_dump(resumed.to_dict(timings=False)) == yaml.safe_dump(
+        full.to_dict(timings=False)
+    )
+    pd.testing.assert_frame_equal(resumed.skipped, full.skipped)
+    for before, after in zip(full.fits, resumed.fits):
+        pd.testing.assert_frame_equal(after.subject_params, before.subject_params)
+
+
+def test_resume_needs_a_checkpoint_directory():
+    with pytest.raises(ValueError, match="checkpoint_dir"):
+        fit_shedding_models([], resume=True)
+
+
+@pytest.mark.parametrize("n_jobs", [0, -2])
+def test_catalog_build_rejects_a_meaningless_job_count(n_jobs):
+    with pytest.raises(ValueError, match="n_jobs"):
+        fit_shedding_models([], n_jobs=n_jobs)
+
+
+def test_catalog_serializes_without_timings_on_request(two_study_catalog):
+    payload = two_study_catalog.to_dict(timings=False)
+    assert all(fit["phase_seconds"] is None for fit in payload["fits"])
+    assert all(fit["phase_seconds"] for fit in two_study_catalog.to_dict()["fits"])
+
+
 def test_exponential_only_catalog_still_has_b_median_column(two_study_catalog):
     table = two_study_catalog.table
     assert "b_median" in table.columns
@@ -289,6 +633,226 @@ def test_round_trip_serialization(two_study_catalog, tmp_path):
     assert copy.subject_params is None
 
 
+def test_binary_round_trip_builds_fits_only_when_reached(two_study_catalog, tmp_path):
+    path = tmp_path / "catalog.npz"
+    write_binary_catalog(two_study_catalog, path)
+    restored = load_shedding_catalog(path, cache=False)
+    assert repr(restored.fits) == "<2 fits, 0 built>"
+    assert restored.fits[-1].dataset_id == "study_b"
+    assert repr(restored.fits) == "<2 fits, 1 built>"
+    assert yaml.safe_dump(restored.to_dict()) == yaml.safe_dump(
+        SheddingCatalog.from_dict(two_study_catalog.to_dict(timings=False)).to_dict()
+    )
+    pd.testing.assert_frame_equal(restored.skipped, two_study_catalog.skipped)
+
+
+def test_binary_catalog_fits_edit_like_a_list(two_study_catalog, tmp_path):
+    path = tmp_path / "catalog.npz"
+    write_binary_catalog(two_study_catalog, path)
+    restored = load_shedding_catalog(path, cache=False)
+    assert isinstance(restored.fits, MutableSequence)
+    assert len(restored.matching(dataset_id="study_a")) == 1
+    assert repr(restored.fits) == "<2 fits, 1 built>"
+
+    extra = two_study_catalog.fits[0]
+    restored.fits.append(extra)
+    # Only the fit written in is held; the others are still unbuilt.
+    assert repr(restored.fits) == "<3 fits, 2 built>"
+    assert len(restored.matching(dataset_id="study_a")) == 2
+    del restored.fits[0]
+    assert list(restored.table["dataset_id"]) == ["study_b", "study_a"]
+    assert restored.fits[-1] is extra
+    restored.fits[0] = extra
+    assert restored.matching(dataset_id="study_b") == []
+    restored.fits.sort(key=lambda fit: fit.analyte)
+    restored.fits.extend(two_study_catalog.fits)
+    assert len(restored.fits + two_study_catalog.fits) == 6
+    assert len(list(two_study_catalog.fits) + restored.fits) == 6
+
+
+def test_cached_catalog_fits_edit_like_a_list(two_study_catalog, tmp_path):
+    path = tmp_path / "catalog.yaml"
+    path.write_text(yaml.safe_dump(two_study_catalog.to_dict(timings=False)))
+    cached = load_shedding_catalog(path)
+    assert len(cached.matching(model="exponential")) == 2
+    cached.fits.pop()
+    cached.fits.extend(load_shedding_catalog(path).fits)
+    assert [fit.dataset_id for fit in cached.fits] == ["study_a"] * 2 + ["study_b"]
+    assert len(cached.matching(dataset_id="study_a")) == 2
+
+    # Neither the cache nor the next caller sees the edit.
+    assert len(load_shedding_catalog(path).fits) == 2
+
+
+def test_a_list_given_as_fits_is_copied(two_study_catalog):
+    fits = list(two_study_catalog.fits)
+    catalog = SheddingCatalog(fits=fits)
+    fits.pop()
+    assert len(catalog.fits) == 2
+
+
+def test_binary_catalog_is_only_preferred_while_it_matches_its_yaml(
+    two_study_catalog, tmp_path
+):
+    source = tmp_path / "catalog.yaml"
+    source.write_text(yaml.safe_dump(two_study_catalog.to_dict(timings=False)))
+    binary = tmp_path / "catalog.npz"
+    write_binary_catalog(two_study_catalog, binary, source=source)
+    assert _binary_is_current(binary, source)
+    source.write_text(source.read_text() + "\n")
+    assert not _binary_is_current(binary, source)
+
+
+def test_shipped_binary_catalog_matches_the_shipped_yaml():
+    from shedding_hub.shedding_catalog import CATALOG_BINARY_PATH, CATALOG_PATH
+
+    assert _binary_is_current(
+        CATALOG_BINARY_PATH, CATALOG_PATH
+    ), "shedding_catalog.npz is stale; rerun `make catalog`"
+
+
+def test_repeat_loads_share_one_read_but_not_their_fits(two_study_catalog, tmp_path):
+    from shedding_hub.shedding_catalog import _CATALOG_CACHE, clear_catalog_cache
+
+    path = tmp_path / "catalog.yaml"
+    path.write_text(yaml.safe_dump(two_study_catalog.to_dict(timings=False)))
+    clear_catalog_cache()
+    first = load_shedding_catalog(path)
+    second = load_shedding_catalog(path)
+    assert len(_CATALOG_CACHE) == 1
+    assert first.fits[0] is not second.fits[0]
+
+    first.fits[0].population_mean[:] = 99.0
+    first.skipped.loc[len(first.skipped)] = ["x", "x", "gamma", "x", "x"]
+    third = load_shedding_catalog(path)
+    assert not np.any(third.fits[0].population_mean == 99.0)
+    pd.testing.assert_frame_equal(third.skipped, second.skipped)
+
+    clear_catalog_cache()
+    assert not _CATALOG_CACHE
+
+
+def test_a_changed_file_is_read_again(two_study_catalog, tmp_path):
+    path = tmp_path / "catalog.yaml"
+    path.write_text(yaml.safe_dump(two_study_catalog.to_dict(timings=False)))
+    assert len(load_shedding_catalog(path).fits) == 2
+    smaller = SheddingCatalog(fits=two_study_catalog.fits[:1])
+    path.write_text(yaml.safe_dump(smaller.to_dict(timings=False)))
+    assert len(load_shedding_catalog(path).fits) == 1
+
+
+def test_an_uncached_load_leaves_the_cache_alone(two_study_catalog, tmp_path):
+    from shedding_hub.shedding_catalog import _CATALOG_CACHE, clear_catalog_cache
+
+    path = tmp_path / "catalog.yaml"
+    path.write_text(yaml.safe_dump(two_study_catalog.to_dict(timings=False)))
+    clear_catalog_cache()
+    assert len(load_shedding_catalog(path, cache=False).fits) == 2
+    assert not _CATALOG_CACHE
+
+
+def _scan(catalog, keys):
+    return [
+        fit
+        for fit in catalog.fits
+        if all(getattr(fit, key, None) == value for key, value in keys.items())
+    ]
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        {"biomarker": "SARS-CoV-2", "specimen": "stool"},
+        {"model": "gamma", "value_type": "concentration", "reference_event": None},
+        {"dataset_id": "woelfel2020virological", "n_subjects": 9},
+        {"specimen": "stool", "unit": "no such unit"},
+        {"converged": True},
+        {},
+    ],
+)
+def test_indexed_matching_agrees_with_a_scan(shipped_catalog, keys):
+    assert shipped_catalog.matching(**keys) == _scan(shipped_catalog, keys)
+
+
+def test_indexing_a_binary_catalog_builds_only_the_matches(tmp_path):
+    from shedding_hub.shedding_catalog import _KEY_COLUMNS, _key_values
+
+    shipped = load_shedding_catalog(cache=False)
+    path = tmp_path / "catalog.npz"
+    write_binary_catalog(shipped, path)
+    catalog = load_shedding_catalog(path, cache=False)
+    matches = catalog.matching(dataset_id="woelfel2020virological", model="gamma")
+    assert repr(catalog.fits) == f"<{len(catalog.fits)} fits, {len(matches)} built>"
+    for column in _KEY_COLUMNS:
+        assert _key_values(catalog.fits, column) == [
+            getattr(fit, column) for fit in shipped.fits
+        ]
+
+
+def test_table_and_indexes_follow_changes_to_fits(two_study_catalog):
+    catalog = SheddingCatalog(fits=list(two_study_catalog.fits))
+    assert len(catalog.matching(model="exponential")) == 2
+    table = catalog.table
+    table.loc[0, "dataset_id"] = "edited"
+    assert list(catalog.table["dataset_id"]) == ["study_a", "study_b"]
+
+    catalog.fits.pop()
+    assert len(catalog.table) == 1
+    assert catalog.matching(dataset_id="study_b") == []
+    catalog.fits.append(two_study_catalog.fits[1])
+    assert catalog.select(dataset_id="study_b") is two_study_catalog.fits[1]
+    catalog.fits.sort(key=lambda fit: fit.dataset_id, reverse=True)
+    assert list(catalog.table["dataset_id"]) == ["study_b", "study_a"]
+    catalog.fits[0] = two_study_catalog.fits[0]
+    assert len(catalog.matching(dataset_id="study_a")) == 2
+    catalog.fits = []
+    assert catalog.matching(model="exponential") == []
+    assert catalog.table.empty
+
+
+def test_subject_params_come_back_from_the_sidecar(two_study_catalog, tmp_path):
+    from shedding_hub.shedding_catalog import write_subject_params
+
+    path = tmp_path / "catalog.yaml"
+    path.write_text(yaml.safe_dump(two_study_catalog.to_dict(timings=False)))
+    write_subject_params(two_study_catalog, tmp_path / "catalog.subjects.npz")
+
+    assert load_shedding_catalog(path).fits[0].subject_params is None
+    restored = load_shedding_catalog(path, subjects=True)
+    for fit, original in zip(restored.fits, two_study_catalog.fits):
+        pd.testing.assert_frame_equal(fit.subject_params, original.subject_params)
+    uncached = load_shedding_catalog(path, cache=False, subjects=True)
+    pd.testing.assert_frame_equal(
+        uncached.fits[1].subject_params, two_study_catalog.fits[1].subject_params
+    )
+
+
+def test_a_sidecar_table_from_another_fit_is_not_attached(two_study_catalog, tmp_path):
+    from dataclasses import replace
+
+    from shedding_hub.shedding_catalog import write_subject_params
+
+    path = tmp_path / "catalog.yaml"
+    path.write_text(yaml.safe_dump(two_study_catalog.to_dict(timings=False)))
+    stale = SheddingCatalog(
+        fits=[
+            replace(two_study_catalog.fits[0], fingerprint="an earlier build"),
+            two_study_catalog.fits[1],
+        ]
+    )
+    write_subject_params(stale, tmp_path / "catalog.subjects.npz")
+    restored = load_shedding_catalog(path, subjects=True)
+    assert restored.fits[0].subject_params is None
+    assert restored.fits[1].subject_params is not None
+
+
+def test_asking_for_a_missing_sidecar_raises(two_study_catalog, tmp_path):
+    path = tmp_path / "catalog.yaml"
+    path.write_text(yaml.safe_dump(two_study_catalog.to_dict(timings=False)))
+    with pytest.raises(FileNotFoundError, match="sidecar"):
+        load_shedding_catalog(path, subjects=True)
+
+
 def test_round_trip_preserves_a_non_zero_degenerate_count():
     """``n_degenerate_subjects`` must survive serialization on its own merits.
 
@@ -419,7 +983,7 @@ def test_unexpected_error_is_recorded_under_that_reason(
     def _boom(*args, **kwargs):
         raise ValueError("boom")
 
-    monkeypatch.setattr(catalog_module, "fit_shedding_model", _boom)
+    monkeypatch.setattr(catalog_module, "_solve_observations", _boom)
 
     mu = np.array([np.log(0.6), np.log(18.0)])
     dataset = make_synthetic_dataset(
@@ -3,6 +3,7 @@ import matplotlib
 matplotlib.use("Agg")
 
 import math
+import warnings
 
 import numpy as np
 import pytest
@@ -15,12 +16,15 @@ from shedding_hub.shedding_fit import (
     _declared_limit,
     _degenerate_subjects,
     _fraction_observing_a_rise,
-    _record_dropped,
     _resolve_censoring_limit,
     _to_response,
     prepare_observations,
+    prepare_observations_by_model,
     require_estimable_population,
+    solve_shedding_model,
+    summarize_shedding_solution,
 )
+from shedding_hub.measurements import clear_measurement_table_cache
 from shedding_hub.shedding_models import PARAM_NAMES, to_population_coords
 
 
@@ -398,6 +402,40 @@ def test_prepare_observations_records_what_it_dropped():
     assert -2.0 in shifted.times
 
 
+def test_prepare_observations_by_model_matches_one_call_per_model(
+    long_lookback_dataset,
+):
+    """One shared extraction must give each model exactly what it would get alone."""
+    long_lookback_dataset["participants"][0]["patient_id"] = "A-1"
+    with pytest.warns(UserWarning):
+        prepared = prepare_observations_by_model(long_lookback_dataset, "stool")
+    assert list(prepared) == ["exponential", "gamma", "gamma_shifted"]
+    for model, shared in prepared.items():
+        with pytest.warns(UserWarning):
+            alone = prepare_observations(long_lookback_dataset, "stool", model)
+        for name in ("subject_index", "times", "values", "censored", "dropped_times"):
+            np.testing.assert_array_equal(getattr(shared, name), getattr(alone, name))
+        assert shared.subject_ids == alone.subject_ids == ["A-1", 2]
+        assert shared.n_dropped_measurements == alone.n_dropped_measurements
+        assert shared.censoring_limit == alone.censoring_limit
+
+
+def test_prepare_observations_by_model_returns_each_models_refusal(simple_dataset):
+    with pytest.warns(UserWarning):
+        prepared = prepare_observations_by_model(
+            simple_dataset, "stool", models=("exponential", "gamma_shifted")
+        )
+    assert prepared["exponential"].n_subjects == 2
+    # gamma_shifted wants four usable readings per subject; neither has them.
+    assert isinstance(prepared["gamma_shifted"], SheddingDataError)
+    assert prepared["gamma_shifted"].reason == "too_few_subjects"
+
+    # A refusal that holds under every model is raised, not returned.
+    with pytest.raises(SheddingDataError) as excinfo:
+        prepare_observations_by_model(simple_dataset, "urine")
+    assert excinfo.value.reason == "unknown_analyte"
+
+
 def test_prepare_observations_requires_data_after_the_reference_event():
     """A decay from the reference event cannot be estimated from before it.
 
@@ -1142,6 +1180,29 @@ def test_over_extrapolation_gate_threshold_is_adjustable():
     assert tight.n_degenerate_subjects == 2
 
 
+def test_one_solution_summarizes_under_every_gate():
+    from shedding_hub.shedding_fit import FIT_PHASES, fit_shedding_model
+
+    dataset = _late_sampled_dataset(n_normal=4, n_steep=1)
+    solution = solve_shedding_model(dataset, analyte="stool", model="exponential")
+    for gate in (3.0, 1.5):
+        # Every gate here excludes at least the artifact, and says so.
+        with pytest.warns(UserWarning):
+            summarized = summarize_shedding_solution(
+                solution, max_peak_above_observed=gate
+            )
+        with pytest.warns(UserWarning):
+            direct = fit_shedding_model(
+                dataset,
+                analyte="stool",
+                model="exponential",
+                max_peak_above_observed=gate,
+            )
+        assert summarized.to_dict(timings=False) == direct.to_dict(timings=False)
+    assert summarized.n_degenerate_subjects == 2
+    assert tuple(summarized.phase_seconds) == FIT_PHASES
+
+
 def test_over_extrapolation_gate_leaves_a_well_behaved_fit_alone():
     """No subject over-extrapolates here, so nothing may be excluded."""
     dataset = _late_sampled_dataset(n_normal=5, n_steep=0)
@@ -1391,6 +1452,100 @@ def test_rise_fraction_is_nan_when_no_subject_can_be_judged():
     assert math.isnan(_fraction_observing_a_rise(observations))
 
 
+def test_subject_segments_match_the_masks_they_replace():
+    """Every per-subject reduction agrees with the boolean mask it stands in for."""
+    observations = prepare_observations(
+        _rise_dataset(2, 3, n_short=2), "stool", "gamma"
+    )
+    assert observations.subject_offsets[-1] == observations.times.size
+    usable = ~observations.censored
+    for subject in range(observations.n_subjects):
+        mask = observations.subject_index == subject
+        segment = observations.subject_slice(subject)
+        np.testing.assert_array_equal(
+            observations.times[segment], observations.times[mask]
+        )
+        assert observations.subject_min(observations.times)[subject] == (
+            observations.times[mask].min()
+        )
+        assert observations.subject_max(observations.values, where=usable)[subject] == (
+            observations.values[mask & usable].max()
+        )
+        assert observations.subject_count(usable)[subject] == (mask & usable).sum()
+
+
+def test_subject_reductions_leave_an_unselected_subject_nan():
+    observations = Observations(
+        subject_index=np.array([0, 0, 1]),
+        times=np.array([1.0, 2.0, 3.0]),
+        values=np.array([5.0, 4.0, 3.0]),
+        censored=np.array([False, False, True]),
+        censoring_limit=0.0,
+    )
+    np.testing.assert_array_equal(observations.subject_offsets, [0, 2, 3])
+    minimum = observations.subject_min(observations.times, where=~observations.censored)
+    assert minimum[0] == 1.0 and math.isnan(minimum[1])
+    np.testing.assert_array_equal(
+        observations.subject_sum(observations.values, where=~observations.censored),
+        [9.0, 0.0],
+    )
+
+
+def test_observations_refuse_readings_not_grouped_by_subject():
+    with pytest.raises(ValueError, match="subject by subject"):
+        Observations(
+            subject_index=np.array([0, 1, 0]),
+            times=np.array([1.0, 2.0, 3.0]),
+            values=np.array([5.0, 4.0, 3.0]),
+            censored=np.zeros(3, dtype=bool),
+            censoring_limit=0.0,
+        )
+
+
+@pytest.mark.parametrize("model", ["exponential", "gamma", "gamma_shifted"])
+def test_batched_seeds_match_a_per_subject_lstsq(model):
+    """
+    The closed-form seeds agree with the per-subject ``lstsq`` they replaced,
+    including a subject sampled twice at one time (rank-deficient, so lstsq's
+    minimum-norm answer), one with a single detection (pooled seed) and one
+    whose regression slope is upward (defaulted a0).
+    """
+    from shedding_hub.shedding_fit import _DEFAULT_A0, LN10, _initial_theta
+
+    observations = Observations(
+        subject_index=np.array([0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 3]),
+        times=np.array([2.0, 5.0, 9.0, 14.0, 4.0, 4.0, 3.0, 8.0, 1.0, 6.0, 11.0]),
+        values=np.array([6.1, 5.2, 4.0, 0.0, 5.5, 5.1, 4.4, 0.0, 3.0, 3.9, 4.6]),
+        censored=np.array([0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0], dtype=bool),
+        censoring_limit=2.0,
+    )
+    theta = _initial_theta(model, observations)
+
+    def reference(mask):
+        times = observations.times[mask]
+        design = np.column_stack([np.ones_like(times), -times])
+        (c0, a0), *_ = np.linalg.lstsq(
+            design, observations.values[mask] * LN10, rcond=None
+        )
+        return a0, c0
+
+    uncensored = ~observations.censored
+    pooled_a0, pooled_c0 = reference(uncensored)
+    for subject in range(4):
+        mask = uncensored & (observations.subject_index == subject)
+        a0, c0 = reference(mask) if mask.sum() >= 2 else (pooled_a0, pooled_c0)
+        a0 = a0 if a0 > 1e-6 else _DEFAULT_A0
+        names = PARAM_NAMES[model]
+        np.testing.assert_allclose(
+            theta[subject, names.index("a0")], np.log(a0), rtol=1e-12
+        )
+        np.testing.assert_allclose(
+            theta[subject, names.index("c0")], np.log(c0), rtol=1e-12
+        )
+    # Subject 3 rises, so its a0 is the default rather than its negative slope.
+    assert theta[3, PARAM_NAMES[model].index("a0")] == np.log(_DEFAULT_A0)
+
+
 def test_gamma_refused_when_no_subject_can_be_judged():
     """NaN must refuse, not slip through the comparison as neither < nor >=."""
     with pytest.raises(SheddingDataError) as excinfo:
@@ -1493,6 +1648,7 @@ def test_median_first_observed_day_is_the_median_not_the_minimum():
     for participant in dataset["participants"]:
         for measurement in participant["measurements"]:
             measurement["time"] += 5
+    clear_measurement_table_cache(dataset)
     later = fit_shedding_model(dataset, analyte="stool", model="exponential")
     assert later.median_first_observed_day == pytest.approx(26.0)
 
@@ -2353,6 +2509,399 @@ def test_a_fit_that_converges_first_time_is_left_alone(
     assert fit.converged
 
 
+def test_telemetry_counts_the_work_of_every_round(monkeypatch, make_synthetic_dataset):
+    """Evaluations and iterations are summed across restart rounds, not the last."""
+    from shedding_hub.shedding_fit import FIT_PHASES, fit_shedding_model
+
+    dataset = _budget_dataset(make_synthetic_dataset)
+    single = fit_shedding_model(dataset, analyte="stool", model="exponential")
+    assert single.optimizer_rounds == 1
+    assert single.n_evaluations > 0 and single.n_iterations > 0
+    assert tuple(single.phase_seconds) == FIT_PHASES
+    assert all(seconds >= 0 for seconds in single.phase_seconds.values())
+    assert np.isfinite(single.projected_gradient_norm)
+
+    calls = _patch_minimize(monkeypatch, [(False, 1)])
+    restarted = fit_shedding_model(dataset, analyte="stool", model="exponential")
+    assert restarted.optimizer_rounds == len(calls) == 2
+    assert restarted.n_evaluations > single.n_evaluations
+
+
+def test_telemetry_round_trips_and_reads_as_unrecorded_when_absent():
+    fit = _minimal_fit([np.log(0.6), np.log(18.0)], np.diag([0.04, 0.04]))
+    fit.n_evaluations, fit.n_iterations, fit.optimizer_rounds = 310, 42, 2
+    fit.projected_gradient_norm = 3e-6
+    fit.phase_seconds = {"prepare": 0.01, "initialize": 0.001, "optimize": 0.5}
+
+    restored = SheddingFit.from_dict(fit.to_dict())
+    assert (restored.n_evaluations, restored.n_iterations) == (310, 42)
+    assert restored.optimizer_rounds == 2
+    assert restored.projected_gradient_norm == pytest.approx(3e-6)
+    assert restored.phase_seconds == fit.phase_seconds
+
+    payload = fit.to_dict()
+    for key in (
+        "n_evaluations",
+        "n_iterations",
+        "optimizer_rounds",
+        "projected_gradient_norm",
+        "phase_seconds",
+    ):
+        del payload[key]
+    old = SheddingFit.from_dict(payload)
+    assert old.n_evaluations is None and old.phase_seconds is None
+    assert math.isnan(old.projected_gradient_norm)
+
+
+def test_fit_warnings_point_at_the_callers_line(make_synthetic_dataset):
+    from shedding_hub.shedding_fit import fit_shedding_model, solve_shedding_model
+
+    dataset = _budget_dataset(make_synthetic_dataset)
+    dataset["participants"][0]["measurements"].append(
+        {"analyte": "stool", "time": "unknown", "value": 5.0}
+    )
+    for entry in (fit_shedding_model, solve_shedding_model):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            entry(dataset, analyte="stool", model="exponential", max_evaluations=5)
+        messages = {str(warning.message).split(" ")[1] for warning in caught}
+        assert {"measurement(s)", "did"} <= messages
+        assert {warning.filename for warning in caught} == {__file__}
+
+
+def test_evaluation_budget_returns_the_best_iterate_unconverged(
+    make_synthetic_dataset,
+):
+    from shedding_hub.shedding_fit import _negative_log_likelihood, fit_shedding_model
+
+    dataset = _budget_dataset(make_synthetic_dataset)
+    full = fit_shedding_model(dataset, analyte="stool", model="exponential")
+    assert full.stop_reason == "converged"
+
+    with pytest.warns(UserWarning, match="evaluation budget of 5"):
+        cut = fit_shedding_model(
+            dataset, analyte="stool", model="exponential", max_evaluations=5
+        )
+    assert not cut.converged
+    assert cut.stop_reason == "evaluation_budget"
+    # Overrun by at most one iteration's line search.
+    assert 5 <= cut.n_evaluations < 5 + 25
+    # Short of the optimum, but the returned point is the one it reports.
+    assert cut.log_likelihood < full.log_likelihood
+    observations = prepare_observations(dataset, "stool", "exponential")
+    x = np.concatenate(
+        [
+            np.log(cut.subject_params[["a0", "c0"]].to_numpy()).ravel(),
+            [np.log(cut.sigma)],
+        ]
+    )
+    assert -_negative_log_likelihood(x, "exponential", observations) == (
+        pytest.approx(cut.log_likelihood)
+    )
+
+
+@pytest.mark.parametrize("engine", ["joint", "blockwise"])
+def test_time_budget_stops_either_engine(monkeypatch, engine, make_synthetic_dataset):
+    """An already-spent clock stops at the first check, whichever engine runs."""
+    from shedding_hub import shedding_fit as fit_module
+
+    dataset = _budget_dataset(make_synthetic_dataset)
+    real = fit_module.time.perf_counter
+    started = real()
+    # Time runs a minute per reading of the clock once the fit is under way.
+    readings = iter(range(10**6))
+    monkeypatch.setattr(
+        fit_module.time, "perf_counter", lambda: started + 60.0 * next(readings)
+    )
+    with pytest.warns(UserWarning, match="time budget of 90 s"):
+        fit = fit_module.fit_shedding_model(
+            dataset,
+            analyte="stool",
+            model="exponential",
+            engine=engine,
+            time_budget_seconds=90.0,
+        )
+    assert fit.stop_reason == "time_budget"
+    assert not fit.converged
+
+
+def test_exhausted_restart_rounds_are_told_apart_from_a_budget(
+    monkeypatch, make_synthetic_dataset
+):
+    from shedding_hub.shedding_fit import fit_shedding_model
+
+    _patch_minimize(monkeypatch, [(False, 1)] * 50)
+    with pytest.warns(UserWarning, match="did not converge"):
+        fit = fit_shedding_model(
+            _budget_dataset(make_synthetic_dataset),
+            analyte="stool",
+            model="exponential",
+        )
+    assert fit.stop_reason == "round_limit"
+
+
+@pytest.mark.parametrize(
+    "budget", [{"time_budget_seconds": 0.0}, {"max_evaluations": -1}]
+)
+def test_non_positive_budgets_are_refused(budget, make_synthetic_dataset):
+    from shedding_hub.shedding_fit import fit_shedding_model
+
+    with pytest.raises(ValueError, match="must be positive"):
+        fit_shedding_model(
+            _budget_dataset(make_synthetic_dataset),
+            analyte="stool",
+            model="exponential",
+            **budget,
+        )
+
+
+@pytest.mark.parametrize("model", ["exponential", "gamma", "gamma_shifted"])
+def test_analytic_gradient_matches_the_finite_difference_it_replaced(
+    model, make_synthetic_dataset
+):
+    """
+    The optimizer is handed an exact gradient instead of differencing the
+    likelihood itself. Checked against that finite difference on data with
+    both censored and uncensored readings, so both likelihood terms -- and, for
+    gamma_shifted, the onset's own derivative -- are exercised.
+    """
+    from shedding_hub.shedding_fit import (
+        _initial_theta,
+        _negative_log_likelihood,
+        _negative_log_likelihood_and_gradient,
+    )
+
+    if model == "gamma_shifted":
+        dataset = _shifted_truth_dataset(n_subjects=6)
+    else:
+        mu = {
+            "exponential": [np.log(0.6), np.log(18.0)],
+            "gamma": [np.log(0.5), np.log(1.5), np.log(12.0)],
+        }[model]
+        dataset = make_synthetic_dataset(
+            model, mu, np.diag([0.04] * len(mu)), n_subjects=6, seed=3
+        )
+    observations = prepare_observations(dataset, "stool", model)
+    assert observations.censored.any() and not observations.censored.all()
+
+    x = np.concatenate([_initial_theta(model, observations).ravel(), [np.log(0.4)]])
+    if model == "gamma_shifted":
+        # Off the initial onset, which sits exactly one margin below the first
+        # reading, so the check is not made at a special point.
+        x[3:-1:4] -= 0.7
+    value, gradient = _negative_log_likelihood_and_gradient(x, model, observations)
+    assert value == _negative_log_likelihood(x, model, observations)
+    # Central rather than forward, as L-BFGS-B used: at a least-squares start
+    # c0's gradient is zero and a forward difference's truncation error is the
+    # only thing left to compare against.
+    step = 1e-6
+    expected = np.array(
+        [
+            (
+                _negative_log_likelihood(x + step * unit, model, observations)
+                - _negative_log_likelihood(x - step * unit, model, observations)
+            )
+            / (2 * step)
+            for unit in np.eye(x.size)
+        ]
+    )
+    np.testing.assert_allclose(gradient, expected, rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("model", ["exponential", "gamma", "gamma_shifted"])
+def test_compiled_likelihood_matches_the_plain_functions(model, make_synthetic_dataset):
+    """
+    The buffered kernel the optimizer calls reproduces the reference value
+    exactly and the reference gradient to rounding, and reusing its buffers
+    across calls leaves no trace of the previous point.
+    """
+    from shedding_hub.shedding_fit import (
+        _CensoredLikelihood,
+        _initial_theta,
+        _negative_log_likelihood,
+    )
+
+    if model == "gamma_shifted":
+        dataset = _shifted_truth_dataset(n_subjects=6)
+    else:
+        mu = {
+            "exponential": [np.log(0.6), np.log(18.0)],
+            "gamma": [np.log(0.5), np.log(1.5), np.log(12.0)],
+        }[model]
+        dataset = make_synthetic_dataset(
+            model, mu, np.diag([0.04] * len(mu)), n_subjects=6, seed=3
+        )
+    observations = prepare_observations(dataset, "stool", model)
+    likelihood = _CensoredLikelihood(model, observations)
+    rng = np.random.default_rng(0)
+    start = np.concatenate([_initial_theta(model, observations).ravel(), [-0.9]])
+    first = None
+    for _ in range(3):
+        x = start + rng.normal(0.0, 0.05, start.size)
+        value, gradient = likelihood(x)
+        assert value == _negative_log_likelihood(x, model, observations)
+        assert likelihood.value(x) == value
+        # The plain function compiles a fresh kernel, so it is the reference
+        # for a kernel that has already been used at other points.
+        np.testing.assert_allclose(
+            gradient,
+            _CensoredLikelihood(model, observations)(x)[1],
+            rtol=1e-12,
+            atol=1e-12,
+        )
+        if first is None:
+            first = gradient
+    # Returned gradients are the caller's to keep.
+    assert first is not gradient and not np.shares_memory(first, gradient)
+
+    # Outside gamma_shifted's onset bounds the model is undefined, and the
+    # objective is infinite rather than NaN.
+    if model == "gamma_shifted":
+        x = start.copy()
+        x[3] = observations.times.max() + 1.0
+        assert likelihood(x)[0] == np.inf
+        assert likelihood.value(x) == np.inf
+
+
+@pytest.mark.parametrize("model", ["exponential", "gamma", "gamma_shifted"])
+def test_jit_backend_reaches_the_numpy_optimum(model, make_synthetic_dataset):
+    """
+    The compiled likelihood agrees with the NumPy kernel to rounding, so on a
+    well-identified analyte both backends stop at the same optimum.
+    """
+    pytest.importorskip("numba")
+    from shedding_hub.shedding_fit import _compile_likelihood, _initial_theta
+
+    if model == "gamma_shifted":
+        dataset = _shifted_truth_dataset(n_subjects=12)
+    else:
+        mu = {
+            "exponential": [np.log(0.6), np.log(18.0)],
+            "gamma": [np.log(0.5), np.log(1.5), np.log(12.0)],
+        }[model]
+        dataset = make_synthetic_dataset(
+            model, mu, np.diag([0.04] * len(mu)), n_subjects=12, seed=3
+        )
+    observations = prepare_observations(dataset, "stool", model)
+    x = np.concatenate([_initial_theta(model, observations).ravel(), [-0.9]])
+    value, gradient = _compile_likelihood(model, observations, "numpy")(x)
+    jit_value, jit_gradient = _compile_likelihood(model, observations, "jit")(x)
+    assert jit_value == pytest.approx(value, rel=1e-13)
+    np.testing.assert_allclose(jit_gradient, gradient, rtol=1e-10, atol=1e-10)
+
+    # Compared through the blockwise engine, whose stopping rule is a thousand
+    # times tighter than the joint engine's ftol: there, two runs differing
+    # only in rounding may stop anywhere within that tolerance of the optimum.
+    numpy_fit, jit_fit = (
+        fit_shedding_model(
+            dataset, analyte="stool", model=model, engine="blockwise", backend=backend
+        )
+        for backend in ("numpy", "jit")
+    )
+    assert jit_fit.converged
+    assert jit_fit.log_likelihood == pytest.approx(numpy_fit.log_likelihood, abs=1e-6)
+    np.testing.assert_allclose(
+        jit_fit.population_mean, numpy_fit.population_mean, atol=1e-4
+    )
+
+
+def test_jit_log_ndtr_follows_scipy_into_both_tails():
+    """A single censored reading isolates log Phi(z), across all three regimes."""
+    pytest.importorskip("numba")
+    from scipy import special
+
+    from shedding_hub.shedding_fit import _compile_likelihood
+    from shedding_hub.shedding_models import LN10
+
+    x = np.zeros(3)  # a0 = c0 = 1, so the prediction at t = 0 is 1 / ln 10
+    for z in (-45.0, -20.5, -3.0, 0.0, 5.0, 6.5, 30.0):
+        observations = Observations(
+            subject_index=np.zeros(1, dtype=int),
+            times=np.zeros(1),
+            values=np.zeros(1),
+            censored=np.ones(1, dtype=bool),
+            censoring_limit=z + 1.0 / LN10,
+        )
+        value, _ = _compile_likelihood("exponential", observations, "jit")(x)
+        assert value == pytest.approx(-special.log_ndtr(z), rel=1e-12, abs=1e-300)
+
+
+def test_unknown_backend_is_refused_before_fitting(make_synthetic_dataset):
+    dataset = make_synthetic_dataset(
+        "exponential", [np.log(0.6), np.log(18.0)], np.diag([0.04, 0.04])
+    )
+    with pytest.raises(ValueError, match="Unknown backend"):
+        fit_shedding_model(
+            dataset, analyte="stool", model="exponential", backend="cuda"
+        )
+
+
+def test_blockwise_engine_reaches_the_joint_optimum(make_synthetic_dataset):
+    """
+    Subjects share only sigma, so alternating per-subject solves with a sigma
+    update maximizes the same likelihood the joint run does, and on a
+    well-identified model lands on the same optimum.
+    """
+    from shedding_hub.shedding_fit import fit_shedding_model
+
+    dataset = make_synthetic_dataset(
+        "exponential",
+        np.array([np.log(0.6), np.log(18.0)]),
+        np.diag([0.04, 0.04]),
+        n_subjects=20,
+        seed=1,
+    )
+    joint = fit_shedding_model(dataset, analyte="stool", model="exponential")
+    blockwise = fit_shedding_model(
+        dataset, analyte="stool", model="exponential", engine="blockwise"
+    )
+    assert blockwise.converged
+    assert blockwise.log_likelihood == pytest.approx(joint.log_likelihood, abs=1e-4)
+    assert blockwise.sigma == pytest.approx(joint.sigma, abs=1e-4)
+    np.testing.assert_allclose(
+        blockwise.population_mean, joint.population_mean, atol=1e-4
+    )
+
+
+def test_blockwise_engine_is_no_worse_on_a_gamma_ridge(make_synthetic_dataset):
+    """
+    The gamma likelihood is flat along each subject's b0/c0 ridge, so the two
+    engines can stop at different points on it. The blockwise one must not stop
+    lower: its sweeps only ever go downhill in the objective.
+    """
+    from shedding_hub.shedding_fit import fit_shedding_model
+
+    dataset = make_synthetic_dataset(
+        "gamma",
+        np.array([np.log(0.5), np.log(1.5), np.log(12.0)]),
+        np.diag([0.04, 0.04, 0.04]),
+        n_subjects=20,
+        seed=1,
+    )
+    joint = fit_shedding_model(dataset, analyte="stool", model="gamma")
+    blockwise = fit_shedding_model(
+        dataset, analyte="stool", model="gamma", engine="blockwise"
+    )
+    assert blockwise.converged
+    assert blockwise.log_likelihood >= joint.log_likelihood - 1e-3
+    assert blockwise.sigma == pytest.approx(joint.sigma, rel=0.01)
+    np.testing.assert_allclose(
+        blockwise.population_mean, joint.population_mean, atol=0.1
+    )
+
+
+def test_unknown_engine_raises(make_synthetic_dataset):
+    from shedding_hub.shedding_fit import fit_shedding_model
+
+    with pytest.raises(ValueError, match="Unknown engine"):
+        fit_shedding_model(
+            _budget_dataset(make_synthetic_dataset),
+            analyte="stool",
+            model="exponential",
+            engine="newton",
+        )
+
+
 def test_over_extrapolation_gate_reads_the_peak_not_the_onset():
     """
     The gate indexed the last population coordinate as the peak height.
@@ -2396,13 +2945,24 @@ def test_over_extrapolation_gate_reads_the_peak_not_the_onset():
     )[0]
 
 
-def test_dropped_ct_readings_are_recorded_on_the_response_scale():
+def test_dropped_ct_readings_are_recorded_on_the_response_scale(simple_dataset):
     # Dropped points are drawn on the diagnostic plot, so they must share the
     # scale of the points that were kept or they land in the wrong place.
-    times: list[float] = []
-    values: list[float] = []
-    _record_dropped({"value": 28.0}, -1.0, times, values, "ct")
-    assert values == [12.0]
+    simple_dataset["analytes"]["stool"]["unit"] = "cycle threshold"
+    simple_dataset["analytes"]["stool"]["limit_of_quantification"] = 38
+    for participant, cycles in zip(simple_dataset["participants"], (20, 22)):
+        participant["measurements"][:2] = [
+            {"analyte": "stool", "time": 1, "value": float(cycles)},
+            {"analyte": "stool", "time": 2, "value": float(cycles + 4)},
+        ]
+    simple_dataset["participants"][0]["measurements"].append(
+        {"analyte": "stool", "time": -10, "value": 28.0}
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        observations = prepare_observations(simple_dataset, "stool", "exponential")
+    np.testing.assert_array_equal(observations.dropped_times, [-10.0])
+    np.testing.assert_array_equal(observations.dropped_values, [12.0])
 
 
 def test_observations_default_to_concentration():
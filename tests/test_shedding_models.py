@@ -9,6 +9,7 @@ from shedding_hub.shedding_models import (
     half_life_days,
     log10_concentration,
     log10_concentration_pointwise,
+    log10_concentration_pointwise_gradient,
     log10_concentration_rowwise,
     from_population_coords,
     peak_day,
@@ -187,6 +188,78 @@ def test_pointwise_pairs_each_observation_with_its_params():
     np.testing.assert_allclose(got[1], (20.0 - 2.0) / LN10)
 
 
+@pytest.mark.parametrize("model", MODELS)
+def test_pointwise_gradient_matches_a_central_difference_in_theta(model):
+    from shedding_hub.shedding_models import params_to_theta, theta_to_params
+
+    params = {
+        "exponential": np.array([[0.5, 20.0], [0.9, 15.0]]),
+        "gamma": np.array([[0.5, 2.0, 12.0], [0.9, 1.2, 15.0]]),
+        "gamma_shifted": np.array([[0.5, 2.0, 12.0, -2.0], [0.9, 1.2, 15.0, -0.5]]),
+    }[model]
+    times = np.array([1.5, 6.0])
+    theta = params_to_theta(model, params)
+    step = 1e-6
+    expected = np.empty_like(theta)
+    for j in range(theta.shape[1]):
+        up, down = theta.copy(), theta.copy()
+        up[:, j] += step
+        down[:, j] -= step
+        expected[:, j] = (
+            log10_concentration_pointwise(model, theta_to_params(model, up), times)
+            - log10_concentration_pointwise(model, theta_to_params(model, down), times)
+        ) / (2 * step)
+    got = log10_concentration_pointwise_gradient(model, params, times)
+    np.testing.assert_allclose(got, expected, rtol=1e-6)
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_jit_pointwise_matches_numpy_exactly(model):
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(1)
+    k = len(PARAM_NAMES[model])
+    params = np.exp(rng.normal(0.0, 1.0, (40, k)))
+    if model == "gamma_shifted":
+        params[:, 3] = rng.normal(0.0, 3.0, 40)
+    # Negative times leave gamma undefined; both paths must agree on the NaN.
+    times = rng.uniform(-2.0, 20.0, 40)
+    for rows in (params, params[:1]):
+        np.testing.assert_array_equal(
+            log10_concentration_pointwise(model, rows, times, backend="jit"),
+            log10_concentration_pointwise(model, rows, times),
+        )
+
+
+def test_auto_backend_falls_back_to_numpy_without_numba(monkeypatch):
+    from shedding_hub import shedding_models
+
+    monkeypatch.setattr(shedding_models, "_numba_available", lambda: False)
+    assert shedding_models.resolve_backend("auto") == "numpy"
+    with pytest.raises(ImportError, match="needs numba"):
+        shedding_models.resolve_backend("jit")
+
+
+def test_numpy_backend_never_looks_for_numba(monkeypatch):
+    from shedding_hub import shedding_models
+
+    def _looked(name):
+        raise AssertionError("looked for numba")
+
+    monkeypatch.setattr(shedding_models.importlib.util, "find_spec", _looked)
+    shedding_models._numba_available.cache_clear()
+    try:
+        assert shedding_models.resolve_backend("numpy") == "numpy"
+    finally:
+        shedding_models._numba_available.cache_clear()
+
+
+def test_unknown_backend_raises():
+    from shedding_hub.shedding_models import resolve_backend
+
+    with pytest.raises(ValueError, match="Unknown backend"):
+        resolve_backend("cuda")
+
+
 def test_unknown_model_raises():
     with pytest.raises(ValueError, match="Unknown model"):
         validate_model("weibull")
@@ -343,6 +343,97 @@ def test_for_is_deterministic(shipped_catalog):
     assert first == second
 
 
+def test_default_catalog_answers_do_not_share_fits():
+    """The cached default catalog must not leak into what callers can mutate."""
+    from shedding_hub.shedding_select import shedding_for
+
+    first = shedding_for("SARS-CoV-2", "stool")
+    expected = first.fits[0].population_mean.copy()
+    first.fits[0].population_mean[:] = 0.0
+    second = shedding_for("SARS-CoV-2", "stool")
+    assert second.fits[0] is not first.fits[0]
+    assert list(second.fits[0].population_mean) == list(expected)
+
+
+def test_stored_ranking_answers_as_ranking_the_matches_would(shipped_catalog):
+    """Filtering the whole-catalog ranking must equal ranking the matches."""
+    import pandas as pd
+
+    from shedding_hub.shedding_select import _matching_fits, _options, _rank
+
+    pairs = {(fit.biomarker, fit.specimen) for fit in shipped_catalog.fits}
+    queries = [{}, {"biomarker": "SARS-CoV-2"}, {"specimen": "stool"}]
+    queries += [{"biomarker": b, "specimen": s} for b, s in sorted(pairs)]
+    for keys in queries:
+        frame, components = _options(shipped_catalog, keys)
+        matches = _matching_fits(shipped_catalog, keys)
+        expected, expected_components = _rank(matches)
+        pd.testing.assert_frame_equal(frame, expected)
+        assert list(components) == [
+            [matches[index] for index in group] for group in expected_components
+        ]
+
+
+def test_binary_catalog_ranks_without_building_fits(shipped_catalog, tmp_path):
+    import pandas as pd
+
+    from shedding_hub.shedding_catalog import (
+        load_shedding_catalog,
+        write_binary_catalog,
+    )
+    from shedding_hub.shedding_select import shedding_options
+
+    path = tmp_path / "catalog.npz"
+    write_binary_catalog(shipped_catalog, path)
+    catalog = load_shedding_catalog(path, cache=False)
+    options = shedding_options("SARS-CoV-2", "stool", catalog=catalog)
+    assert repr(catalog.fits) == f"<{len(catalog.fits)} fits, 0 built>"
+    pd.testing.assert_frame_equal(
+        options, shedding_options("SARS-CoV-2", "stool", catalog=shipped_catalog)
+    )
+
+
+def test_a_ranking_stored_by_other_rules_is_recomputed(
+    shipped_catalog, tmp_path, monkeypatch
+):
+    from shedding_hub import shedding_select
+    from shedding_hub.shedding_catalog import (
+        load_shedding_catalog,
+        write_binary_catalog,
+    )
+
+    path = tmp_path / "catalog.npz"
+    write_binary_catalog(shipped_catalog, path)
+    monkeypatch.setattr(shedding_select, "_RANKING_VERSION", -1)
+    catalog = load_shedding_catalog(path, cache=False)
+    shedding_select.shedding_options("SARS-CoV-2", "stool", catalog=catalog)
+    assert (
+        repr(catalog.fits) == f"<{len(catalog.fits)} fits, {len(catalog.fits)} built>"
+    )
+
+
+def test_for_many_agrees_with_for_pair_by_pair(shipped_catalog):
+    from shedding_hub.shedding_select import shedding_for, shedding_for_many
+
+    pairs = [("SARS-CoV-2", "stool"), ("SARS-CoV-2", "sputum"), ("SARS-CoV-2", "stool")]
+    sources = shedding_for_many(pairs, catalog=shipped_catalog)
+    assert list(sources) == pairs[:2]
+    for (biomarker, specimen), source in sources.items():
+        single = shedding_for(biomarker, specimen, catalog=shipped_catalog)
+        assert source.selection.picked == single.selection.picked
+        assert source.selection.analytes == single.selection.analytes
+
+
+def test_for_many_reports_every_unmatched_pair(shipped_catalog):
+    from shedding_hub.shedding_select import shedding_for_many
+
+    with pytest.raises(ValueError, match=r"\('x', 'a'\), \('y', 'b'\)"):
+        shedding_for_many(
+            [("SARS-CoV-2", "stool"), ("x", "a"), ("y", "b")],
+            catalog=shipped_catalog,
+        )
+
+
 def test_single_component_matches_the_bare_fit(make_synthetic_dataset):
     """A one-study answer must simulate exactly as the fit would."""
     import numpy as np
@@ -375,5 +466,11 @@ def test_public_exports():
     assert callable(sh.shedding_options)
     assert callable(sh.shedding_for)
     assert callable(sh.classify_reference_event)
-    for name in ("shedding_options", "shedding_for", "classify_reference_event"):
+    assert callable(sh.shedding_for_many)
+    for name in (
+        "shedding_options",
+        "shedding_for",
+        "shedding_for_many",
+        "classify_reference_event",
+    ):
         assert name in sh.__all__
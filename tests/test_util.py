@@ -1,6 +1,8 @@
 import hashlib
 import io
+import os
 import pytest
+import shutil
 from shedding_hub import util
 import yaml
 
@@ -115,6 +117,7 @@ def test_token_goes_only_to_the_api_host(monkeypatch) -> None:
     class _Response:
         status_code = 200
         text = "title: x\n"
+        headers = {}
 
         def raise_for_status(self) -> None:
             pass
@@ -135,3 +138,402 @@ def test_token_goes_only_to_the_api_host(monkeypatch) -> None:
     assert api[0][1] == {"Authorization": "Bearer sekrit"}
     assert all(headers == {} for _, headers, _ in raw), "token leaked to raw host"
     assert all(timeout is not None for _, _, timeout in seen), "a call had no timeout"
+
+
+class _FakeGitHub:
+    """Serves one dataset and one pull request, recording every request."""
+
+    def __init__(self) -> None:
+        self.seen = []
+        self.text = "title: cached\n"
+
+    def get(self, url, headers=None, timeout=None):
+        self.seen.append((url, dict(headers or {})))
+        etag = f'"{hashlib.sha1(self.text.encode()).hexdigest()}"'
+        if "api.github.com" in url:
+            head = {"repo": {"full_name": "o/r"}, "sha": "a" * 40}
+            return _FakeResponse(200, json={"head": head})
+        if (headers or {}).get("If-None-Match") == etag:
+            return _FakeResponse(304)
+        return _FakeResponse(200, text=self.text, headers={"ETag": etag})
+
+
+class _FakeResponse:
+    def __init__(self, status_code, text="", headers=None, json=None) -> None:
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self._json = json
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise util.requests.HTTPError(self.status_code)
+
+    def json(self) -> dict:
+        return self._json
+
+
+@pytest.fixture
+def github(monkeypatch):
+    fake = _FakeGitHub()
+    monkeypatch.setattr(util.requests, "get", fake.get)
+    return fake
+
+
+def test_a_commit_is_served_from_the_cache_without_a_request(github) -> None:
+    first = util.load_dataset("somestudy", ref="a" * 40)
+    assert util.load_dataset("somestudy", ref="a" * 40) == first
+    assert len(github.seen) == 1
+
+
+def test_a_branch_is_revalidated_with_its_etag(github) -> None:
+    assert util.load_dataset("somestudy")["title"] == "cached"
+    assert util.load_dataset("somestudy")["title"] == "cached"
+    assert len(github.seen) == 2
+    assert "If-None-Match" in github.seen[1][1]
+
+    github.text = "title: changed\n"
+    assert util.load_dataset("somestudy")["title"] == "changed"
+
+
+def test_a_pull_request_is_resolved_again_only_after_its_ttl(
+    github, monkeypatch
+) -> None:
+    util.load_dataset("somestudy", pr=1)
+    util.load_dataset("somestudy", pr=1)
+    api = [url for url, _ in github.seen if "api.github.com" in url]
+    assert len(api) == 1
+
+    monkeypatch.setattr(util, "PULL_REQUEST_TTL_SECONDS", -1)
+    util.load_dataset("somestudy", pr=1)
+    api = [url for url, _ in github.seen if "api.github.com" in url]
+    assert len(api) == 2
+
+
+def test_offline_serves_only_from_the_cache(github, monkeypatch) -> None:
+    util.load_dataset("somestudy", pr=1)
+    monkeypatch.setattr(util, "PULL_REQUEST_TTL_SECONDS", -1)
+    requests_made = len(github.seen)
+    assert util.load_dataset("somestudy", pr=1, offline=True)["title"] == "cached"
+    assert len(github.seen) == requests_made
+
+    with pytest.raises(FileNotFoundError, match="otherstudy"):
+        util.load_dataset("otherstudy", offline=True)
+    with pytest.raises(ValueError, match="cache=True"):
+        util.load_dataset("somestudy", offline=True, cache=False)
+
+
+def test_the_cache_evicts_the_least_recently_used(github, monkeypatch) -> None:
+    # Room for two of the nine-byte files below.
+    monkeypatch.setattr(util, "DATASET_CACHE_MAX_BYTES", 18)
+    for ref in ("a" * 40, "b" * 40, "c" * 40):
+        github.text = f"title: {ref[0]}\n"
+        util.load_dataset("somestudy", ref=ref)
+    util.load_dataset("somestudy", ref="b" * 40)
+    github.text = "title: d\n"
+    util.load_dataset("somestudy", ref="d" * 40)
+
+    cache = util._DatasetCache(util._dataset_cache_dir())
+    cached = {key.split("@")[1][0] for key in cache._index["datasets"]}
+    assert cached == {"b", "d"}
+    assert len(list((util._dataset_cache_dir() / "blobs").iterdir())) == 2
+
+
+def test_a_cache_hit_does_not_rewrite_the_index(github) -> None:
+    util.load_dataset("somestudy", ref="a" * 40)
+    index = util._dataset_cache_dir() / "index.json"
+    written = index.stat().st_mtime_ns
+    (blob,) = (util._dataset_cache_dir() / "blobs").iterdir()
+    os.utime(blob, (0, 0))
+
+    util.load_dataset("somestudy", ref="a" * 40, offline=True)
+    assert index.stat().st_mtime_ns == written
+    assert blob.stat().st_mtime > 0
+
+
+def test_an_uncached_load_always_downloads(github) -> None:
+    util.load_dataset("somestudy", ref="a" * 40, cache=False)
+    util.load_dataset("somestudy", ref="a" * 40, cache=False)
+    assert len(github.seen) == 2
+    assert not util._dataset_cache_dir().joinpath("index.json").exists()
+
+
+@pytest.fixture
+def raw_server(tmp_path, monkeypatch):
+    """A local stand-in for raw.githubusercontent.com, serving ``tmp_path``."""
+    import functools
+    import http.server
+    import threading
+    import time
+
+    served = []
+
+    class _Handler(http.server.SimpleHTTPRequestHandler):
+        # HTTP/1.1, so a client may keep its connection open between requests.
+        protocol_version = "HTTP/1.1"
+        delay = 0.0
+
+        def do_GET(self) -> None:
+            served.append(self.client_address)
+            time.sleep(self.delay)
+            super().do_GET()
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), functools.partial(_Handler, directory=str(tmp_path))
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        util, "RAW_CONTENT_URL", f"http://127.0.0.1:{server.server_address[1]}"
+    )
+
+    def publish(*dataset_ids) -> None:
+        for dataset_id in dataset_ids:
+            folder = tmp_path / "o" / "r" / "main" / "data" / dataset_id
+            folder.mkdir(parents=True)
+            (folder / f"{dataset_id}.yaml").write_text(f"title: {dataset_id}\n")
+
+    yield publish, served, _Handler
+    server.shutdown()
+    server.server_close()
+
+
+def test_load_datasets_keeps_input_order_and_collects_errors(raw_server) -> None:
+    publish, _, _ = raw_server
+    publish("a", "b", "c")
+    loaded = util.load_datasets(["c", "missing", "a", "b"], repo="o/r")
+    assert [d["title"] for d in loaded if isinstance(d, dict)] == ["c", "a", "b"]
+    assert isinstance(loaded[1], util.requests.HTTPError)
+
+
+def test_load_datasets_reuses_pooled_connections(raw_server) -> None:
+    publish, served, _ = raw_server
+    ids = [f"study{i}" for i in range(12)]
+    publish(*ids)
+    loaded = util.load_datasets(ids, repo="o/r", max_workers=3, cache=False)
+    assert [d["dataset_id"] for d in loaded] == ids
+    assert len(served) == 12
+    assert len({port for _, port in served}) <= 3
+
+
+def test_load_datasets_fetches_concurrently(raw_server) -> None:
+    import time
+
+    publish, _, handler = raw_server
+    handler.delay = 0.3
+    ids = [f"study{i}" for i in range(8)]
+    publish(*ids)
+    start = time.perf_counter()
+    util.load_datasets(ids, repo="o/r", max_workers=8, cache=False)
+    # Serially this is eight delays; concurrently, about one.
+    assert time.perf_counter() - start < 4 * handler.delay
+
+
+def test_load_datasets_rejects_conflicting_arguments() -> None:
+    with pytest.raises(ValueError, match="At most one"):
+        util.load_datasets(["a"], local="data", pr=1)
+    with pytest.raises(ValueError, match="max_workers"):
+        util.load_datasets(["a"], max_workers=0)
+
+
+def _write_study(root, dataset_id, title):
+    folder = root / dataset_id
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / f"{dataset_id}.yaml").write_text(f"title: {title}\n")
+
+
+@pytest.fixture
+def counted_parses(monkeypatch):
+    parses = []
+    parse = util._parse_yaml
+
+    def _counting(source):
+        parses.append(source)
+        return parse(source)
+
+    monkeypatch.setattr(util, "_parse_yaml", _counting)
+    return parses
+
+
+def test_a_local_dataset_is_parsed_once_until_it_changes(
+    tmp_path, counted_parses
+) -> None:
+    import os
+
+    _write_study(tmp_path, "study", "first")
+    first = util.load_dataset("study", local=str(tmp_path))
+    second = util.load_dataset("study", local=str(tmp_path))
+    assert first == second and first is not second
+    assert len(counted_parses) == 1
+
+    # Touched but unchanged: the snapshot still stands.
+    path = tmp_path / "study" / "study.yaml"
+    os.utime(path, ns=(0, 0))
+    util.load_dataset("study", local=str(tmp_path))
+    assert len(counted_parses) == 1
+
+    _write_study(tmp_path, "study", "second")
+    assert util.load_dataset("study", local=str(tmp_path))["title"] == "second"
+    assert len(counted_parses) == 2
+
+
+def test_a_damaged_snapshot_is_parsed_again(tmp_path, counted_parses) -> None:
+    _write_study(tmp_path, "study", "first")
+    util.load_dataset("study", local=str(tmp_path))
+    for snapshot in (util._dataset_cache_dir() / "compiled").iterdir():
+        snapshot.write_bytes(b"not a snapshot")
+    assert util.load_dataset("study", local=str(tmp_path))["title"] == "first"
+    assert len(counted_parses) == 2
+
+
+def test_a_snapshot_is_plain_json(tmp_path) -> None:
+    import json
+
+    _write_study(tmp_path, "study", "first")
+    util.load_dataset("study", local=str(tmp_path))
+    (snapshot,) = (util._dataset_cache_dir() / "compiled").iterdir()
+    header, body = snapshot.read_text().split("\n", 1)
+    assert json.loads(header)["format"] == util._COMPILED_FORMAT_VERSION
+    assert json.loads(body) == {"title": "first"}
+
+
+def test_a_dataset_json_cannot_hold_is_parsed_every_time(
+    tmp_path, counted_parses
+) -> None:
+    import datetime
+
+    folder = tmp_path / "study"
+    folder.mkdir()
+    (folder / "study.yaml").write_text("title: first\npublished: 2020-04-01\n")
+    for _ in range(2):
+        data = util.load_dataset("study", local=str(tmp_path))
+        assert data["published"] == datetime.date(2020, 4, 1)
+    assert len(counted_parses) == 2
+    assert not (util._dataset_cache_dir() / "compiled").exists()
+
+
+def test_an_uncached_local_load_always_parses(tmp_path, counted_parses) -> None:
+    _write_study(tmp_path, "study", "first")
+    util.load_dataset("study", local=str(tmp_path), cache=False)
+    util.load_dataset("study", local=str(tmp_path), cache=False)
+    assert len(counted_parses) == 2
+    assert not (util._dataset_cache_dir() / "compiled").exists()
+
+
+def test_load_all_datasets_skips_folders_without_a_dataset(tmp_path) -> None:
+    _write_study(tmp_path, "beta", "b")
+    _write_study(tmp_path, "alpha", "a")
+    (tmp_path / "notes").mkdir()
+    (tmp_path / "notes" / "notes-extraction.md").write_text("draft\n")
+    loaded = util.load_all_datasets(str(tmp_path))
+    assert list(loaded) == ["alpha", "beta"]
+    assert loaded["beta"] == {"title": "b", "dataset_id": "beta"}
+
+
+def test_the_c_loader_is_used_where_libyaml_is_installed() -> None:
+    expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+    assert util._SAFE_LOADER is expected
+
+
+def test_stream_dataset_matches_a_full_load(tmp_path) -> None:
+    folder = tmp_path / "study"
+    folder.mkdir()
+    (folder / "study.yaml").write_text(
+        "title: Study\n"
+        "analytes:\n"
+        "  stool: {unit: gc/mL}\n"
+        "participants:\n"
+        "  - attributes: {age: 40}\n"
+        "    measurements:\n"
+        "      - {analyte: stool, time: 1, value: 2.5e3}\n"
+        "      - {analyte: stool, time: unknown, value: negative}\n"
+        "  - measurements: []\n"
+    )
+    stream = util.stream_dataset(folder / "study.yaml")
+    header = next(stream)
+    assert header == {
+        "title": "Study",
+        "analytes": {"stool": {"unit": "gc/mL"}},
+        "dataset_id": "study",
+    }
+    loaded = util.load_dataset("study", local=str(tmp_path), cache=False)
+    assert list(stream) == loaded["participants"]
+
+
+def test_stream_dataset_adds_trailing_keys_to_the_header() -> None:
+    text = "participants:\n  - measurements: []\ntitle: Late\n"
+    stream = util.stream_dataset(io.BytesIO(text.encode()))
+    header = next(stream)
+    assert header == {}
+    assert list(stream) == [{"measurements": []}]
+    assert header == {"title": "Late"}
+
+
+def test_stream_dataset_rejects_participants_that_are_not_a_list() -> None:
+    stream = util.stream_dataset(io.BytesIO(b"participants: 3\n"))
+    next(stream)
+    with pytest.raises(ValueError, match="must be a list"):
+        next(stream)
+
+
+def _write_indexed(root, dataset_id, specimen="stool"):
+    folder = root / dataset_id
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / f"{dataset_id}.yaml").write_text(
+        f"title: Study {dataset_id}\n"
+        "doi: 10.1000/example\n"
+        "analytes:\n"
+        "  a:\n"
+        "    biomarker: SARS-CoV-2\n"
+        f"    specimen: {specimen}\n"
+        "    unit: gc/mL\n"
+        "    reference_event: symptom onset\n"
+        "    limit_of_detection: 100\n"
+        "participants:\n"
+        "  - measurements:\n"
+        "      - {analyte: a, time: 1, value: 5}\n"
+        "      - {analyte: a, time: 2, value: negative}\n"
+    )
+
+
+def test_a_written_index_is_fresh_until_a_dataset_changes(tmp_path) -> None:
+    _write_indexed(tmp_path, "alpha")
+    _write_indexed(tmp_path, "beta")
+    assert util.check_dataset_index(str(tmp_path)) == ["alpha", "beta"]
+    util.write_dataset_index(str(tmp_path))
+    assert util.check_dataset_index(str(tmp_path)) == []
+
+    _write_indexed(tmp_path, "beta", specimen="urine")
+    _write_indexed(tmp_path, "gamma")
+    shutil.rmtree(tmp_path / "alpha")
+    assert util.check_dataset_index(str(tmp_path)) == ["alpha", "beta", "gamma"]
+    # Stale entries are rebuilt from the files rather than trusted.
+    assert util.find_datasets(specimen="urine", local=str(tmp_path)) == ["beta"]
+
+
+def test_an_index_entry_summarizes_its_dataset(tmp_path) -> None:
+    _write_indexed(tmp_path, "alpha", specimen="[nasal_swab, throat_swab]")
+    entry = util.load_dataset_index(str(tmp_path))["alpha"]
+    assert entry["title"] == "Study alpha" and entry["url"] is None
+    assert (entry["n_participants"], entry["n_measurements"]) == (1, 2)
+    assert entry["analytes"]["a"]["limit_of_detection"] == 100
+    assert entry["analytes"]["a"]["n_measurements"] == 2
+    for specimen in ("nasal_swab", "nasal_swab+throat_swab"):
+        assert util.find_datasets(specimen=specimen, local=str(tmp_path)) == ["alpha"]
+    assert util.find_datasets(unit="Ct", local=str(tmp_path)) == []
+
+
+def test_the_shipped_dataset_index_is_fresh() -> None:
+    assert util.check_dataset_index() == [], "Run `make index`."
+
+
+def test_check_dataset_matches_a_quoted_title(tmp_path) -> None:
+    folder = tmp_path / "study"
+    folder.mkdir()
+    (folder / "study.yaml").write_text(
+        "title: 'Shedding: a cohort'\ndoi: 10.1000/x\nparticipants: []\n"
+    )
+    assert util.check_dataset(title="Shedding: a cohort", local=str(tmp_path))